@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Writes farmhouses.amenity_bits for every property: a little-endian bitmask
+of the boolean amenities, bit positions taken from AMENITY_BIT_ORDER in
+src/utils/amenity_bits.py. Listing amenity filters match on this field with
+$bitsAllSet, so properties without it never match an amenity filter.
+
+Each update only applies if the amenities sub-document is unchanged since it
+was read, so running this next to live edits is safe and the script can be
+re-run at any time (for example after seeding with db_fill.py). When any
+property changed, running workers are told to rebuild their amenity facets.
+
+Usage (from backend/): python scripts/backfill_amenity_bits.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database import initialize_database
+from src.database.db_amenity_bits import backfill_amenity_bits
+from src.logics.catalogue_events import notify_catalogue_changed
+
+
+def main():
+    initialize_database()
+    updated_farmhouses = backfill_amenity_bits()
+    if updated_farmhouses:
+        notify_catalogue_changed()
+    print(f"Updated amenity bits of {updated_farmhouses} farmhouses")
+
+
+if __name__ == "__main__":
+    main()
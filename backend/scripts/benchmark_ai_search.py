@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+AI Search Latency Benchmark
+Seeds a throwaway database with db_fill-style active properties, each with an
+ai.file_id, and serves the OpenAI vector store search API from a local stub
+(OPENAI_API_BASE_URL) that answers after a fixed delay. Then runs the same
+queries through:
+
+  remote    - the old path: vector store search, a Mongo lookup of
+              ai.file_id -> property, then the active property fetch
+  hybrid    - search_properties with the stub answering in time: in-process
+              BM25 scores blended with the vector scores
+  cached    - search_properties on repeated queries served from the
+              ai_search_files and ai_search_properties caches
+  fallback  - search_properties with the stub slower than
+              AI_SEARCH_VECTOR_TIMEOUT_SECONDS: BM25 ranking only
+
+The remote, hybrid and fallback passes clear the AI search caches before
+every query. Prints p50/p99 latency per path, then the cache hit ratio and
+latency saved.
+
+Usage (from backend/, needs a running MongoDB):
+    python scripts/benchmark_ai_search.py --properties 5000 --queries 200
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STUB_PORT = 8765
+STUB_TIMEOUT_SECONDS = 0.3
+os.environ["DATABASE_NAME"] = "farmhouse_ai_search_benchmark"
+os.environ["OPENAI_API_BASE_URL"] = f"http://127.0.0.1:{STUB_PORT}"
+os.environ["OPENAI_API_KEY"] = "stub-key"
+os.environ["VECTOR_STORE_ID"] = "vs_stub"
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(BACKEND_DIR))
+
+from db_fill import generate_farmhouse_data
+from src.database import db
+from src.database.db_indexes import ensure_collection_indexes
+from src.logics import ai_logics
+from src.logics.ai_logics import search_vector_store_for_files, fetch_active_property_docs, search_properties, get_ai_search_stats
+from src.logics.text_search_index import build_text_search_index, get_text_search_stats
+from src.logics.ai_search_cache import invalidate_ai_search_files, invalidate_ai_search_property, get_ai_search_cache_stats
+
+if not db.name.endswith("_benchmark"):
+    sys.exit(f"Refusing to run against database {db.name!r}: this benchmark drops collections")
+
+ai_logics.AI_SEARCH_VECTOR_TIMEOUT_SECONDS = STUB_TIMEOUT_SECONDS
+
+QUERIES = [
+    "farmhouse with swimming pool near pune",
+    "pet friendly bnb with wifi",
+    "jacuzzi and bonfire for a weekend party",
+    "quiet farm view stay with kitchen access",
+    "family friendly villa with kids play area and parking",
+    "private chef and barbecue for 12 people",
+    "cheap bnb with air conditioning in mumbai",
+    "lawn garden for small gatherings"
+]
+stub_state = {"delay_seconds": 0.1, "file_ids": []}
+
+
+class VectorStoreStubHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        return
+
+    def send_json(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.send_json({"id": "vs_stub", "object": "vector_store"})
+
+    def do_POST(self):
+        request_body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        time.sleep(stub_state["delay_seconds"])
+        file_ids = random.sample(stub_state["file_ids"], min(request_body.get("max_num_results", 20), len(stub_state["file_ids"])))
+        matches = [{"file_id": file_id, "score": round(random.uniform(0.3, 0.9), 4)} for file_id in file_ids]
+        self.send_json({"data": matches})
+
+
+def start_stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", STUB_PORT), VectorStoreStubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def seed_properties(property_count):
+    db.farmhouses.drop()
+    ensure_collection_indexes(db, "farmhouses")
+
+    properties = []
+    for i in range(property_count):
+        property_data = generate_farmhouse_data()
+        property_data["ai"] = {"file_id": f"file-bench-{i}", "vector_store_id": "vs_stub"}
+        properties.append(property_data)
+
+    db.farmhouses.insert_many(properties, ordered=False)
+    print(f"Seeded {property_count} properties")
+
+
+def run_remote_only(query_string):
+    matches = search_vector_store_for_files(query_string)
+    file_ids = [match["file_id"] for match in matches]
+    records = db.farmhouses.find({"ai.file_id": {"$in": file_ids}}, {"ai.file_id": 1})
+    property_ids = [str(record["_id"]) for record in records]
+    return fetch_active_property_docs(property_ids)
+
+
+def time_queries(search_function, queries, clear_cache=True):
+    timings = []
+    for query_string in queries:
+        if clear_cache:
+            invalidate_ai_search_files()
+            invalidate_ai_search_property()
+        started_at = time.perf_counter()
+        search_function(query_string)
+        timings.append((time.perf_counter() - started_at) * 1000)
+    return timings
+
+
+def report(label, timings):
+    ordered = sorted(timings)
+    p99 = ordered[max(int(len(ordered) * 0.99) - 1, 0)]
+    print(f"{label:<9} p50={statistics.median(timings):8.2f}ms  p99={p99:8.2f}ms  max={max(timings):8.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--properties", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--stub-delay-ms", type=int, default=100)
+    parser.add_argument("--skip-seed", action="store_true")
+    args = parser.parse_args()
+
+    if not args.skip_seed:
+        seed_properties(args.properties)
+
+    stub_state["file_ids"] = [record["ai"]["file_id"] for record in db.farmhouses.find({"status": "active", "ai.file_id": {"$exists": True}}, {"ai.file_id": 1})]
+    server = start_stub_server()
+    build_text_search_index()
+    print(f"Text index: {get_text_search_stats()}")
+
+    queries = [random.choice(QUERIES) for _ in range(args.queries)]
+    stub_state["delay_seconds"] = args.stub_delay_ms / 1000
+    report("remote", time_queries(run_remote_only, queries))
+    report("hybrid", time_queries(search_properties, queries))
+    report("cached", time_queries(search_properties, queries, clear_cache=False))
+    print(f"AI search cache: {get_ai_search_cache_stats()}")
+
+    stub_state["delay_seconds"] = STUB_TIMEOUT_SECONDS * 3
+    report("fallback", time_queries(search_properties, queries))
+    print(f"AI search stats: {get_ai_search_stats()}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Local Embedding Search Benchmark
+Seeds a throwaway database with db_fill-style active properties, syncs the
+memory-mapped embedding snapshot (AI_SEARCH_MODE=local) in a temporary
+directory, then measures:
+
+  recall     - self-retrieval: each sampled property's name and description
+               is used as the query, recall@k counts how often it comes back
+               in the top k
+  exactness  - overlap between the argpartition top k and a full argsort
+  latency    - p50/p99 of query encoding, of single-query ranking, and of
+               ranking a batch of queries with one matrix product
+
+--synthetic-rows adds a ranking-only pass over a random normalised matrix of
+that many rows, to see how the dot product + argpartition scale without
+paying for embedding the catalogue.
+
+Needs numpy and sentence-transformers installed, plus a running MongoDB.
+
+Usage (from backend/):
+    python scripts/benchmark_embedding_search.py --properties 2000 --queries 200 --top-k 20
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ["DATABASE_NAME"] = "farmhouse_embedding_benchmark"
+os.environ["AI_SEARCH_MODE"] = "local"
+os.environ.setdefault("LOCAL_EMBEDDING_DIR", tempfile.mkdtemp(prefix="embedding_benchmark_"))
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(BACKEND_DIR))
+
+import numpy
+from db_fill import generate_farmhouse_data
+from src.database import db
+from src.database.db_indexes import ensure_collection_indexes
+from src.logics.embedding_index import embedding_state, sync_embedding_index, embed_texts, rank_embedding_rows, score_embedding_rows, get_embedding_index_stats
+
+if not db.name.endswith("_benchmark"):
+    sys.exit(f"Refusing to run against database {db.name!r}: this benchmark drops collections")
+
+BATCH_QUERIES = 32
+
+
+def seed_properties(property_count):
+    db.farmhouses.drop()
+    ensure_collection_indexes(db, "farmhouses")
+    db.farmhouses.insert_many([generate_farmhouse_data() for _ in range(property_count)], ordered=False)
+    print(f"Seeded {property_count} properties")
+
+
+def sample_queries(query_count):
+    properties = list(db.farmhouses.find({"status": "active"}, {"name": 1, "description": 1}))
+    sampled = random.sample(properties, min(query_count, len(properties)))
+    queries = [(str(property_data["_id"]), f"{property_data['name']} {property_data['description']}") for property_data in sampled]
+    return queries
+
+
+def percentile(timings, fraction):
+    ordered = sorted(timings)
+    value = ordered[max(int(len(ordered) * fraction) - 1, 0)]
+    return value
+
+
+def report(label, timings):
+    print(f"{label:<18} p50={statistics.median(timings):8.3f}ms  p99={percentile(timings, 0.99):8.3f}ms")
+
+
+def ranked_rows_of(ranked):
+    ranked_rows = [embedding_state["slots"][property_id] for property_id in ranked]
+    return ranked_rows
+
+
+def measure_catalogue(queries, top_k):
+    encode_timings, rank_timings, hits, overlaps = [], [], 0, []
+    for property_id, query_string in queries:
+        started_at = time.perf_counter()
+        query_vectors = embed_texts([query_string])
+        encode_timings.append((time.perf_counter() - started_at) * 1000)
+
+        started_at = time.perf_counter()
+        ranked = rank_embedding_rows(query_vectors, top_k)[0]
+        rank_timings.append((time.perf_counter() - started_at) * 1000)
+
+        hits += property_id in ranked
+        full_order = numpy.argsort(-score_embedding_rows(query_vectors)[:, 0])[:len(ranked)]
+        overlaps.append(len(set(full_order.tolist()) & set(ranked_rows_of(ranked))) / max(len(ranked), 1))
+
+    print(f"recall@{top_k:<11} {hits / len(queries):.3f}")
+    print(f"argpartition exact {statistics.mean(overlaps):.3f}")
+    report("encode query", encode_timings)
+    report("rank (1 query)", rank_timings)
+
+
+def measure_batches(queries, top_k):
+    query_vectors = embed_texts([query_string for _, query_string in queries])
+    batch_timings = []
+    for batch_start in range(0, len(query_vectors), BATCH_QUERIES):
+        batch = query_vectors[batch_start:batch_start + BATCH_QUERIES]
+        started_at = time.perf_counter()
+        rank_embedding_rows(batch, top_k)
+        batch_timings.append((time.perf_counter() - started_at) * 1000 / len(batch))
+    report(f"rank (batch of {BATCH_QUERIES})", batch_timings)
+
+
+def measure_synthetic(row_count, dimension, query_count, top_k):
+    matrix = numpy.random.standard_normal((row_count, dimension)).astype(numpy.float32)
+    matrix /= numpy.linalg.norm(matrix, axis=1, keepdims=True)
+    partition_timings, sort_timings = [], []
+    for _ in range(query_count):
+        query_vector = matrix[random.randrange(row_count)]
+        started_at = time.perf_counter()
+        scores = matrix @ query_vector
+        numpy.argpartition(-scores, top_k - 1)[:top_k]
+        partition_timings.append((time.perf_counter() - started_at) * 1000)
+        started_at = time.perf_counter()
+        numpy.argsort(-(matrix @ query_vector))[:top_k]
+        sort_timings.append((time.perf_counter() - started_at) * 1000)
+    report(f"{row_count} rows argpart", partition_timings)
+    report(f"{row_count} rows argsort", sort_timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--properties", type=int, default=2000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--synthetic-rows", type=int, default=0)
+    parser.add_argument("--skip-seed", action="store_true")
+    args = parser.parse_args()
+
+    if not args.skip_seed:
+        seed_properties(args.properties)
+
+    sync_embedding_index()
+    stats = get_embedding_index_stats()
+    print(f"Embedded {stats['properties']} properties in {stats['last_build_ms']}ms ({stats['dimension']} dims, {os.environ['LOCAL_EMBEDDING_DIR']})")
+
+    queries = sample_queries(args.queries)
+    measure_catalogue(queries, args.top_k)
+    measure_batches(queries, args.top_k)
+    if args.synthetic_rows:
+        measure_synthetic(args.synthetic_rows, stats["dimension"], args.queries, args.top_k)
+
+
+if __name__ == "__main__":
+    main()
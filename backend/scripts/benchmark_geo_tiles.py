@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Geo Tile Index Benchmark
+Seeds a throwaway database with synthetic active properties scattered around
+a few cities, then runs the same "near me" listing page through:
+
+  geonear  - the $geoNear pipeline (exact distance for every match in range)
+  tiles    - the in-memory tile index: cached candidate set per search tile,
+             haversine on the candidates, then one $in fetch for the page
+
+Searches are drawn from a fixed set of areas and repeated, like real
+traffic, so later tile lookups hit the candidate cache. Prints per-path
+latency and checks that both paths return the same first page.
+
+Usage (from backend/, needs a running MongoDB):
+    python scripts/benchmark_geo_tiles.py --properties 50000 --searches 200
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ["DATABASE_NAME"] = "farmhouse_listing_benchmark"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bson import ObjectId
+from src.config import MAX_SEARCH_DISTANCE_KM
+from src.database import db
+from src.database.db_indexes import ensure_collection_indexes
+from src.database.db_listing_operations import find_listing_page
+from src.logics.geo_tile_index import build_geo_tile_index, find_nearby_listing_page, get_geo_tile_stats
+from src.logics.website_logic import build_listing_projection, build_search_point
+
+if not db.name.endswith("_benchmark"):
+    sys.exit(f"Refusing to run against database {db.name!r}: this benchmark drops collections")
+
+CITY_CENTRES = [(18.5204, 73.8567), (19.0760, 72.8777), (12.9716, 77.5946), (28.6139, 77.2090), (17.3850, 78.4867)]
+SEARCH_AREAS = 20
+
+
+def seed_properties(property_count):
+    db.farmhouses.drop()
+    ensure_collection_indexes(db, "farmhouses")
+
+    properties = []
+    for i in range(property_count):
+        centre_latitude, centre_longitude = random.choice(CITY_CENTRES)
+        latitude = centre_latitude + random.uniform(-0.8, 0.8)
+        longitude = centre_longitude + random.uniform(-0.8, 0.8)
+        properties.append({
+            "_id": ObjectId(),
+            "name": f"Bench Property {i}",
+            "description": "Synthetic property for the geo tile benchmark",
+            "type": random.choice(["farmhouse", "bnb"]),
+            "status": "active",
+            "images": [],
+            "location": {"city": "Bench", "coordinates": {"type": "Point", "coordinates": [longitude, latitude]}}
+        })
+        if len(properties) >= 10000:
+            db.farmhouses.insert_many(properties, ordered=False)
+            properties = []
+
+    if properties:
+        db.farmhouses.insert_many(properties, ordered=False)
+    print(f"Seeded {property_count} properties")
+
+
+def build_search_areas():
+    search_areas = []
+    for _ in range(SEARCH_AREAS):
+        centre_latitude, centre_longitude = random.choice(CITY_CENTRES)
+        search_areas.append((round(centre_latitude + random.uniform(-0.3, 0.3), 3), round(centre_longitude + random.uniform(-0.3, 0.3), 3)))
+    return search_areas
+
+
+def run_geonear(search_latitude, search_longitude, projection, max_distance_meters):
+    search_point = build_search_point(search_latitude, search_longitude)
+    return find_listing_page({"status": "active", "type": "farmhouse"}, projection, search_point, max_distance_meters)
+
+
+def run_tiles(search_latitude, search_longitude, projection, max_distance_meters):
+    return find_nearby_listing_page({"status": "active", "type": "farmhouse"}, projection, search_latitude, search_longitude, max_distance_meters)
+
+
+def time_searches(search_function, searches, projection, max_distance_meters):
+    timings = []
+    first_pages = {}
+    for search_latitude, search_longitude in searches:
+        started_at = time.perf_counter()
+        page = search_function(search_latitude, search_longitude, projection, max_distance_meters)
+        timings.append((time.perf_counter() - started_at) * 1000)
+        first_pages[(search_latitude, search_longitude)] = [item["_id"] for item in page["items"]]
+    return timings, first_pages
+
+
+def report(label, timings):
+    ordered = sorted(timings)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{label:<8} median={statistics.median(timings):7.2f}ms  p95={p95:7.2f}ms  max={max(timings):7.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--properties", type=int, default=50000)
+    parser.add_argument("--searches", type=int, default=200)
+    parser.add_argument("--skip-seed", action="store_true")
+    args = parser.parse_args()
+
+    if not args.skip_seed:
+        seed_properties(args.properties)
+
+    indexed_properties = build_geo_tile_index()
+    print(f"Tile index built over {indexed_properties} properties in {get_geo_tile_stats()['last_build_ms']}ms")
+
+    search_areas = build_search_areas()
+    searches = [random.choice(search_areas) for _ in range(args.searches)]
+    projection = build_listing_projection("card")
+    max_distance_meters = MAX_SEARCH_DISTANCE_KM * 1000
+
+    geonear_timings, geonear_pages = time_searches(run_geonear, searches, projection, max_distance_meters)
+    tile_timings, tile_pages = time_searches(run_tiles, searches, projection, max_distance_meters)
+
+    report("geonear", geonear_timings)
+    report("tiles", tile_timings)
+    print(f"candidate cache: {get_geo_tile_stats()['candidate_cache']}")
+
+    mismatches = [area for area in geonear_pages if geonear_pages[area] != tile_pages[area]]
+    if mismatches:
+        print(f"FAIL: first pages differ for {len(mismatches)} search areas")
+        sys.exit(1)
+    print("PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Listing Payload Benchmark
+Seeds a throwaway database with db_fill-style properties (plus image variant
+entries for every image), then compares the default listing shape against the
+slim "card" view on /property-list and /top-properties:
+
+  mongo bytes - BSON size of the documents the listing pipeline returns
+  json bytes  - size of the JSON response body, raw and gzipped
+  time        - uncached get_all_approved_properties / get_fav_properties
+
+The list endpoint is measured on one full page (PAGE_SIZE_MAX items).
+
+Usage (from backend/, needs a running MongoDB):
+    python scripts/benchmark_listing_payload.py --properties 2000 --runs 5
+"""
+
+import argparse
+import gzip
+import json
+import os
+import statistics
+import sys
+import time
+
+os.environ["DATABASE_NAME"] = "farmhouse_listing_benchmark"
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.dirname(BACKEND_DIR))
+
+import bson
+from db_fill import generate_farmhouse_data
+from src.database import db
+from src.database.db_indexes import ensure_collection_indexes
+from src.database.db_common_operations import PAGE_SIZE_MAX
+from src.database.db_listing_operations import find_listing_page
+from src.logics.image_variants import build_image_variant_entry
+from src.logics.listing_cache_logic import invalidate_listing_cache
+from src.logics.website_logic import get_all_approved_properties, get_fav_properties, build_listing_projection, build_listing_view_metadata
+
+if not db.name.endswith("_benchmark"):
+    sys.exit(f"Refusing to run against database {db.name!r}: this benchmark drops collections")
+
+VIEWS = ("full", "card")
+
+
+def seed_catalogue(property_count):
+    db.farmhouses.drop()
+    ensure_collection_indexes(db, "farmhouses")
+
+    properties = []
+    for _ in range(property_count):
+        property_data = generate_farmhouse_data()
+        property_data["image_variants"] = [build_image_variant_entry(image_url) for image_url in property_data["images"]]
+        properties.append(property_data)
+
+    db.farmhouses.insert_many(properties, ordered=False)
+    print(f"Seeded {property_count} properties")
+
+
+def get_property_list_items(view):
+    properties_page = get_all_approved_properties(view=view, page_size=PAGE_SIZE_MAX)
+    return properties_page["items"]
+
+
+def measure_mongo_bytes(view):
+    documents = find_listing_page({"status": "active"}, build_listing_projection(view), page_size=PAGE_SIZE_MAX)["items"]
+    return sum(len(bson.encode(document)) for document in documents)
+
+
+def measure_response_bytes(backend_data, view):
+    response_data = {"success": True, "backend_data": backend_data, **build_listing_view_metadata(view)}
+    body = json.dumps(response_data, default=str).encode()
+    return len(body), len(gzip.compress(body))
+
+
+def time_uncached(function, runs, view):
+    timings = []
+    for _ in range(runs):
+        invalidate_listing_cache()
+        started_at = time.perf_counter()
+        backend_data = function(view=view)
+        timings.append((time.perf_counter() - started_at) * 1000)
+    return backend_data, timings
+
+
+def report(label, view, mongo_bytes, json_bytes, gzip_bytes, timings):
+    print(f"{label:<16} {view:<5} mongo={mongo_bytes / 1024:9.1f} KB  json={json_bytes / 1024:9.1f} KB  "
+          f"gzip={gzip_bytes / 1024:8.1f} KB  median={statistics.median(timings):7.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--properties", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--skip-seed", action="store_true")
+    args = parser.parse_args()
+
+    if not args.skip_seed:
+        seed_catalogue(args.properties)
+
+    endpoints = [("/property-list", get_property_list_items), ("/top-properties", get_fav_properties)]
+    for label, function in endpoints:
+        for view in VIEWS:
+            backend_data, timings = time_uncached(function, args.runs, view)
+            json_bytes, gzip_bytes = measure_response_bytes(backend_data, view)
+            mongo_bytes = measure_mongo_bytes(view) if label == "/property-list" else 0
+            report(label, view, mongo_bytes, json_bytes, gzip_bytes, timings)
+
+
+if __name__ == "__main__":
+    main()
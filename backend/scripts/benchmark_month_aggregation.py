@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Month Aggregation Benchmark
+Seeds a throwaway database with farmhouses and a month of daily analytics
+buckets, then compares the old three-pipeline month stats (leads, views,
+top properties + one find_one per top property) against the fused $facet
+pipeline in db_admin_kpi_operations.
+
+Reports wall time and, from explain executionStats, how many bucket
+documents each approach examined.
+
+Usage (from backend/, needs a running MongoDB):
+    python scripts/benchmark_month_aggregation.py --farmhouses 10000 --runs 5
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+
+os.environ["DATABASE_NAME"] = "farmhouse_listing_benchmark"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bson import ObjectId
+from src.database import db
+from src.database.db_indexes import ensure_collection_indexes
+from src.database.db_admin_kpi_operations import build_month_analytics_pipeline, aggregate_month_analytics
+
+if not db.name.endswith("_benchmark"):
+    sys.exit(f"Refusing to run against database {db.name!r}: this benchmark drops collections")
+
+MONTH = "2025-01"
+DAYS_IN_MONTH = 31
+
+
+def seed_dataset(farmhouse_count):
+    db.farmhouses.drop()
+    db.farmhouse_daily_analytics.drop()
+    ensure_collection_indexes(db, "farmhouse_daily_analytics")
+
+    now = datetime.utcnow()
+    farmhouses = []
+    buckets = []
+    for i in range(farmhouse_count):
+        farmhouse_id = ObjectId()
+        farmhouses.append({"_id": farmhouse_id, "name": f"Bench Farmhouse {i}", "type": random.choice(["farmhouse", "bnb"]), "status": "active"})
+        for day in range(1, DAYS_IN_MONTH + 1):
+            buckets.append({
+                "farmhouse_id": farmhouse_id,
+                "date": f"{MONTH}-{day:02d}",
+                "views": random.randint(0, 40),
+                "leads": random.randint(0, 6),
+                "created_at": now,
+                "updated_at": now
+            })
+        if len(buckets) >= 50000:
+            db.farmhouse_daily_analytics.insert_many(buckets, ordered=False)
+            buckets = []
+
+    if buckets:
+        db.farmhouse_daily_analytics.insert_many(buckets, ordered=False)
+    db.farmhouses.insert_many(farmhouses, ordered=False)
+    print(f"Seeded {farmhouse_count} farmhouses, {farmhouse_count * DAYS_IN_MONTH} daily buckets")
+
+
+def legacy_pipelines(start_date, end_date):
+    date_match = {"$match": {"date": {"$gte": start_date, "$lte": end_date}}}
+    return [
+        [date_match, {"$group": {"_id": None, "total_leads": {"$sum": "$leads"}}}],
+        [date_match, {"$group": {"_id": None, "total_views": {"$sum": "$views"}}}],
+        [
+            date_match,
+            {"$group": {"_id": "$farmhouse_id", "monthly_leads": {"$sum": "$leads"}, "monthly_views": {"$sum": "$views"}}},
+            {"$sort": {"monthly_leads": -1}},
+            {"$limit": 5}
+        ]
+    ]
+
+
+def run_legacy(start_date, end_date):
+    results = [list(db.farmhouse_daily_analytics.aggregate(pipeline)) for pipeline in legacy_pipelines(start_date, end_date)]
+    for top in results[2]:
+        db.farmhouses.find_one({"_id": top["_id"]})
+    return results
+
+
+def run_fused(start_date, end_date):
+    return aggregate_month_analytics(start_date, end_date, top_limit=5)
+
+
+def find_stat(node, key):
+    if isinstance(node, dict):
+        if key in node:
+            return node[key]
+        children = node.values()
+    elif isinstance(node, list):
+        children = node
+    else:
+        return 0
+    return sum(find_stat(child, key) for child in children)
+
+
+def explain_docs_examined(pipeline):
+    explain = db.command("explain", {"aggregate": "farmhouse_daily_analytics", "pipeline": pipeline, "cursor": {}}, verbosity="executionStats")
+    return find_stat(explain, "totalDocsExamined")
+
+
+def time_runs(function, runs, *args):
+    timings = []
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        function(*args)
+        timings.append((time.perf_counter() - started_at) * 1000)
+    return timings
+
+
+def report(label, timings, collection_scans, docs_examined):
+    print(f"{label:<10} scans={collection_scans} docs_examined={docs_examined:<9} "
+          f"median={statistics.median(timings):.1f}ms min={min(timings):.1f}ms max={max(timings):.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--farmhouses", type=int, default=10000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--skip-seed", action="store_true")
+    args = parser.parse_args()
+
+    if not args.skip_seed:
+        seed_dataset(args.farmhouses)
+
+    start_date = f"{MONTH}-01"
+    end_date = f"{MONTH}-{DAYS_IN_MONTH}"
+
+    legacy = legacy_pipelines(start_date, end_date)
+    legacy_docs = sum(explain_docs_examined(pipeline) for pipeline in legacy)
+    fused_docs = explain_docs_examined(build_month_analytics_pipeline(start_date, end_date, 5))
+
+    run_legacy(start_date, end_date)
+    run_fused(start_date, end_date)
+
+    report("before", time_runs(run_legacy, args.runs, start_date, end_date), len(legacy), legacy_docs)
+    report("after", time_runs(run_fused, args.runs, start_date, end_date), 1, fused_docs)
+
+
+if __name__ == "__main__":
+    main()
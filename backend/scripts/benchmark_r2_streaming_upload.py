@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Streaming Upload Memory Benchmark
+Measures peak RSS growth while replacing a 20 MB PDF sent as a base64 data
+URL (the property edit path), comparing:
+
+  legacy     - b64decode the whole payload into a BytesIO, then upload_fileobj
+  streaming  - overwrite_document_in_r2 (chunked decode into multipart parts)
+
+Each mode runs in a fresh subprocess so ru_maxrss is not shared. The
+baseline is taken before the base64 payload is built, because ru_maxrss is a
+lifetime peak: a baseline taken afterwards already contains the build spike
+and hides anything smaller. payload_peak is what holding the request costs
+(Flask has it after parsing the JSON body); peak_rss_growth above it is what
+the upload itself adds.
+
+Runs against moto's local S3 server (pip install "moto[server]") or any
+S3-compatible endpoint given with --endpoint, see r2_local_smoke.py.
+
+Usage (from backend/):
+    python scripts/benchmark_r2_streaming_upload.py --size-mb 20
+"""
+
+import argparse
+import base64
+import os
+import resource
+import subprocess
+import sys
+import time
+from io import BytesIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from r2_local_smoke import BUCKET_NAME, PUBLIC_URL, start_moto_server, configure_environment
+
+FILE_KEY = "farmhouse/benchmark/documents/property_doc.pdf"
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor
+
+
+def build_payload(size_mb):
+    pdf_bytes = b"%PDF-1.4\n" + os.urandom(size_mb * 1024 * 1024)
+    payload = "data:application/pdf;base64," + base64.b64encode(pdf_bytes).decode()
+    del pdf_bytes
+    return payload
+
+
+def run_legacy(s3_client, payload):
+    base64_data = payload.split(',')[1]
+    document_file = BytesIO(base64.b64decode(base64_data))
+    s3_client.upload_fileobj(document_file, BUCKET_NAME, FILE_KEY, ExtraArgs={"ContentType": "application/pdf"})
+
+
+def run_child(mode, size_mb):
+    from src.logics.cloudfare_bucket import overwrite_document_in_r2
+    from src.utils.r2_client import get_r2_client
+
+    s3_client = get_r2_client()
+    s3_client.head_bucket(Bucket=BUCKET_NAME)
+    baseline_mb = peak_rss_mb()
+    payload = build_payload(size_mb)
+    payload_peak_mb = peak_rss_mb() - baseline_mb
+
+    started_at = time.perf_counter()
+    if mode == "legacy":
+        run_legacy(s3_client, payload)
+    else:
+        overwrite_document_in_r2(payload, f"{PUBLIC_URL}/{FILE_KEY}")
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+
+    stored_size = s3_client.head_object(Bucket=BUCKET_NAME, Key=FILE_KEY)["ContentLength"]
+    print(f"{mode:<10} payload_peak={payload_peak_mb:7.1f} MB  peak_rss_growth={peak_rss_mb() - baseline_mb:7.1f} MB  time={elapsed_ms:7.0f} ms  stored={stored_size / (1024 * 1024):.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=20)
+    parser.add_argument("--endpoint", default=None)
+    parser.add_argument("--access-key", default="testing")
+    parser.add_argument("--secret-key", default="testing")
+    parser.add_argument("--child", choices=["legacy", "streaming"], default=None)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.size_mb)
+        return
+
+    server = None
+    endpoint = args.endpoint
+    if not endpoint:
+        server, endpoint = start_moto_server()
+    configure_environment(endpoint, args.access_key, args.secret_key)
+
+    try:
+        from src.utils.r2_client import get_r2_client
+        get_r2_client().create_bucket(Bucket=BUCKET_NAME)
+
+        print(f"Replacing a {args.size_mb} MB PDF from a base64 data URL")
+        for mode in ("legacy", "streaming"):
+            subprocess.run([sys.executable, os.path.abspath(__file__), "--child", mode, "--size-mb", str(args.size_mb)], check=True, env=os.environ.copy())
+    finally:
+        if server:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
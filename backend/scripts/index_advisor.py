@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Index Advisor
+Creates any missing indexes from the registry in src/database/db_indexes.py,
+then runs explain() on every registered hot query shape and flags the ones
+whose winning plan is a collection scan (COLLSCAN).
+
+Exits non-zero when a registered shape still scans the collection, so it can
+gate a deploy after the index registry or a query changes.
+
+Usage (from backend/, against the configured MongoDB):
+    python scripts/index_advisor.py
+    python scripts/index_advisor.py --skip-create
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database import db
+from src.database.db_indexes import ensure_registered_indexes, explain_registered_queries
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--skip-create", action="store_true")
+    args = parser.parse_args()
+
+    if not args.skip_create:
+        created_indexes = ensure_registered_indexes(db)
+        print(f"Created {len(created_indexes)} missing indexes: {', '.join(created_indexes) or '-'}")
+
+    shape_reports = explain_registered_queries(db)
+    for shape_report in shape_reports:
+        verdict = "COLLSCAN" if shape_report["collection_scan"] else "ok"
+        print(f"{verdict:<9} {shape_report['collection']:<26} {shape_report['name']:<30} {' > '.join(shape_report['stages'])}")
+
+    scanning_shapes = [shape_report["name"] for shape_report in shape_reports if shape_report["collection_scan"]]
+    if scanning_shapes:
+        print(f"FAIL: collection scans in {', '.join(scanning_shapes)}")
+        sys.exit(1)
+    print("PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Moves farmhouses.booked_dates (an array of YYYY-MM-DD strings) into the
+booked_days calendar: one int32 bitmap per YYYY-MM month, bit n-1 set when
+day n is booked.
+
+Each document gets its bits OR-ed in with $bit and the old array unset in the
+same update, so dates booked through the new calendar before the migration
+are kept and the script can be re-run; only documents that still carry
+booked_dates are picked up.
+
+Usage (from backend/): python scripts/migrate_booked_dates.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database import initialize_database
+from src.database.db_availability_migration import migrate_booked_dates_to_bitmaps
+
+
+def main():
+    initialize_database()
+    migrated_farmhouses = migrate_booked_dates_to_bitmaps()
+    print(f"Migrated booked dates of {migrated_farmhouses} farmhouses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Moves the embedded farmhouse_analysis.daily_analytics arrays into the
+farmhouse_daily_analytics collection (one document per farmhouse per day).
+
+Each document's days are $inc-upserted into their buckets first, and the
+array is only unset afterwards (and only if it is unchanged), so a crash
+mid-way never loses history. Migrated buckets are flagged legacy_migrated,
+so a re-run after such a crash does not add the same days twice.
+
+Usage (from backend/): python scripts/migrate_daily_analytics.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database import initialize_database
+from src.database.db_analytics_migration import migrate_daily_analytics_to_buckets
+
+
+def main():
+    initialize_database()
+    result = migrate_daily_analytics_to_buckets()
+    print(f"Migrated {result['migrated_days']} daily entries from {result['migrated_farmhouses']} farmhouses ({result['skipped_farmhouses']} changed mid-run, re-run to retry)")
+
+
+if __name__ == "__main__":
+    main()
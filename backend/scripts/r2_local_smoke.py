@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+R2 Client Smoke Test
+Runs the cloudfare_bucket upload / overwrite / delete helpers against a
+local S3-compatible stand-in instead of Cloudflare R2, then hammers uploads
+from many threads to check the shared pooled client, and prints the
+per-operation latency metrics.
+
+The stand-in is either an endpoint you already run (MinIO, LocalStack...)
+passed with --endpoint, or moto's in-process server when moto is installed:
+    pip install "moto[server]"
+
+Usage (from backend/):
+    python scripts/r2_local_smoke.py
+    python scripts/r2_local_smoke.py --endpoint http://127.0.0.1:9000 --access-key minioadmin --secret-key minioadmin
+"""
+
+import argparse
+import base64
+import io
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BUCKET_NAME = "farmhouse-listing-smoke"
+PUBLIC_URL = "http://r2.local"
+
+
+class FakeFileStorage(io.BytesIO):
+    def __init__(self, data, filename, mimetype):
+        super().__init__(data)
+        self.filename = filename
+        self.mimetype = mimetype
+
+
+def start_moto_server():
+    from moto.server import ThreadedMotoServer
+
+    server = ThreadedMotoServer(port=0)
+    server.start()
+    host, port = server.get_host_and_port()
+    return server, f"http://{host}:{port}"
+
+
+def configure_environment(endpoint, access_key, secret_key):
+    os.environ["R2_ENDPOINT_URL"] = endpoint
+    os.environ["R2_ACCESS_KEY_ID"] = access_key
+    os.environ["R2_SECRET_ACCESS_KEY"] = secret_key
+    os.environ["R2_BUCKET_NAME"] = BUCKET_NAME
+    os.environ["R2_PUBLIC_URL"] = PUBLIC_URL
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+
+def run_smoke(threads, uploads):
+    from src.logics import cloudfare_bucket
+    from src.utils.r2_client import get_r2_client, get_r2_metrics
+
+    s3_client = get_r2_client()
+    s3_client.create_bucket(Bucket=BUCKET_NAME)
+
+    farmhouse_id = "smoke0000000000000000000"
+    image_url = cloudfare_bucket.upload_farmhouse_image_to_r2(FakeFileStorage(b"original", "photo.jpg", "image/jpeg"), farmhouse_id, 0)
+    assert image_url == f"{PUBLIC_URL}/farmhouse/{farmhouse_id}/images/image_0.jpg"
+
+    replacement = "data:image/jpeg;base64," + base64.b64encode(b"replaced").decode()
+    cloudfare_bucket.overwrite_image_in_r2(replacement, image_url)
+    stored = s3_client.get_object(Bucket=BUCKET_NAME, Key=f"farmhouse/{farmhouse_id}/images/image_0.jpg")["Body"].read()
+    assert stored == b"replaced"
+
+    def upload(index):
+        file_storage = FakeFileStorage(os.urandom(64 * 1024), f"photo_{index}.jpg", "image/jpeg")
+        return cloudfare_bucket.upload_farmhouse_image_to_r2(file_storage, farmhouse_id, index + 1)
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        uploaded_urls = list(pool.map(upload, range(uploads)))
+    assert len(set(uploaded_urls)) == uploads
+    assert get_r2_client() is s3_client
+
+    cloudfare_bucket.delete_file_from_r2(uploaded_urls[0])
+    cloudfare_bucket.delete_farmhouse_folder_from_r2(farmhouse_id)
+    remaining = s3_client.list_objects_v2(Bucket=BUCKET_NAME, Prefix=f"farmhouse/{farmhouse_id}/")
+    assert remaining.get("KeyCount", 0) == 0
+
+    print(json.dumps(get_r2_metrics(), indent=2))
+    print("PASS")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--endpoint", default=None)
+    parser.add_argument("--access-key", default="testing")
+    parser.add_argument("--secret-key", default="testing")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--uploads", type=int, default=200)
+    args = parser.parse_args()
+
+    server = None
+    endpoint = args.endpoint
+    if not endpoint:
+        server, endpoint = start_moto_server()
+
+    configure_environment(endpoint, args.access_key, args.secret_key)
+    try:
+        run_smoke(args.threads, args.uploads)
+    finally:
+        if server:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Lead Charging Stress Test
+Fires thousands of parallel WhatsApp contacts at one farmhouse in a
+throwaway database and checks that every successful contact was charged
+exactly once and that the final credit balance is exact.
+
+With an initial balance B the farmhouse can take a charge while it is
+active and its balance is still >= MINIMUM_BALANCE_THRESHOLD, and the charge
+that takes it to or below the threshold also deactivates it. So exactly
+max(1, ceil((B - MINIMUM_BALANCE_THRESHOLD) / LEAD_COST_RUPEES)) contacts must
+succeed; the rest must be refused and the farmhouse must end inactive.
+
+Usage (from backend/, needs a running MongoDB):
+    python scripts/stress_lead_charging.py --contacts 5000 --workers 64
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ["DATABASE_NAME"] = "farmhouse_listing_stress"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bson import ObjectId
+from src.config import LEAD_COST_RUPEES, MINIMUM_BALANCE_THRESHOLD
+from src.database import db
+from src.logics.website_logic import deduct_lead_cost_from_farmhouse
+from src.utils.exception_handler import AppException
+
+if not db.name.endswith(("_stress", "_benchmark")):
+    sys.exit(f"Refusing to run against database {db.name!r}: this stress test seeds and charges farmhouses")
+
+
+def seed_farmhouse(initial_balance):
+    farmhouse_id = ObjectId()
+    db.farmhouses.insert_one({
+        "_id": farmhouse_id,
+        "name": "Stress Farmhouse",
+        "type": "farmhouse",
+        "status": "active",
+        "phone_number": "9999999999",
+        "credit_balance": initial_balance
+    })
+    return str(farmhouse_id)
+
+
+def attempt_contact(farmhouse_id):
+    try:
+        deduct_lead_cost_from_farmhouse(farmhouse_id)
+        return True
+    except AppException:
+        return False
+
+
+def expected_charges(initial_balance, contacts):
+    if initial_balance < MINIMUM_BALANCE_THRESHOLD:
+        return 0
+    chargeable = max(1, math.ceil((initial_balance - MINIMUM_BALANCE_THRESHOLD) / LEAD_COST_RUPEES))
+    return min(chargeable, contacts)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--contacts", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument("--initial-balance", type=int, default=None,
+                        help="defaults to enough credit for about 80%% of the contacts")
+    args = parser.parse_args()
+
+    initial_balance = args.initial_balance
+    if initial_balance is None:
+        initial_balance = int(args.contacts * 0.8) * LEAD_COST_RUPEES
+
+    farmhouse_id = seed_farmhouse(initial_balance)
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        outcomes = list(pool.map(attempt_contact, [farmhouse_id] * args.contacts))
+    elapsed = time.perf_counter() - started_at
+
+    charged = sum(outcomes)
+    farmhouse = db.farmhouses.find_one({"_id": ObjectId(farmhouse_id)}, {"credit_balance": 1, "status": 1})
+    final_balance = farmhouse["credit_balance"]
+    expected = expected_charges(initial_balance, args.contacts)
+    expected_balance = initial_balance - expected * LEAD_COST_RUPEES
+
+    print(f"{args.contacts} contacts on {args.workers} threads in {elapsed:.2f}s ({args.contacts / elapsed:.0f}/s)")
+    print(f"charged={charged} expected={expected} final_balance={final_balance} expected_balance={expected_balance} status={farmhouse['status']}")
+
+    db.farmhouses.delete_one({"_id": ObjectId(farmhouse_id)})
+
+    failures = []
+    if charged != expected:
+        failures.append("successful contacts do not match the chargeable count")
+    if final_balance != initial_balance - charged * LEAD_COST_RUPEES:
+        failures.append("balance does not match the number of successful contacts (lost or double charge)")
+    if final_balance != expected_balance:
+        failures.append("final balance is not the expected balance")
+    if expected < args.contacts and farmhouse["status"] != "inactive":
+        failures.append("farmhouse was not deactivated after crossing the threshold")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,9 @@ from src.routes.payment_routes import payment_bp
 from src.routes.owner_routes import owner_bp
 from src.routes.ai_routes import ai_bp
 from src.utils.scheduler import start_scheduler
+from src.logics.analytics_event_buffer import start_analytics_buffer
+from src.logics.recharge_executor import start_recharge_executor
+from src.utils.request_metrics import reset_db_round_trips, attach_db_round_trips_header
 
 
 def create_app():
@@ -19,6 +22,9 @@ def create_app():
          max_age=3600
     )
 
+    app.before_request(reset_db_round_trips)
+    app.after_request(attach_db_round_trips_header)
+
     app.register_blueprint(website_bp)
     app.register_blueprint(admin_bp)
     app.register_blueprint(payment_bp)
@@ -26,5 +32,7 @@ def create_app():
     app.register_blueprint(ai_bp)
     
     start_scheduler()
+    start_analytics_buffer()
+    start_recharge_executor()
 
     return app
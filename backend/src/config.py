@@ -8,11 +8,12 @@ BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 MONGODB_URI = os.getenv('MONGODB_URI', 'mongodb://localhost:27017/')
 DATABASE_NAME = os.getenv('DATABASE_NAME', 'farmhouse_listing')
 
-R2_ENDPOINT_URL = "https://aaddbda4e129b5df368b56070cfeb027.r2.cloudflarestorage.com"
-R2_BUCKET_NAME = "farmhouse-listing-bucket"
-R2_PUBLIC_URL = "https://pub-b4a38eaa745f44c4bac6b1f606453d02.r2.dev"
+R2_ENDPOINT_URL = os.getenv('R2_ENDPOINT_URL', "https://aaddbda4e129b5df368b56070cfeb027.r2.cloudflarestorage.com")
+R2_BUCKET_NAME = os.getenv('R2_BUCKET_NAME', "farmhouse-listing-bucket")
+R2_PUBLIC_URL = os.getenv('R2_PUBLIC_URL', "https://pub-b4a38eaa745f44c4bac6b1f606453d02.r2.dev")
 R2_ACCESS_KEY_ID = os.getenv('R2_ACCESS_KEY_ID')
 R2_SECRET_ACCESS_KEY = os.getenv('R2_SECRET_ACCESS_KEY')
+R2_MAX_UPLOAD_BYTES = 25 * 1024 * 1024
 
 LEAD_COST_RUPEES = 40
 MINIMUM_BALANCE_THRESHOLD = -500
@@ -23,6 +24,11 @@ ADMIN_PASSWORD = os.getenv('ADMIN_PASSWORD')
 JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY')
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 VECTOR_STORE_ID = os.getenv('VECTOR_STORE_ID')
+OPENAI_API_BASE_URL = os.getenv('OPENAI_API_BASE_URL', 'https://api.openai.com/v1')
+
+AI_SEARCH_MODE = os.getenv('AI_SEARCH_MODE', 'remote')
+LOCAL_EMBEDDING_MODEL = os.getenv('LOCAL_EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2')
+LOCAL_EMBEDDING_DIR = os.getenv('LOCAL_EMBEDDING_DIR', os.path.join(BACKEND_DIR, 'data', 'embeddings'))
 
 RAZORPAY_KEY_ID = os.getenv('RAZORPAY_KEY_ID')
 RAZORPAY_KEY_SECRET = os.getenv('RAZORPAY_KEY_SECRET')
@@ -1,13 +1,16 @@
 from pymongo import MongoClient
 from src.config import MONGODB_URI, DATABASE_NAME
-from src.database.db_schema import get_farmhouse_schema, get_payment_schema, get_farmhouse_analysis_schema, get_lead_schema, get_pending_reviews_schema
+from src.database.db_schema import get_farmhouse_schema, get_payment_schema, get_farmhouse_analysis_schema, get_lead_schema, get_pending_reviews_schema, get_farmhouse_daily_analytics_schema
+from src.database.db_indexes import ensure_registered_indexes
 from src.utils.exception_handler import AppException, handle_exceptions
+from src.utils.request_metrics import DbRoundTripListener
 
-client = MongoClient(MONGODB_URI)
+client = MongoClient(MONGODB_URI, event_listeners=[DbRoundTripListener()])
 db = client[DATABASE_NAME]
 farmhouses_collection = db.farmhouses
 payments_collection = db.payments
 farmhouse_analysis_collection = db.farmhouse_analysis
+farmhouse_daily_analytics_collection = db.farmhouse_daily_analytics
 leads_collection = db.leads
 pending_reviews_collection = db.pending_reviews
 
@@ -28,24 +31,6 @@ def setup_farmhouses_collection():
     return creation_success
 
 
-@handle_exceptions
-def setup_geospatial_indexes():
-    existing_indexes = list(farmhouses_collection.list_indexes())
-    
-    geo_index_exists = any(
-        index.get('key', {}).get('location.coordinates') == '2dsphere' 
-        for index in existing_indexes
-    )
-    
-    if not geo_index_exists:
-        index_result = farmhouses_collection.create_index([("location.coordinates", "2dsphere")])
-        creation_success = True
-    else:
-        creation_success = True
-    
-    return creation_success
-
-
 @handle_exceptions
 def setup_payments_collection():
     payment_schema = get_payment_schema()
@@ -80,6 +65,23 @@ def setup_farmhouse_analysis_collection():
     return creation_success
 
 
+@handle_exceptions
+def setup_farmhouse_daily_analytics_collection():
+    daily_analytics_schema = get_farmhouse_daily_analytics_schema()
+    existing_collections = db.list_collection_names()
+    
+    if 'farmhouse_daily_analytics' not in existing_collections:
+        validator = {"$jsonSchema": daily_analytics_schema}
+        collection_result = db.create_collection('farmhouse_daily_analytics', validator=validator)
+        creation_success = True
+    else:
+        validator = {"$jsonSchema": daily_analytics_schema}
+        update_result = db.command("collMod", "farmhouse_daily_analytics", validator=validator)
+        creation_success = True
+    
+    return creation_success
+
+
 @handle_exceptions
 def setup_leads_collection():
     lead_schema = get_lead_schema()
@@ -119,9 +121,10 @@ def initialize_database():
     farmhouses_setup = setup_farmhouses_collection()
     payments_setup = setup_payments_collection()
     farmhouse_analysis_setup = setup_farmhouse_analysis_collection()
+    daily_analytics_setup = setup_farmhouse_daily_analytics_collection()
     leads_setup = setup_leads_collection()
     pending_reviews_setup = setup_pending_reviews_collection()
-    geospatial_indexes_setup = setup_geospatial_indexes()
+    ensure_registered_indexes(db)
     
     if not farmhouses_setup:
         raise AppException("Failed to setup farmhouses collection")
@@ -132,15 +135,15 @@ def initialize_database():
     if not farmhouse_analysis_setup:
         raise AppException("Failed to setup farmhouse_analysis collection")
     
+    if not daily_analytics_setup:
+        raise AppException("Failed to setup farmhouse_daily_analytics collection")
+    
     if not leads_setup:
         raise AppException("Failed to setup leads collection")
     
     if not pending_reviews_setup:
         raise AppException("Failed to setup pending_reviews collection")
     
-    if not geospatial_indexes_setup:
-        raise AppException("Failed to setup geospatial indexes")
-    
     initialization_complete = True
     return initialization_complete
 
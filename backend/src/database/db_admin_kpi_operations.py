@@ -54,27 +54,6 @@ def aggregate_total_credits():
     return total_credits_left
 
 
-@handle_exceptions
-def calculate_platform_revenue(total_leads, total_recharged, total_credits_left):
-    per_lead_cost = 40
-    total_revenue = total_leads * per_lead_cost
-    revenue_data = {
-        "total_revenue": total_revenue,
-        "total_recharged": total_recharged,
-        "credits_left": total_credits_left
-    }
-    return revenue_data
-
-
-@handle_exceptions
-def get_total_platform_revenue():
-    total_leads = aggregate_total_leads()
-    total_recharged = aggregate_total_payments()
-    total_credits_left = aggregate_total_credits()
-    revenue_data = calculate_platform_revenue(total_leads, total_recharged, total_credits_left)
-    return revenue_data
-
-
 @handle_exceptions
 def get_current_month_start():
     now = datetime.utcnow()
@@ -110,12 +89,6 @@ def aggregate_total_leads():
     return total_leads
 
 
-@handle_exceptions
-def get_total_leads():
-    total_leads = aggregate_total_leads()
-    return total_leads
-
-
 @handle_exceptions
 def get_last_month_string():
     now = datetime.utcnow()
@@ -159,42 +132,70 @@ def calculate_month_range(year, month):
 
 
 @handle_exceptions
-def aggregate_top_properties_for_month(month_start_str, month_end_str):
+def build_month_analytics_pipeline(start_date, end_date, top_limit):
+    facets = {
+        "totals": [
+            {"$group": {"_id": None, "total_leads": {"$sum": "$monthly_leads"}, "total_views": {"$sum": "$monthly_views"}}}
+        ]
+    }
+
+    if top_limit:
+        facets["top_properties"] = [
+            {"$sort": {"monthly_leads": -1}},
+            {"$limit": top_limit},
+            {"$lookup": {
+                "from": "farmhouses",
+                "localField": "_id",
+                "foreignField": "_id",
+                "pipeline": [{"$project": {"_id": 0, "name": 1, "type": 1}}],
+                "as": "farmhouse"
+            }},
+            {"$unwind": "$farmhouse"}
+        ]
+
     pipeline = [
-        {"$unwind": "$daily_analytics"},
-        {"$match": {"daily_analytics.date": {"$gte": month_start_str, "$lte": month_end_str}}},
+        {"$match": {"date": {"$gte": start_date, "$lte": end_date}}},
         {"$group": {
             "_id": "$farmhouse_id",
-            "monthly_leads": {"$sum": "$daily_analytics.leads"},
-            "monthly_views": {"$sum": "$daily_analytics.views"}
+            "monthly_leads": {"$sum": "$leads"},
+            "monthly_views": {"$sum": "$views"}
         }},
-        {"$sort": {"monthly_leads": -1}},
-        {"$limit": 5}
+        {"$facet": facets}
     ]
-    results = list(db.farmhouse_analysis.aggregate(pipeline))
-    return results
+    return pipeline
 
 
 @handle_exceptions
-def enrich_with_property_names(results):
-    enriched_properties = []
+def format_top_properties(results):
+    top_properties = []
     
     for result in results:
-        farmhouse_id = result["_id"]
-        filter_dict = {"_id": farmhouse_id}
-        property_data = db_find_one("farmhouses", filter_dict)
-        
-        if property_data:
-            property_info = {
-                "farmhouse_id": str(farmhouse_id),
-                "name": property_data.get("name", "Unknown"),
-                "type": property_data.get("type", "farmhouse"),
-                "total_leads": result["monthly_leads"],
-                "total_views": result["monthly_views"]
-            }
-            enriched_properties.append(property_info)
+        farmhouse = result["farmhouse"]
+        property_info = {
+            "farmhouse_id": str(result["_id"]),
+            "name": farmhouse.get("name", "Unknown"),
+            "type": farmhouse.get("type", "farmhouse"),
+            "total_leads": result["monthly_leads"],
+            "total_views": result["monthly_views"]
+        }
+        top_properties.append(property_info)
     
-    return enriched_properties
+    return top_properties
+
+
+@handle_exceptions
+def aggregate_month_analytics(start_date, end_date, top_limit=5):
+    pipeline = build_month_analytics_pipeline(start_date, end_date, top_limit)
+    result = list(db.farmhouse_daily_analytics.aggregate(pipeline))
+    facets = result[0] if result else {}
+
+    totals = facets.get("totals") or [{}]
+    month_analytics = {
+        "total_leads": totals[0].get("total_leads", 0),
+        "total_views": totals[0].get("total_views", 0),
+        "top_properties": format_top_properties(facets.get("top_properties", []))
+    }
+    return month_analytics
 
 
 @handle_exceptions
@@ -261,14 +262,10 @@ def save_monthly_admin_analysis(month_str):
     month_data = parse_month_string(month_str)
     date_range = calculate_month_range(month_data["year"], month_data["month"])
     
-    results = aggregate_top_properties_for_month(date_range["start"], date_range["end"])
-    top_properties = enrich_with_property_names(results)
-    
-    total_leads = aggregate_platform_leads_for_month(date_range["start"], date_range["end"])
-    total_views = aggregate_platform_views_for_month(date_range["start"], date_range["end"])
+    month_analytics = aggregate_month_analytics(date_range["start"], date_range["end"], top_limit=5)
     new_properties = count_new_properties_for_month(date_range["start"], date_range["end"])
     
-    upsert_admin_analysis(month_str, top_properties, total_leads, total_views, new_properties)
+    upsert_admin_analysis(month_str, month_analytics["top_properties"], month_analytics["total_leads"], month_analytics["total_views"], new_properties)
     return True
 
 
@@ -288,30 +285,6 @@ def get_current_month_dates():
     return date_range
 
 
-@handle_exceptions
-def aggregate_platform_leads_for_month(start_date, end_date):
-    pipeline = [
-        {"$unwind": "$daily_analytics"},
-        {"$match": {"daily_analytics.date": {"$gte": start_date, "$lte": end_date}}},
-        {"$group": {"_id": None, "total_leads": {"$sum": "$daily_analytics.leads"}}}
-    ]
-    result = list(db.farmhouse_analysis.aggregate(pipeline))
-    total_leads = result[0]["total_leads"] if result else 0
-    return total_leads
-
-
-@handle_exceptions
-def aggregate_platform_views_for_month(start_date, end_date):
-    pipeline = [
-        {"$unwind": "$daily_analytics"},
-        {"$match": {"daily_analytics.date": {"$gte": start_date, "$lte": end_date}}},
-        {"$group": {"_id": None, "total_views": {"$sum": "$daily_analytics.views"}}}
-    ]
-    result = list(db.farmhouse_analysis.aggregate(pipeline))
-    total_views = result[0]["total_views"] if result else 0
-    return total_views
-
-
 @handle_exceptions
 def count_new_properties_for_month(start_date, end_date):
     start_datetime = datetime.strptime(start_date, "%Y-%m-%d")
@@ -328,14 +301,13 @@ def get_current_month_stats_live():
     month_str = get_current_month_string()
     date_range = get_current_month_dates()
     
-    total_leads = aggregate_platform_leads_for_month(date_range["start"], date_range["end"])
-    total_views = aggregate_platform_views_for_month(date_range["start"], date_range["end"])
+    month_analytics = aggregate_month_analytics(date_range["start"], date_range["end"], top_limit=None)
     new_properties = count_new_properties_for_month(date_range["start"], date_range["end"])
     
     stats = {
         "month": month_str,
-        "total_platform_leads": total_leads,
-        "total_platform_views": total_views,
+        "total_platform_leads": month_analytics["total_leads"],
+        "total_platform_views": month_analytics["total_views"],
         "new_properties_added": new_properties
     }
     return stats
@@ -353,9 +325,3 @@ def get_last_5_saved_months():
     
     empty_list = []
     return empty_list
-
-
-@handle_exceptions
-def get_total_money_left():
-    total_credits = aggregate_total_credits()
-    return total_credits
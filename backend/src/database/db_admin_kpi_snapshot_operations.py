@@ -0,0 +1,45 @@
+from datetime import datetime
+from . import db
+from ..utils.exception_handler import handle_exceptions
+
+ADMIN_KPI_SNAPSHOT_ID = "admin_kpi_snapshot_singleton"
+
+
+@handle_exceptions
+def find_admin_kpi_snapshot():
+    snapshot = db["admin_kpi_snapshot"].find_one({"_id": ADMIN_KPI_SNAPSHOT_ID})
+    return snapshot
+
+
+@handle_exceptions
+def replace_admin_kpi_snapshot(snapshot_data):
+    snapshot_data["_id"] = ADMIN_KPI_SNAPSHOT_ID
+    db["admin_kpi_snapshot"].replace_one({"_id": ADMIN_KPI_SNAPSHOT_ID}, snapshot_data, upsert=True)
+    return snapshot_data
+
+
+@handle_exceptions
+def increment_admin_kpi_snapshot(increments):
+    increments = {field: value for field, value in increments.items() if value}
+    if not increments:
+        return False
+
+    result = db["admin_kpi_snapshot"].update_one(
+        {"_id": ADMIN_KPI_SNAPSHOT_ID},
+        {"$inc": increments, "$set": {"updated_at": datetime.utcnow()}},
+        upsert=True
+    )
+    return result.modified_count > 0 or result.upserted_id is not None
+
+
+@handle_exceptions
+def build_analytics_snapshot_increments(pending_increments):
+    increments = {}
+    for (farmhouse_id, date_string), counters in pending_increments.items():
+        month_key = date_string[:7]
+        increments["total_leads"] = increments.get("total_leads", 0) + counters["leads"]
+        leads_field = f"months.{month_key}.leads"
+        views_field = f"months.{month_key}.views"
+        increments[leads_field] = increments.get(leads_field, 0) + counters["leads"]
+        increments[views_field] = increments.get(views_field, 0) + counters["views"]
+    return increments
@@ -0,0 +1,51 @@
+from bson import ObjectId
+from pymongo import UpdateOne
+from . import db
+from ..utils.amenity_bits import AMENITY_BITS_FIELD, encode_amenity_bits
+from ..utils.exception_handler import handle_exceptions
+
+BACKFILL_BATCH_SIZE = 500
+SYNC_ATTEMPTS = 3
+
+
+@handle_exceptions
+def sync_property_amenity_bits(property_id):
+    property_object_id = ObjectId(property_id)
+    for _ in range(SYNC_ATTEMPTS):
+        property_doc = db["farmhouses"].find_one({"_id": property_object_id}, {"amenities": 1})
+        if not property_doc:
+            return False
+
+        amenities_data = property_doc.get("amenities")
+        update_filter = {"_id": property_object_id, "amenities": amenities_data}
+        update_result = db["farmhouses"].update_one(update_filter, {"$set": {AMENITY_BITS_FIELD: encode_amenity_bits(amenities_data)}})
+        if update_result.matched_count:
+            return True
+
+    return False
+
+
+@handle_exceptions
+def find_active_property_amenity_bits():
+    cursor = db["farmhouses"].find({"status": "active"}, {"type": 1, AMENITY_BITS_FIELD: 1}, batch_size=5000)
+    return cursor
+
+
+@handle_exceptions
+def backfill_amenity_bits():
+    farmhouse_cursor = db["farmhouses"].find({}, {"amenities": 1}, batch_size=BACKFILL_BATCH_SIZE)
+    updated_farmhouses = 0
+    operations = []
+
+    for farmhouse_doc in farmhouse_cursor:
+        amenities_data = farmhouse_doc.get("amenities")
+        update_filter = {"_id": farmhouse_doc["_id"], "amenities": amenities_data}
+        operations.append(UpdateOne(update_filter, {"$set": {AMENITY_BITS_FIELD: encode_amenity_bits(amenities_data)}}))
+        if len(operations) >= BACKFILL_BATCH_SIZE:
+            updated_farmhouses += db["farmhouses"].bulk_write(operations, ordered=False).modified_count
+            operations = []
+
+    if operations:
+        updated_farmhouses += db["farmhouses"].bulk_write(operations, ordered=False).modified_count
+
+    return updated_farmhouses
@@ -0,0 +1,89 @@
+from datetime import datetime
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from . import db
+from ..utils.exception_handler import handle_exceptions
+
+LEGACY_MIGRATED_FIELD = "legacy_migrated"
+DUPLICATE_KEY_ERROR = 11000
+
+
+@handle_exceptions
+def find_legacy_daily_analytics(skipped_ids):
+    legacy_doc = db["farmhouse_analysis"].find_one(
+        {"daily_analytics": {"$exists": True}, "_id": {"$nin": skipped_ids}},
+        {"farmhouse_id": 1, "daily_analytics": 1}
+    )
+    return legacy_doc
+
+
+@handle_exceptions
+def build_legacy_bucket_operation(farmhouse_id, date_string, counters, now):
+    operation = UpdateOne(
+        {"farmhouse_id": ObjectId(farmhouse_id), "date": date_string, LEGACY_MIGRATED_FIELD: {"$ne": True}},
+        {
+            "$inc": {"views": counters["views"], "leads": counters["leads"]},
+            "$set": {"updated_at": now, LEGACY_MIGRATED_FIELD: True},
+            "$setOnInsert": {"created_at": now}
+        },
+        upsert=True
+    )
+    return operation
+
+
+@handle_exceptions
+def build_legacy_bucket_operations(farmhouse_id, daily_analytics):
+    now = datetime.utcnow()
+    operations = []
+    for entry in daily_analytics or []:
+        date_string = entry.get("date")
+        if not date_string:
+            continue
+        counters = {"views": entry.get("views", 0), "leads": entry.get("leads", 0)}
+        operations.append(build_legacy_bucket_operation(farmhouse_id, date_string, counters, now))
+    return operations
+
+
+@handle_exceptions
+def write_legacy_buckets(operations):
+    if not operations:
+        return True
+
+    try:
+        db["farmhouse_daily_analytics"].bulk_write(operations, ordered=False)
+    except BulkWriteError as error:
+        unexpected_errors = [write_error for write_error in error.details["writeErrors"] if write_error["code"] != DUPLICATE_KEY_ERROR]
+        if unexpected_errors:
+            raise
+    return True
+
+
+@handle_exceptions
+def release_legacy_daily_analytics(legacy_doc):
+    update_result = db["farmhouse_analysis"].update_one(
+        {"_id": legacy_doc["_id"], "daily_analytics": legacy_doc["daily_analytics"]},
+        {"$unset": {"daily_analytics": ""}}
+    )
+    return update_result.modified_count > 0
+
+
+@handle_exceptions
+def migrate_daily_analytics_to_buckets():
+    migrated_farmhouses = 0
+    migrated_days = 0
+    skipped_ids = []
+
+    legacy_doc = find_legacy_daily_analytics(skipped_ids)
+    while legacy_doc:
+        operations = build_legacy_bucket_operations(legacy_doc["farmhouse_id"], legacy_doc.get("daily_analytics"))
+        write_legacy_buckets(operations)
+        if release_legacy_daily_analytics(legacy_doc):
+            migrated_farmhouses += 1
+            migrated_days += len(operations)
+        else:
+            skipped_ids.append(legacy_doc["_id"])
+        legacy_doc = find_legacy_daily_analytics(skipped_ids)
+
+    migration_result = {"migrated_farmhouses": migrated_farmhouses, "migrated_days": migrated_days, "skipped_farmhouses": len(skipped_ids)}
+    return migration_result
@@ -0,0 +1,29 @@
+from datetime import datetime
+from pymongo.errors import DuplicateKeyError
+from . import db
+from ..utils.exception_handler import handle_exceptions
+
+APP_SETTINGS_COLLECTION = "app_settings"
+
+
+@handle_exceptions
+def find_app_setting(setting_key):
+    setting = db[APP_SETTINGS_COLLECTION].find_one({"_id": setting_key})
+    return setting
+
+
+@handle_exceptions
+def insert_app_setting(setting_key, fields):
+    setting = {**fields, "_id": setting_key, "updated_at": datetime.utcnow()}
+    try:
+        db[APP_SETTINGS_COLLECTION].insert_one(setting)
+    except DuplicateKeyError:
+        return False
+    return True
+
+
+@handle_exceptions
+def swap_app_setting(setting_key, expected_fields, new_fields):
+    update_filter = {**expected_fields, "_id": setting_key}
+    update_result = db[APP_SETTINGS_COLLECTION].update_one(update_filter, {"$set": {**new_fields, "updated_at": datetime.utcnow()}})
+    return update_result.matched_count > 0
@@ -0,0 +1,35 @@
+from pymongo import UpdateOne
+from . import db
+from ..utils.availability_calendar import encode_booked_dates, build_book_days_update
+from ..utils.exception_handler import handle_exceptions
+
+MIGRATION_BATCH_SIZE = 500
+
+
+@handle_exceptions
+def build_booked_days_migration_operation(farmhouse_doc):
+    month_masks = encode_booked_dates(farmhouse_doc.get("booked_dates"))
+    update = {"$unset": {"booked_dates": ""}}
+    if month_masks:
+        update.update(build_book_days_update(month_masks))
+
+    operation = UpdateOne({"_id": farmhouse_doc["_id"], "booked_dates": {"$exists": True}}, update)
+    return operation
+
+
+@handle_exceptions
+def migrate_booked_dates_to_bitmaps():
+    legacy_cursor = db["farmhouses"].find({"booked_dates": {"$exists": True}}, {"booked_dates": 1}, batch_size=MIGRATION_BATCH_SIZE)
+    migrated_farmhouses = 0
+    operations = []
+
+    for farmhouse_doc in legacy_cursor:
+        operations.append(build_booked_days_migration_operation(farmhouse_doc))
+        if len(operations) >= MIGRATION_BATCH_SIZE:
+            migrated_farmhouses += db["farmhouses"].bulk_write(operations, ordered=False).modified_count
+            operations = []
+
+    if operations:
+        migrated_farmhouses += db["farmhouses"].bulk_write(operations, ordered=False).modified_count
+
+    return migrated_farmhouses
@@ -0,0 +1,19 @@
+from datetime import datetime
+from . import db
+from ..utils.exception_handler import handle_exceptions
+
+CATALOGUE_CHANGES_COLLECTION = "catalogue_changes"
+
+
+@handle_exceptions
+def insert_catalogue_change(change_kind, property_id=None):
+    change = {"kind": change_kind, "property_id": str(property_id) if property_id else None, "created_at": datetime.utcnow()}
+    insert_result = db[CATALOGUE_CHANGES_COLLECTION].insert_one(change)
+    return insert_result.inserted_id
+
+
+@handle_exceptions
+def find_catalogue_changes_since(since, limit):
+    cursor = db[CATALOGUE_CHANGES_COLLECTION].find({"created_at": {"$gte": since}}).sort("created_at", 1).limit(limit)
+    changes = list(cursor)
+    return changes
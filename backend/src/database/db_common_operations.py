@@ -1,7 +1,16 @@
+import base64
+import re
 from bson import ObjectId
+from pymongo import ReturnDocument
 from . import db
 from ..utils.exception_handler import handle_exceptions, AppException
 
+PAGE_SIZE_DEFAULT = 24
+PAGE_SIZE_MAX = 100
+
+PAGE_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9_-]+={0,2}")
+PAGE_CURSOR_PATTERN = re.compile(r"(?:(0x[01]\.[0-9a-f]+p[+-]\d+):)?([0-9a-f]{24})")
+
 
 @handle_exceptions
 def db_insert_one(collection_name, data):
@@ -37,6 +46,81 @@ def db_find_many(collection_name, filter_dict, projection=None, sort_field=None,
     return list(cursor)
 
 
+@handle_exceptions
+def resolve_page_size(page_size=None):
+    if page_size is None or page_size == "":
+        return PAGE_SIZE_DEFAULT
+    
+    if not str(page_size).isdigit() or int(page_size) < 1:
+        raise AppException("Page size must be a positive whole number", 400)
+    
+    resolved_page_size = min(int(page_size), PAGE_SIZE_MAX)
+    return resolved_page_size
+
+
+@handle_exceptions
+def encode_page_token(last_id, last_distance=None):
+    cursor_value = str(last_id)
+    if last_distance is not None:
+        cursor_value = f"{float(last_distance).hex()}:{cursor_value}"
+    
+    page_token = base64.urlsafe_b64encode(cursor_value.encode()).decode()
+    return page_token
+
+
+@handle_exceptions
+def decode_page_token(page_token):
+    if not isinstance(page_token, str) or not PAGE_TOKEN_PATTERN.fullmatch(page_token) or len(page_token) % 4:
+        raise AppException("Invalid page token", 400)
+    
+    cursor_value = base64.urlsafe_b64decode(page_token).decode("utf-8", errors="replace")
+    cursor_match = PAGE_CURSOR_PATTERN.fullmatch(cursor_value)
+    if not cursor_match:
+        raise AppException("Invalid page token", 400)
+    
+    last_distance, last_id = cursor_match.groups()
+    page_cursor = {
+        "last_id": ObjectId(last_id),
+        "last_distance": float.fromhex(last_distance) if last_distance else None
+    }
+    return page_cursor
+
+
+@handle_exceptions
+def build_page(documents, page_size, distance_field=None):
+    page_documents = documents[:page_size]
+    next_page_token = None
+    
+    if len(documents) > page_size:
+        last_document = page_documents[-1]
+        last_distance = last_document.get(distance_field) if distance_field else None
+        next_page_token = encode_page_token(last_document["_id"], last_distance)
+    
+    page = {"items": page_documents, "next_page_token": next_page_token}
+    return page
+
+
+@handle_exceptions
+def build_keyset_filter(filter_dict, page_token=None, sort_order=1):
+    if not page_token:
+        return filter_dict
+    
+    page_cursor = decode_page_token(page_token)
+    id_operator = "$gt" if sort_order == 1 else "$lt"
+    keyset_filter = {"$and": [filter_dict, {"_id": {id_operator: page_cursor["last_id"]}}]}
+    return keyset_filter
+
+
+@handle_exceptions
+def db_find_page(collection_name, filter_dict, projection=None, page_size=None, page_token=None, sort_order=1):
+    collection = db[collection_name]
+    resolved_page_size = resolve_page_size(page_size)
+    keyset_filter = build_keyset_filter(filter_dict, page_token, sort_order)
+    
+    cursor = collection.find(keyset_filter, projection).sort("_id", sort_order).limit(resolved_page_size + 1)
+    page = build_page(list(cursor), resolved_page_size)
+    return page
+
 @handle_exceptions
 def db_find_by_id(collection_name, id, projection=None):
     collection = db[collection_name]
@@ -172,6 +256,13 @@ def db_set_field_by_id(collection_name, id, field_name, value):
     return result.modified_count > 0
 
 
+@handle_exceptions
+def db_find_one_and_update(collection_name, filter_dict, update, projection=None, return_after=True, upsert=False):
+    collection = db[collection_name]
+    return_document = ReturnDocument.AFTER if return_after else ReturnDocument.BEFORE
+    return collection.find_one_and_update(filter_dict, update, projection=projection, return_document=return_document, upsert=upsert)
+
+
 @handle_exceptions
 def db_aggregate(collection_name, pipeline):
     collection = db[collection_name]
@@ -179,7 +270,7 @@ def db_aggregate(collection_name, pipeline):
 
 
 @handle_exceptions
-def add_admin_image_to_property(property_id, image_url):
+def add_admin_image_to_property(property_id, image_url, variant_entry=None):
     filter_dict = {"_id": ObjectId(property_id)}
     
     property_doc = db_find_one("farmhouses", filter_dict)
@@ -192,6 +283,9 @@ def add_admin_image_to_property(property_id, image_url):
     else:
         update_dict = {"$push": {"images": image_url}}
     
+    if variant_entry:
+        update_dict.setdefault("$push", {})["image_variants"] = variant_entry
+    
     result = db_update_one("farmhouses", filter_dict, update_dict)
     
     if result.matched_count == 0:
@@ -203,7 +297,7 @@ def add_admin_image_to_property(property_id, image_url):
 @handle_exceptions
 def remove_admin_image_from_property(property_id, image_url):
     filter_dict = {"_id": ObjectId(property_id)}
-    update_dict = {"$pull": {"images": image_url}}
+    update_dict = {"$pull": {"images": image_url, "image_variants": {"original": image_url}}}
     result = db_update_one("farmhouses", filter_dict, update_dict)
     
     if result.matched_count == 0:
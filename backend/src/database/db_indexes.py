@@ -0,0 +1,156 @@
+from datetime import datetime
+from bson import ObjectId
+from pymongo import ASCENDING, GEOSPHERE
+from pymongo.errors import OperationFailure
+from ..utils.exception_handler import handle_exceptions
+from ..utils.logger import logger
+
+CATALOGUE_CHANGE_RETENTION_SECONDS = 3600
+
+INDEX_REGISTRY = {
+    "farmhouses": [
+        {"name": "geo_status_type", "keys": [("location.coordinates", GEOSPHERE), ("status", ASCENDING), ("type", ASCENDING)]},
+        {"name": "status_type", "keys": [("status", ASCENDING), ("type", ASCENDING)]},
+        {"name": "owner_dashboard_id", "keys": [("owner_details.owner_dashboard_id", ASCENDING)]},
+        {"name": "phone_number_status", "keys": [("phone_number", ASCENDING), ("status", ASCENDING)]},
+        {"name": "ai_file_id", "keys": [("ai.file_id", ASCENDING)], "options": {"sparse": True}}
+    ],
+    "farmhouse_analysis": [
+        {"name": "farmhouse_id_unique", "keys": [("farmhouse_id", ASCENDING)], "options": {"unique": True}}
+    ],
+    "farmhouse_daily_analytics": [
+        {"name": "farmhouse_id_date_unique", "keys": [("farmhouse_id", ASCENDING), ("date", ASCENDING)], "options": {"unique": True}},
+        {"name": "date", "keys": [("date", ASCENDING)]}
+    ],
+    "leads": [
+        {"name": "email_unique", "keys": [("email", ASCENDING)], "options": {"unique": True}}
+    ],
+    "payments": [
+        {"name": "order_id_unique", "keys": [("order_id", ASCENDING)], "options": {"unique": True, "partialFilterExpression": {"order_id": {"$type": "string"}}}},
+        {"name": "farmhouse_id_status", "keys": [("farmhouse_id", ASCENDING), ("status", ASCENDING)]}
+    ],
+    "vector_reindex_queue": [
+        {"name": "status_due_at", "keys": [("status", ASCENDING), ("due_at", ASCENDING)]}
+    ],
+    "catalogue_changes": [
+        {"name": "created_at_ttl", "keys": [("created_at", ASCENDING)], "options": {"expireAfterSeconds": CATALOGUE_CHANGE_RETENTION_SECONDS}}
+    ]
+}
+
+LEGACY_INDEXES = {
+    "farmhouses": [
+        {"name": "location.coordinates_2dsphere", "replaced_by": "geo_status_type"}
+    ]
+}
+
+SAMPLE_POINT = {"type": "Point", "coordinates": [73.8567, 18.5204]}
+SAMPLE_ID = ObjectId()
+
+QUERY_SHAPES = [
+    {"name": "listing_by_type", "collection": "farmhouses", "filter": {"status": "active", "type": "farmhouse"}},
+    {"name": "listing_near_point", "collection": "farmhouses", "filter": {
+        "location.coordinates": {"$nearSphere": {"$geometry": SAMPLE_POINT, "$maxDistance": 50000}},
+        "status": "active",
+        "type": "farmhouse"
+    }},
+    {"name": "owner_login", "collection": "farmhouses", "filter": {"owner_details.owner_dashboard_id": "sample_owner"}},
+    {"name": "incomplete_by_phone", "collection": "farmhouses", "filter": {"phone_number": "9999999999", "status": "incomplete"}},
+    {"name": "ai_file_lookup", "collection": "farmhouses", "filter": {"ai.file_id": {"$in": ["file-sample"]}}},
+    {"name": "analysis_by_farmhouse", "collection": "farmhouse_analysis", "filter": {"farmhouse_id": SAMPLE_ID}},
+    {"name": "daily_buckets_window", "collection": "farmhouse_daily_analytics", "filter": {"farmhouse_id": SAMPLE_ID, "date": {"$gte": "2025-01-01"}}},
+    {"name": "daily_buckets_month", "collection": "farmhouse_daily_analytics", "filter": {"date": {"$gte": "2025-01-01", "$lte": "2025-01-31"}}},
+    {"name": "lead_by_email", "collection": "leads", "filter": {"email": "guest@example.com"}},
+    {"name": "payment_by_order", "collection": "payments", "filter": {"order_id": "order_sample"}},
+    {"name": "payments_by_farmhouse_status", "collection": "payments", "filter": {"farmhouse_id": SAMPLE_ID, "status": "success"}},
+    {"name": "vector_reindex_due", "collection": "vector_reindex_queue", "filter": {"status": "pending", "due_at": {"$lte": datetime(2025, 1, 1)}}},
+    {"name": "catalogue_changes_since", "collection": "catalogue_changes", "filter": {"created_at": {"$gte": datetime(2025, 1, 1)}}}
+]
+
+
+@handle_exceptions
+def create_registered_index(database, collection_name, index_spec):
+    index_options = index_spec.get("options", {})
+    try:
+        index_name = database[collection_name].create_index(index_spec["keys"], name=index_spec["name"], **index_options)
+    except OperationFailure as error:
+        logger.warning(f"Could not create index {collection_name}.{index_spec['name']}: {error}")
+        index_name = None
+    return index_name
+
+
+@handle_exceptions
+def ensure_collection_indexes(database, collection_name):
+    existing_names = {index["name"] for index in database[collection_name].list_indexes()}
+    created_indexes = []
+
+    for index_spec in INDEX_REGISTRY[collection_name]:
+        if index_spec["name"] in existing_names:
+            continue
+        index_name = create_registered_index(database, collection_name, index_spec)
+        if index_name:
+            created_indexes.append(f"{collection_name}.{index_name}")
+
+    return created_indexes
+
+
+@handle_exceptions
+def drop_legacy_indexes(database, collection_name):
+    existing_names = {index["name"] for index in database[collection_name].list_indexes()}
+    dropped_indexes = []
+
+    for legacy_index in LEGACY_INDEXES.get(collection_name, []):
+        if legacy_index["name"] in existing_names and legacy_index["replaced_by"] in existing_names:
+            database[collection_name].drop_index(legacy_index["name"])
+            dropped_indexes.append(f"{collection_name}.{legacy_index['name']}")
+
+    return dropped_indexes
+
+
+@handle_exceptions
+def ensure_registered_indexes(database):
+    created_indexes = []
+    dropped_indexes = []
+    for collection_name in INDEX_REGISTRY:
+        created_indexes.extend(ensure_collection_indexes(database, collection_name))
+        dropped_indexes.extend(drop_legacy_indexes(database, collection_name))
+
+    if created_indexes:
+        logger.info(f"Created indexes: {', '.join(created_indexes)}")
+    if dropped_indexes:
+        logger.info(f"Dropped legacy indexes: {', '.join(dropped_indexes)}")
+    return created_indexes
+
+
+@handle_exceptions
+def collect_plan_stages(plan_node):
+    stages = []
+    if isinstance(plan_node, dict):
+        if "stage" in plan_node:
+            stages.append(plan_node["stage"])
+        for child in plan_node.values():
+            stages.extend(collect_plan_stages(child))
+    elif isinstance(plan_node, list):
+        for child in plan_node:
+            stages.extend(collect_plan_stages(child))
+    return stages
+
+
+@handle_exceptions
+def explain_query_shape(database, query_shape):
+    explain_result = database[query_shape["collection"]].find(query_shape["filter"]).explain()
+    winning_plan = explain_result.get("queryPlanner", {}).get("winningPlan", {})
+    stages = collect_plan_stages(winning_plan)
+
+    shape_report = {
+        "name": query_shape["name"],
+        "collection": query_shape["collection"],
+        "stages": stages,
+        "collection_scan": "COLLSCAN" in stages
+    }
+    return shape_report
+
+
+@handle_exceptions
+def explain_registered_queries(database):
+    shape_reports = [explain_query_shape(database, query_shape) for query_shape in QUERY_SHAPES]
+    return shape_reports
@@ -0,0 +1,173 @@
+from . import db
+from .db_common_operations import db_aggregate, resolve_page_size, decode_page_token, build_page
+from ..utils.exception_handler import handle_exceptions, AppException
+
+CANDIDATE_CHUNK_PAGES = 4
+CANDIDATE_MAX_CHUNKS = 3
+PROPERTY_TEXT_PROJECTION = {"name": 1, "description": 1, "type": 1, "per_day_price": 1, "location": 1, "amenities": 1, "tags": 1, "ai.file_id": 1}
+PROPERTY_VECTOR_PROJECTION = {"name": 1, "description": 1, "type": 1, "per_day_price": 1, "location": 1, "amenities": 1, "max_people_allowed": 1, "max_children_allowed": 1, "max_pets_allowed": 1}
+
+
+@handle_exceptions
+def build_listing_match_stage(query_filter, search_point, max_distance_meters, page_cursor=None):
+    if not search_point:
+        match_stage = {"$match": query_filter}
+        return match_stage
+
+    match_stage = {
+        "$geoNear": {
+            "near": search_point,
+            "distanceField": "distance_meters",
+            "maxDistance": max_distance_meters,
+            "query": query_filter,
+            "key": "location.coordinates",
+            "spherical": True
+        }
+    }
+    if page_cursor:
+        match_stage["$geoNear"]["minDistance"] = page_cursor["last_distance"]
+    return match_stage
+
+
+@handle_exceptions
+def build_listing_keyset_stages(search_point, page_cursor=None):
+    if not search_point:
+        keyset_stages = [{"$sort": {"_id": 1}}]
+        if page_cursor:
+            keyset_stages.insert(0, {"$match": {"_id": {"$gt": page_cursor["last_id"]}}})
+        return keyset_stages
+
+    keyset_stages = [{"$sort": {"distance_meters": 1, "_id": 1}}]
+    if page_cursor:
+        if page_cursor["last_distance"] is None:
+            raise AppException("Page token does not belong to a location search", 400)
+        keyset_stages.insert(0, {"$match": {"$or": [
+            {"distance_meters": {"$gt": page_cursor["last_distance"]}},
+            {"distance_meters": page_cursor["last_distance"], "_id": {"$gt": page_cursor["last_id"]}}
+        ]}})
+    return keyset_stages
+
+
+@handle_exceptions
+def build_review_average_lookup_stages():
+    lookup_stages = [
+        {
+            "$lookup": {
+                "from": "farmhouse_analysis",
+                "localField": "_id",
+                "foreignField": "farmhouse_id",
+                "pipeline": [{"$project": {"_id": 0, "review_average": 1}}],
+                "as": "analysis"
+            }
+        },
+        {
+            "$set": {
+                "review_average": {
+                    "$ifNull": [{"$arrayElemAt": ["$analysis.review_average", 0]}, 0.0]
+                }
+            }
+        },
+        {"$unset": "analysis"}
+    ]
+    return lookup_stages
+
+
+@handle_exceptions
+def build_listing_pipeline(query_filter, projection, search_point=None, max_distance_meters=None, page_cursor=None, page_size=None):
+    match_stage = build_listing_match_stage(query_filter, search_point, max_distance_meters, page_cursor)
+    listing_projection = dict(projection)
+
+    if search_point:
+        listing_projection["distance_meters"] = 1
+
+    pipeline = [match_stage]
+    if page_size:
+        pipeline.extend(build_listing_keyset_stages(search_point, page_cursor))
+        pipeline.append({"$limit": page_size + 1})
+    pipeline.append({"$project": listing_projection})
+    pipeline.extend(build_review_average_lookup_stages())
+    return pipeline
+
+
+@handle_exceptions
+def find_listing_properties(query_filter, projection, search_point=None, max_distance_meters=None):
+    pipeline = build_listing_pipeline(query_filter, projection, search_point, max_distance_meters)
+    properties_list = db_aggregate("farmhouses", pipeline)
+    return properties_list
+
+
+@handle_exceptions
+def find_listing_page(query_filter, projection, search_point=None, max_distance_meters=None, page_size=None, page_token=None):
+    resolved_page_size = resolve_page_size(page_size)
+    page_cursor = decode_page_token(page_token) if page_token else None
+    pipeline = build_listing_pipeline(query_filter, projection, search_point, max_distance_meters, page_cursor, resolved_page_size)
+
+    properties_list = db_aggregate("farmhouses", pipeline)
+    distance_field = "distance_meters" if search_point else None
+    page = build_page(properties_list, resolved_page_size, distance_field)
+    return page
+
+
+@handle_exceptions
+def find_active_property_points():
+    cursor = db["farmhouses"].find({"status": "active"}, {"type": 1, "location.coordinates": 1}, batch_size=5000)
+    return cursor
+
+
+@handle_exceptions
+def find_active_property_texts():
+    cursor = db["farmhouses"].find({"status": "active"}, PROPERTY_TEXT_PROJECTION, batch_size=2000)
+    return cursor
+
+
+@handle_exceptions
+def find_active_property_vector_docs():
+    cursor = db["farmhouses"].find({"status": "active"}, PROPERTY_VECTOR_PROJECTION, batch_size=2000)
+    return cursor
+
+
+@handle_exceptions
+def skip_served_candidates(ranked_properties, page_token=None):
+    if not page_token:
+        return ranked_properties
+
+    page_cursor = decode_page_token(page_token)
+    if page_cursor["last_distance"] is None:
+        raise AppException("Page token does not belong to a location search", 400)
+
+    last_served = (page_cursor["last_distance"], page_cursor["last_id"])
+    remaining_properties = [ranked_property for ranked_property in ranked_properties if ranked_property > last_served]
+    return remaining_properties
+
+
+@handle_exceptions
+def fetch_candidate_chunk(query_filter, projection, candidate_chunk):
+    distances = {property_id: distance_meters for distance_meters, property_id in candidate_chunk}
+    chunk_filter = {"$and": [query_filter, {"_id": {"$in": list(distances)}}]}
+    pipeline = build_listing_pipeline(chunk_filter, projection)
+
+    properties_list = db_aggregate("farmhouses", pipeline)
+    for property_data in properties_list:
+        property_data["distance_meters"] = distances[property_data["_id"]]
+    properties_list.sort(key=lambda property_data: (property_data["distance_meters"], property_data["_id"]))
+    return properties_list
+
+
+@handle_exceptions
+def find_candidate_listing_page(query_filter, projection, ranked_properties, page_size=None, page_token=None):
+    resolved_page_size = resolve_page_size(page_size)
+    remaining_properties = skip_served_candidates(ranked_properties, page_token)
+    chunk_size = (resolved_page_size + 1) * CANDIDATE_CHUNK_PAGES
+    candidate_window = remaining_properties[:chunk_size * CANDIDATE_MAX_CHUNKS]
+
+    properties_list = []
+    for chunk_start in range(0, len(candidate_window), chunk_size):
+        candidate_chunk = candidate_window[chunk_start:chunk_start + chunk_size]
+        properties_list.extend(fetch_candidate_chunk(query_filter, projection, candidate_chunk))
+        if len(properties_list) > resolved_page_size:
+            break
+
+    if len(properties_list) <= resolved_page_size and len(remaining_properties) > len(candidate_window):
+        return None
+    page = build_page(properties_list, resolved_page_size, "distance_meters")
+    return page
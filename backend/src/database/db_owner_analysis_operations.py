@@ -1,192 +1,116 @@
 from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
 from datetime import datetime, timedelta
 from . import db
-from .db_common_operations import db_insert_one, db_count_documents, db_aggregate
-from ..utils.exception_handler import handle_exceptions, AppException
+from .db_common_operations import db_aggregate
+from ..utils.exception_handler import handle_exceptions
 
 
 @handle_exceptions
-def record_visit(farmhouse_id):
-    now = datetime.utcnow()
-    today = now.strftime("%Y-%m-%d")
-    
-    collection = db["farmhouse_analysis"]
-    filter_dict = {"farmhouse_id": ObjectId(farmhouse_id)}
-    
-    collection.update_one(
-        filter_dict,
+def build_analysis_totals_operation(farmhouse_id, counters, now):
+    operation = UpdateOne(
+        {"farmhouse_id": ObjectId(farmhouse_id)},
         {
-            "$inc": {"total_views": 1},
+            "$inc": {"total_views": counters["views"], "total_leads": counters["leads"]},
             "$set": {"updated_at": now},
-            "$setOnInsert": {
-                "farmhouse_id": ObjectId(farmhouse_id),
-                "total_leads": 0,
-                "daily_analytics": [],
-                "created_at": now
-            }
+            "$setOnInsert": {"created_at": now}
         },
         upsert=True
     )
-    
-    result = collection.update_one(
-        {"farmhouse_id": ObjectId(farmhouse_id), "daily_analytics.date": today},
-        {"$inc": {"daily_analytics.$.views": 1}}
-    )
-    
-    if result.matched_count == 0:
-        collection.update_one(
-            filter_dict,
-            {"$push": {"daily_analytics": {"date": today, "views": 1, "leads": 0}}}
-        )
-    
-    return True
+    return operation
 
 
 @handle_exceptions
-def record_contact(farmhouse_id):
-    now = datetime.utcnow()
-    today = now.strftime("%Y-%m-%d")
-    
-    collection = db["farmhouse_analysis"]
-    filter_dict = {"farmhouse_id": ObjectId(farmhouse_id)}
-    
-    collection.update_one(
-        filter_dict,
+def build_daily_bucket_operation(farmhouse_id, date_string, counters, now):
+    operation = UpdateOne(
+        {"farmhouse_id": ObjectId(farmhouse_id), "date": date_string},
         {
-            "$inc": {"total_leads": 1},
+            "$inc": {"views": counters["views"], "leads": counters["leads"]},
             "$set": {"updated_at": now},
-            "$setOnInsert": {
-                "farmhouse_id": ObjectId(farmhouse_id),
-                "total_views": 0,
-                "daily_analytics": [],
-                "created_at": now
-            }
+            "$setOnInsert": {"created_at": now}
         },
         upsert=True
     )
-    
-    result = collection.update_one(
-        {"farmhouse_id": ObjectId(farmhouse_id), "daily_analytics.date": today},
-        {"$inc": {"daily_analytics.$.leads": 1}}
-    )
-    
-    if result.matched_count == 0:
-        collection.update_one(
-            filter_dict,
-            {"$push": {"daily_analytics": {"date": today, "views": 0, "leads": 1}}}
-        )
-    
-    return True
+    return operation
 
 
 @handle_exceptions
-def get_total_visits(farmhouse_id):
-    collection = db["farmhouse_analysis"]
-    filter_dict = {"farmhouse_id": ObjectId(farmhouse_id)}
-    doc = collection.find_one(filter_dict)
-    return doc.get("total_views", 0) if doc else 0
+def sum_increments_by_farmhouse(pending_increments, pending_totals):
+    farmhouse_totals = {farmhouse_id: dict(counters) for farmhouse_id, counters in pending_totals.items()}
+    for (farmhouse_id, date_string), counters in pending_increments.items():
+        totals = farmhouse_totals.setdefault(farmhouse_id, {"views": 0, "leads": 0})
+        totals["views"] += counters["views"]
+        totals["leads"] += counters["leads"]
+    return farmhouse_totals
 
 
 @handle_exceptions
-def get_total_contacts(farmhouse_id):
-    collection = db["farmhouse_analysis"]
-    filter_dict = {"farmhouse_id": ObjectId(farmhouse_id)}
-    doc = collection.find_one(filter_dict)
-    return doc.get("total_leads", 0) if doc else 0
+def bulk_write_failed_indexes(collection_name, operations):
+    if not operations:
+        return set()
 
-
-@handle_exceptions
-def get_contacts_last_days(farmhouse_id, days):
-    start_date = (datetime.utcnow() - timedelta(days=days-1)).strftime("%Y-%m-%d")
-    
-    collection = db["farmhouse_analysis"]
-    filter_dict = {"farmhouse_id": ObjectId(farmhouse_id)}
-    doc = collection.find_one(filter_dict)
-    
-    if not doc or "daily_analytics" not in doc:
-        return 0
-    
-    total = sum(d.get("leads", 0) for d in doc.get("daily_analytics", []) if d.get("date", "") >= start_date)
-    return total
+    try:
+        db[collection_name].bulk_write(operations, ordered=False)
+    except BulkWriteError as error:
+        return {write_error["index"] for write_error in error.details["writeErrors"]}
+    except PyMongoError:
+        return set(range(len(operations)))
+    return set()
 
 
 @handle_exceptions
-def get_contacts_last_7_days(farmhouse_id):
-    count = get_contacts_last_days(farmhouse_id, 7)
-    return count
+def apply_daily_bucket_increments(pending_increments, now):
+    bucket_keys = list(pending_increments)
+    bucket_operations = [
+        build_daily_bucket_operation(farmhouse_id, date_string, pending_increments[(farmhouse_id, date_string)], now)
+        for farmhouse_id, date_string in bucket_keys
+    ]
+    failed_indexes = bulk_write_failed_indexes("farmhouse_daily_analytics", bucket_operations)
+    unapplied_increments = {bucket_keys[index]: pending_increments[bucket_keys[index]] for index in failed_indexes}
+    return unapplied_increments
 
 
 @handle_exceptions
-def get_contacts_last_month(farmhouse_id):
-    count = get_contacts_last_days(farmhouse_id, 30)
-    return count
+def apply_analysis_totals(farmhouse_totals, now):
+    farmhouse_ids = list(farmhouse_totals)
+    totals_operations = [build_analysis_totals_operation(farmhouse_id, farmhouse_totals[farmhouse_id], now) for farmhouse_id in farmhouse_ids]
+    failed_indexes = bulk_write_failed_indexes("farmhouse_analysis", totals_operations)
+    unapplied_totals = {farmhouse_ids[index]: farmhouse_totals[farmhouse_ids[index]] for index in failed_indexes}
+    return unapplied_totals
 
 
 @handle_exceptions
-def get_contacts_last_year(farmhouse_id):
-    count = get_contacts_last_days(farmhouse_id, 365)
-    return count
-
-
-@handle_exceptions
-def get_daily_leads_last_7_days(farmhouse_id):
-    start_date = datetime.utcnow() - timedelta(days=6)
-    start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    collection = db["farmhouse_analysis"]
-    filter_dict = {"farmhouse_id": ObjectId(farmhouse_id)}
-    doc = collection.find_one(filter_dict)
-    
-    daily_dict = {}
-    if doc and "daily_analytics" in doc:
-        for d in doc.get("daily_analytics", []):
-            daily_dict[d.get("date", "")] = d.get("leads", 0)
-    
-    daily_data = []
-    for i in range(7):
-        date_str = (start_date + timedelta(days=i)).strftime("%Y-%m-%d")
-        daily_data.append(daily_dict.get(date_str, 0))
-    
-    return daily_data
-
+def bulk_apply_analytics_increments(pending_increments, pending_totals=None):
+    now = datetime.utcnow()
+    unapplied_increments = apply_daily_bucket_increments(pending_increments, now)
+    applied_increments = {key: counters for key, counters in pending_increments.items() if key not in unapplied_increments}
+    farmhouse_totals = sum_increments_by_farmhouse(applied_increments, pending_totals or {})
+    unapplied_totals = apply_analysis_totals(farmhouse_totals, now)
 
-@handle_exceptions
-def get_daily_views_last_7_days(farmhouse_id):
-    start_date = datetime.utcnow() - timedelta(days=6)
-    start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    collection = db["farmhouse_analysis"]
-    filter_dict = {"farmhouse_id": ObjectId(farmhouse_id)}
-    doc = collection.find_one(filter_dict)
-    
-    daily_dict = {}
-    if doc and "daily_analytics" in doc:
-        for d in doc.get("daily_analytics", []):
-            daily_dict[d.get("date", "")] = d.get("views", 0)
-    
-    daily_data = []
-    for i in range(7):
-        date_str = (start_date + timedelta(days=i)).strftime("%Y-%m-%d")
-        daily_data.append(daily_dict.get(date_str, 0))
-    
-    return daily_data
+    apply_result = {"applied": applied_increments, "unapplied_increments": unapplied_increments, "unapplied_totals": unapplied_totals}
+    return apply_result
 
 
 @handle_exceptions
-def get_this_month_leads(farmhouse_id):
-    now = datetime.utcnow()
-    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    month_start_str = month_start.strftime("%Y-%m-%d")
-    
-    collection = db["farmhouse_analysis"]
-    filter_dict = {"farmhouse_id": ObjectId(farmhouse_id)}
-    doc = collection.find_one(filter_dict)
-    
-    if not doc or "daily_analytics" not in doc:
-        return 0
-    
-    total = sum(d.get("leads", 0) for d in doc.get("daily_analytics", []) if d.get("date", "") >= month_start_str)
-    return total
+def find_dashboard_analytics(farmhouse_id, start_date):
+    pipeline = [
+        {"$match": {"farmhouse_id": ObjectId(farmhouse_id)}},
+        {"$project": {"_id": 0, "total_views": 1, "total_leads": 1, "last_month_summary": 1}},
+        {"$lookup": {
+            "from": "farmhouse_daily_analytics",
+            "localField": "farmhouse_id",
+            "foreignField": "farmhouse_id",
+            "pipeline": [
+                {"$match": {"date": {"$gte": start_date}}},
+                {"$project": {"_id": 0, "date": 1, "views": 1, "leads": 1}}
+            ],
+            "as": "daily_analytics"
+        }}
+    ]
+    result = db_aggregate("farmhouse_analysis", pipeline)
+    analytics_doc = result[0] if result else {}
+    return analytics_doc
 
 
 @handle_exceptions
@@ -204,80 +128,3 @@ def check_summary_month(last_month_summary, month_str):
     if last_month_summary.get("month") == month_str:
         return last_month_summary
     return None
-
-
-@handle_exceptions
-def get_last_month_leads(farmhouse_id):
-    collection = db["farmhouse_analysis"]
-    filter_dict = {"farmhouse_id": ObjectId(farmhouse_id)}
-    doc = collection.find_one(filter_dict)
-    
-    if not doc:
-        return 0
-    
-    last_month_str = get_last_month_string()
-    last_month_summary = doc.get("last_month_summary")
-    month_data = check_summary_month(last_month_summary, last_month_str)
-    
-    if month_data:
-        total = month_data.get("total_leads", 0)
-        return total
-    
-    now = datetime.utcnow()
-    last_month_start = (now.replace(day=1) - timedelta(days=1)).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    last_month_end = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0) - timedelta(microseconds=1)
-    
-    last_month_start_str = last_month_start.strftime("%Y-%m-%d")
-    last_month_end_str = last_month_end.strftime("%Y-%m-%d")
-    
-    daily = doc.get("daily_analytics", [])
-    total = sum(d.get("leads", 0) for d in daily 
-                if last_month_start_str <= d.get("date", "") <= last_month_end_str)
-    return total
-
-
-@handle_exceptions
-def get_this_month_views(farmhouse_id):
-    now = datetime.utcnow()
-    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    month_start_str = month_start.strftime("%Y-%m-%d")
-    
-    collection = db["farmhouse_analysis"]
-    filter_dict = {"farmhouse_id": ObjectId(farmhouse_id)}
-    doc = collection.find_one(filter_dict)
-    
-    if not doc or "daily_analytics" not in doc:
-        return 0
-    
-    total = sum(d.get("views", 0) for d in doc.get("daily_analytics", []) if d.get("date", "") >= month_start_str)
-    return total
-
-
-@handle_exceptions
-def get_last_month_views(farmhouse_id):
-    collection = db["farmhouse_analysis"]
-    filter_dict = {"farmhouse_id": ObjectId(farmhouse_id)}
-    doc = collection.find_one(filter_dict)
-    
-    if not doc:
-        return 0
-    
-    last_month_str = get_last_month_string()
-    last_month_summary = doc.get("last_month_summary")
-    month_data = check_summary_month(last_month_summary, last_month_str)
-    
-    if month_data:
-        total = month_data.get("total_views", 0)
-        return total
-    
-    now = datetime.utcnow()
-    last_month_start = (now.replace(day=1) - timedelta(days=1)).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    last_month_end = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0) - timedelta(microseconds=1)
-    
-    last_month_start_str = last_month_start.strftime("%Y-%m-%d")
-    last_month_end_str = last_month_end.strftime("%Y-%m-%d")
-    
-    daily = doc.get("daily_analytics", [])
-    total = sum(d.get("views", 0) for d in daily 
-                if last_month_start_str <= d.get("date", "") <= last_month_end_str)
-    return total
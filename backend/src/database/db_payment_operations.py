@@ -1,7 +1,7 @@
 from bson import ObjectId
 from datetime import datetime
 from . import db
-from .db_common_operations import db_insert_one, db_find_one, db_update_one, db_increment_field
+from .db_common_operations import db_insert_one, db_find_one, db_update_one, db_increment_field, db_find_one_and_update
 from ..utils.exception_handler import handle_exceptions, AppException
 
 
@@ -96,3 +96,34 @@ def get_farmhouse_credit_balance(farmhouse_id):
     
     credit_balance = farmhouse_data.get("credit_balance", 0)
     return credit_balance
+
+
+@handle_exceptions
+def charge_lead_credit(farmhouse_id, lead_cost, minimum_balance):
+    filter_dict = {
+        "_id": ObjectId(farmhouse_id),
+        "status": "active",
+        "credit_balance": {"$gte": minimum_balance},
+        "phone_number": {"$nin": [None, ""]}
+    }
+    update_pipeline = [
+        {"$set": {"credit_balance": {"$subtract": ["$credit_balance", lead_cost]}}},
+        {"$set": {"status": {"$cond": [{"$lte": ["$credit_balance", minimum_balance]}, "inactive", "$status"]}}}
+    ]
+    projection = {"credit_balance": 1, "status": 1, "type": 1, "phone_number": 1}
+
+    farmhouse_data = db_find_one_and_update("farmhouses", filter_dict, update_pipeline, projection)
+    return farmhouse_data
+
+
+@handle_exceptions
+def deactivate_farmhouse_below_balance(farmhouse_id, minimum_balance):
+    filter_dict = {
+        "_id": ObjectId(farmhouse_id),
+        "status": "active",
+        "credit_balance": {"$lt": minimum_balance}
+    }
+    update_dict = {"$set": {"status": "inactive"}}
+
+    deactivated_farmhouse = db_find_one_and_update("farmhouses", filter_dict, update_dict, {"type": 1})
+    return deactivated_farmhouse
@@ -145,13 +145,17 @@ def get_farmhouse_schema() -> Dict:
                     }
                 }
             },
-            "booked_dates": {
-                "bsonType": "array",
-                "description": "Array of all future booked dates (YYYY-MM-DD format)",
-                "items": {
-                    "bsonType": "string",
-                    "pattern": "^[0-9]{4}-[0-9]{2}-[0-9]{2}$"
-                }
+            "booked_days": {
+                "bsonType": "object",
+                "description": "Booked calendar days: one int bitmap per YYYY-MM month, bit n-1 set when day n is booked",
+                "patternProperties": {
+                    "^[0-9]{4}-[0-9]{2}$": {"bsonType": ["int", "long"]}
+                },
+                "additionalProperties": False
+            },
+            "amenity_bits": {
+                "bsonType": "binData",
+                "description": "Little-endian bitmask of the boolean amenities, bit positions from utils.amenity_bits.AMENITY_BIT_ORDER"
             },
             "images": {
                 "bsonType": "array",
@@ -160,6 +164,18 @@ def get_farmhouse_schema() -> Dict:
                     "bsonType": "string"
                 }
             },
+            "image_variants": {
+                "bsonType": "array",
+                "description": "Resized JPEG/WebP variant URLs per entry in images",
+                "items": {
+                    "bsonType": "object",
+                    "required": ["original", "variants"],
+                    "properties": {
+                        "original": {"bsonType": "string"},
+                        "variants": {"bsonType": "object"}
+                    }
+                }
+            },
             "amenities": {
                 "bsonType": "object",
                 "description": "Categorized amenities with proper data types",
@@ -684,7 +700,7 @@ def get_payment_schema() -> Dict:
 def get_farmhouse_analysis_schema() -> Dict:
     return {
         "bsonType": "object",
-        "required": ["farmhouse_id", "total_views", "total_leads", "daily_analytics", "created_at", "updated_at"],
+        "required": ["farmhouse_id", "total_views", "total_leads", "created_at", "updated_at"],
         "properties": {
             "_id": {
                 "bsonType": "objectId",
@@ -702,28 +718,6 @@ def get_farmhouse_analysis_schema() -> Dict:
                 "bsonType": "int",
                 "description": "Total leads count"
             },
-            "daily_analytics": {
-                "bsonType": "array",
-                "description": "Daily analytics tracking views and leads",
-                "items": {
-                    "bsonType": "object",
-                    "required": ["date", "views", "leads"],
-                    "properties": {
-                        "date": {
-                            "bsonType": "string",
-                            "description": "Date in YYYY-MM-DD format"
-                        },
-                        "views": {
-                            "bsonType": "int",
-                            "description": "Views on this date"
-                        },
-                        "leads": {
-                            "bsonType": "int",
-                            "description": "Leads on this date"
-                        }
-                    }
-                }
-            },
             "last_month_summary": {
                 "bsonType": "object",
                 "description": "Last month summary (last complete month only)",
@@ -765,6 +759,51 @@ def get_farmhouse_analysis_schema() -> Dict:
     }
 
 
+def get_farmhouse_daily_analytics_schema():
+    schema = {
+        "bsonType": "object",
+        "required": ["farmhouse_id", "date", "views", "leads", "created_at", "updated_at"],
+        "properties": {
+            "_id": {
+                "bsonType": "objectId",
+                "description": "Unique identifier for the daily bucket"
+            },
+            "farmhouse_id": {
+                "bsonType": "objectId",
+                "description": "Reference to farmhouse (one document per farmhouse per day)"
+            },
+            "date": {
+                "bsonType": "string",
+                "pattern": "^[0-9]{4}-[0-9]{2}-[0-9]{2}$",
+                "description": "Date in YYYY-MM-DD format"
+            },
+            "views": {
+                "bsonType": "int",
+                "minimum": 0,
+                "description": "Views on this date"
+            },
+            "leads": {
+                "bsonType": "int",
+                "minimum": 0,
+                "description": "Leads on this date"
+            },
+            "created_at": {
+                "bsonType": "date",
+                "description": "Timestamp when bucket was created"
+            },
+            "updated_at": {
+                "bsonType": "date",
+                "description": "Timestamp when bucket was last updated"
+            },
+            "legacy_migrated": {
+                "bsonType": "bool",
+                "description": "Set once the embedded daily_analytics entry for this day has been merged in"
+            }
+        }
+    }
+    return schema
+
+
 def get_lead_schema() -> Dict:
     return {
         "bsonType": "object",
@@ -914,17 +953,3 @@ def get_admin_analysis_schema():
     }
     return schema
 
-
-def create_geospatial_indexes(db):
-    """
-    Create geospatial indexes for location-based queries.
-    This enables efficient radius searches for properties.
-    """
-    try:
-        # Create 2dsphere index on coordinates for geospatial queries
-        db.farmhouses.create_index([("location.coordinates", "2dsphere")])
-        print("✅ Geospatial index created on farmhouses.location.coordinates")
-        return True
-    except Exception as e:
-        print(f"❌ Error creating geospatial index: {str(e)}")
-        return False
@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+from bson import ObjectId
+from pymongo import ReturnDocument
+from . import db
+from ..utils.exception_handler import handle_exceptions
+
+VECTOR_REINDEX_COLLECTION = "vector_reindex_queue"
+
+
+@handle_exceptions
+def upsert_vector_reindex_job(property_id, debounce_seconds):
+    now = datetime.utcnow()
+    is_processing = {"$eq": ["$status", "processing"]}
+    update_result = db[VECTOR_REINDEX_COLLECTION].update_one(
+        {"_id": ObjectId(property_id)},
+        [{"$set": {
+            "status": {"$cond": [is_processing, "processing", "pending"]},
+            "attempts": {"$cond": [is_processing, "$attempts", 0]},
+            "due_at": now + timedelta(seconds=debounce_seconds),
+            "last_requested_at": now,
+            "version": {"$add": [{"$ifNull": ["$version", 0]}, 1]},
+            "requested_at": {"$ifNull": ["$requested_at", now]}
+        }}],
+        upsert=True
+    )
+    coalesced = update_result.upserted_id is None
+    return coalesced
+
+
+@handle_exceptions
+def claim_vector_reindex_job(lease_seconds):
+    now = datetime.utcnow()
+    claim_filter = {
+        "due_at": {"$lte": now},
+        "$or": [{"status": "pending"}, {"status": "processing", "locked_at": {"$lt": now - timedelta(seconds=lease_seconds)}}]
+    }
+    claimed_job = db[VECTOR_REINDEX_COLLECTION].find_one_and_update(
+        claim_filter,
+        {"$set": {"status": "processing", "locked_at": now}},
+        sort=[("due_at", 1)],
+        return_document=ReturnDocument.AFTER
+    )
+    return claimed_job
+
+
+@handle_exceptions
+def release_vector_reindex_job(claimed_job):
+    job_filter = {"_id": claimed_job["_id"], "status": "processing", "locked_at": claimed_job["locked_at"]}
+    update_result = db[VECTOR_REINDEX_COLLECTION].update_one(job_filter, {"$set": {"status": "pending"}})
+    return update_result.modified_count > 0
+
+
+@handle_exceptions
+def complete_vector_reindex_job(claimed_job):
+    job_filter = {"_id": claimed_job["_id"], "version": claimed_job["version"]}
+    delete_result = db[VECTOR_REINDEX_COLLECTION].delete_one(job_filter)
+    if delete_result.deleted_count:
+        return True
+
+    release_vector_reindex_job(claimed_job)
+    return False
+
+
+@handle_exceptions
+def reschedule_vector_reindex_job(claimed_job, error_message, retry_delay_seconds):
+    now = datetime.utcnow()
+    next_status = "pending" if retry_delay_seconds is not None else "failed"
+    retry_fields = {"status": next_status, "last_error": error_message[:500], "last_failed_at": now}
+    if retry_delay_seconds is not None:
+        retry_fields["due_at"] = now + timedelta(seconds=retry_delay_seconds)
+
+    update_result = db[VECTOR_REINDEX_COLLECTION].update_one(
+        {"_id": claimed_job["_id"], "version": claimed_job["version"]},
+        {"$set": retry_fields, "$inc": {"attempts": 1}}
+    )
+    if update_result.modified_count:
+        return True
+
+    release_vector_reindex_job(claimed_job)
+    return False
+
+
+@handle_exceptions
+def get_vector_reindex_queue_summary():
+    pipeline = [{"$group": {"_id": "$status", "count": {"$sum": 1}, "oldest_requested_at": {"$min": "$requested_at"}, "next_due_at": {"$min": "$due_at"}}}]
+    summary = {group["_id"]: group for group in db[VECTOR_REINDEX_COLLECTION].aggregate(pipeline)}
+    return summary
@@ -1,32 +1,24 @@
-from ..database.db_admin_kpi_operations import (
-    get_property_counts_by_type,
-    get_total_platform_revenue,
-    get_this_month_revenue,
-    get_total_leads,
-    get_top_properties_last_month,
-    get_total_money_left,
-    get_current_month_stats_live,
-    get_last_5_saved_months
-)
+from .admin_kpi_snapshot_logic import get_admin_kpi_snapshot, build_snapshot_freshness, current_month_key
+from ..config import LEAD_COST_RUPEES
 from ..utils.exception_handler import handle_exceptions
 
 
 @handle_exceptions
 def build_property_counts_data(property_counts):
     counts_data = {
-        "total_farmhouses": property_counts["farmhouse"],
-        "total_bnbs": property_counts["bnb"]
+        "total_farmhouses": property_counts.get("farmhouse", 0),
+        "total_bnbs": property_counts.get("bnb", 0)
     }
     return counts_data
 
 
 @handle_exceptions
-def build_revenue_data(revenue_info, monthly_revenue):
+def build_revenue_data(snapshot, monthly_revenue):
     revenue_data = {
-        "total_platform_revenue": revenue_info["total_revenue"],
+        "total_platform_revenue": snapshot.get("total_leads", 0) * LEAD_COST_RUPEES,
         "this_month_revenue": monthly_revenue,
-        "total_recharged": revenue_info["total_recharged"],
-        "credits_left": revenue_info["credits_left"]
+        "total_recharged": snapshot.get("total_recharged", 0),
+        "credits_left": snapshot.get("credits_left", 0)
     }
     return revenue_data
 
@@ -39,6 +31,20 @@ def build_engagement_data(total_leads):
     return engagement_data
 
 
+@handle_exceptions
+def build_current_month_stats(snapshot):
+    month_key = current_month_key()
+    month_counters = snapshot.get("months", {}).get(month_key, {})
+    stats = {
+        "month": month_key,
+        "total_platform_leads": month_counters.get("leads", 0),
+        "total_platform_views": month_counters.get("views", 0),
+        "new_properties_added": month_counters.get("new_properties", 0),
+        "revenue": month_counters.get("revenue", 0)
+    }
+    return stats
+
+
 @handle_exceptions
 def build_current_month_data(current_month_stats):
     month_data = {
@@ -61,7 +67,7 @@ def build_platform_leads_graph(saved_months, current_month_stats):
 
 
 @handle_exceptions
-def build_kpis_response(counts_data, revenue_data, engagement_data, top_properties, current_month, graph_data, total_money):
+def build_kpis_response(counts_data, revenue_data, engagement_data, top_properties, current_month, graph_data, total_money, freshness):
     kpis = {
         "property_counts": counts_data,
         "revenue": revenue_data,
@@ -69,28 +75,24 @@ def build_kpis_response(counts_data, revenue_data, engagement_data, top_properti
         "top_properties_last_month": top_properties,
         "current_month": current_month,
         "platform_leads_graph": graph_data,
-        "total_money_left": total_money
+        "total_money_left": total_money,
+        "snapshot": freshness
     }
     return kpis
 
 
 @handle_exceptions
 def get_admin_dashboard_kpis():
-    property_counts = get_property_counts_by_type()
-    revenue_info = get_total_platform_revenue()
-    monthly_revenue = get_this_month_revenue()
-    total_leads = get_total_leads()
-    top_properties = get_top_properties_last_month(limit=5)
-    total_money = get_total_money_left()
-    current_month_stats = get_current_month_stats_live()
-    saved_months = get_last_5_saved_months()
+    snapshot = get_admin_kpi_snapshot()
+    current_month_stats = build_current_month_stats(snapshot)
     
-    counts_data = build_property_counts_data(property_counts)
-    revenue_data = build_revenue_data(revenue_info, monthly_revenue)
-    engagement_data = build_engagement_data(total_leads)
+    counts_data = build_property_counts_data(snapshot.get("property_counts", {}))
+    revenue_data = build_revenue_data(snapshot, current_month_stats["revenue"])
+    engagement_data = build_engagement_data(snapshot.get("total_leads", 0))
     current_month = build_current_month_data(current_month_stats)
-    graph_data = build_platform_leads_graph(saved_months, current_month_stats)
-    kpis = build_kpis_response(counts_data, revenue_data, engagement_data, top_properties, current_month, graph_data, total_money)
+    graph_data = build_platform_leads_graph(snapshot.get("monthly_data", []), current_month_stats)
+    top_properties = snapshot.get("last_month_top_properties", [])
+    freshness = build_snapshot_freshness(snapshot)
+    kpis = build_kpis_response(counts_data, revenue_data, engagement_data, top_properties, current_month, graph_data, snapshot.get("credits_left", 0), freshness)
     
     return kpis
-
@@ -0,0 +1,132 @@
+from datetime import datetime
+from src.database.db_admin_kpi_snapshot_operations import (
+    find_admin_kpi_snapshot,
+    replace_admin_kpi_snapshot,
+    increment_admin_kpi_snapshot,
+    build_analytics_snapshot_increments
+)
+from src.database.db_admin_kpi_operations import (
+    get_property_counts_by_type,
+    aggregate_total_leads,
+    aggregate_total_payments,
+    aggregate_total_credits,
+    get_this_month_revenue,
+    get_current_month_stats_live,
+    get_top_properties_last_month,
+    get_last_5_saved_months
+)
+from src.utils.exception_handler import handle_exceptions
+from src.utils.logger import logger
+
+ADMIN_KPI_RECONCILE_INTERVAL_MINUTES = 10
+ADMIN_KPI_MAX_STALENESS_SECONDS = 1800
+
+
+def current_month_key():
+    month_key = datetime.utcnow().strftime("%Y-%m")
+    return month_key
+
+
+def apply_snapshot_increments(increments):
+    try:
+        increment_admin_kpi_snapshot(increments)
+    except Exception as e:
+        logger.warning(f"Admin KPI snapshot increment skipped, reconciliation will correct it: {str(e)}")
+    return True
+
+
+def record_analytics_flush(pending_increments):
+    increments = build_analytics_snapshot_increments(pending_increments)
+    apply_snapshot_increments(increments)
+    return True
+
+
+def record_credit_change(balance_delta):
+    apply_snapshot_increments({"credits_left": balance_delta})
+    return True
+
+
+def record_successful_payment(amount):
+    month_key = current_month_key()
+    increments = {
+        "total_recharged": amount,
+        "credits_left": amount,
+        f"months.{month_key}.revenue": amount
+    }
+    apply_snapshot_increments(increments)
+    return True
+
+
+def record_new_property(created_at):
+    month_key = created_at.strftime("%Y-%m")
+    apply_snapshot_increments({f"months.{month_key}.new_properties": 1})
+    return True
+
+
+def record_property_status_change(property_type, old_status, new_status):
+    active_delta = (new_status == "active") - (old_status == "active")
+    if active_delta and property_type:
+        apply_snapshot_increments({f"property_counts.{property_type}": active_delta})
+    return True
+
+
+@handle_exceptions
+def reconcile_admin_kpi_snapshot():
+    current_month_stats = get_current_month_stats_live()
+    now = datetime.utcnow()
+
+    snapshot_data = {
+        "property_counts": get_property_counts_by_type(),
+        "total_leads": aggregate_total_leads(),
+        "total_recharged": aggregate_total_payments(),
+        "credits_left": aggregate_total_credits(),
+        "months": {
+            current_month_stats["month"]: {
+                "leads": current_month_stats["total_platform_leads"],
+                "views": current_month_stats["total_platform_views"],
+                "revenue": get_this_month_revenue(),
+                "new_properties": current_month_stats["new_properties_added"]
+            }
+        },
+        "last_month_top_properties": get_top_properties_last_month(limit=5),
+        "monthly_data": get_last_5_saved_months(),
+        "reconciled_at": now,
+        "updated_at": now
+    }
+
+    snapshot = replace_admin_kpi_snapshot(snapshot_data)
+    return snapshot
+
+
+@handle_exceptions
+def get_snapshot_age_seconds(snapshot):
+    reconciled_at = snapshot.get("reconciled_at")
+    if not reconciled_at:
+        return None
+    age_seconds = (datetime.utcnow() - reconciled_at).total_seconds()
+    return age_seconds
+
+
+@handle_exceptions
+def get_admin_kpi_snapshot():
+    snapshot = find_admin_kpi_snapshot() or {}
+    return snapshot
+
+
+@handle_exceptions
+def build_snapshot_freshness(snapshot):
+    from src.logics.analytics_event_buffer import ANALYTICS_FLUSH_INTERVAL_MS
+    
+    reconciled_at = snapshot.get("reconciled_at")
+    updated_at = snapshot.get("updated_at")
+    age_seconds = get_snapshot_age_seconds(snapshot)
+    freshness = {
+        "reconciled_at": reconciled_at.isoformat() if reconciled_at else None,
+        "updated_at": updated_at.isoformat() if updated_at else None,
+        "seconds_since_reconcile": round(age_seconds, 1) if age_seconds is not None else None,
+        "is_stale": age_seconds is None or age_seconds > ADMIN_KPI_MAX_STALENESS_SECONDS,
+        "max_staleness_seconds": ADMIN_KPI_MAX_STALENESS_SECONDS,
+        "reconcile_interval_seconds": ADMIN_KPI_RECONCILE_INTERVAL_MINUTES * 60,
+        "event_lag_ms": ANALYTICS_FLUSH_INTERVAL_MS
+    }
+    return freshness
@@ -1,15 +1,19 @@
 from src.logics.admin_auth import authenticate_admin
 from src.utils.exception_handler import handle_exceptions, AppException
-from src.database.db_common_operations import db_find_many, db_find_one, db_update_one, db_delete_one, db_insert_one
+from src.database.db_common_operations import db_find_many, db_find_page, db_find_one, db_find_one_and_update, db_update_one, db_delete_one, db_insert_one
 from src.logics.website_logic import process_property_for_detail, extract_all_amenities, build_complete_address
 from src.logics.cloudfare_bucket import delete_farmhouse_folder_from_r2
 from src.logics.ai_logics import add_property_to_vector_store
+from src.logics.catalogue_events import notify_catalogue_changed
+from src.logics.admin_kpi_snapshot_logic import record_credit_change, record_property_status_change
 
 from bson import ObjectId
 from datetime import datetime
 import pytz
 import re
 
+ADMIN_LISTED_STATUSES = ("active", "inactive", "incomplete")
+
 
 @handle_exceptions
 def process_admin_login(login_data):
@@ -31,7 +35,7 @@ def process_admin_login(login_data):
 
 
 @handle_exceptions
-def get_pending_properties():
+def get_pending_properties(page_size=None, page_token=None):
     query_filter = {"status": "pending_approval"}
     projection = {
         "_id": 1,
@@ -40,10 +44,10 @@ def get_pending_properties():
         "phone_number": 1
     }
     
-    pending_properties = db_find_many("farmhouses", query_filter, projection)
+    pending_page = db_find_page("farmhouses", query_filter, projection, page_size, page_token)
     
     processed_properties = []
-    for property_data in pending_properties:
+    for property_data in pending_page["items"]:
         processed_property = {
             "id": str(property_data.get("_id")),
             "name": property_data.get("name", ""),
@@ -52,7 +56,8 @@ def get_pending_properties():
         }
         processed_properties.append(processed_property)
     
-    return processed_properties
+    processed_page = {"properties": processed_properties, "next_page_token": pending_page["next_page_token"]}
+    return processed_page
 
 
 @handle_exceptions
@@ -174,7 +179,6 @@ def create_initial_analysis_data(property_id):
         "farmhouse_id": ObjectId(property_id),
         "total_views": 0,
         "total_leads": 0,
-        "daily_analytics": [],
         "review_average": 0.0,
         "created_at": current_time,
         "updated_at": current_time
@@ -204,7 +208,7 @@ def build_pending_property_filter(property_id):
 @handle_exceptions
 def get_pending_property(property_id):
     query_filter = build_pending_property_filter(property_id)
-    projection = {"_id": 1, "owner_details": 1}
+    projection = {"_id": 1, "type": 1, "owner_details": 1}
     property_data = db_find_one("farmhouses", query_filter, projection)
     
     if not property_data:
@@ -231,9 +235,12 @@ def approve_pending_property(property_id):
     ensure_owner_dashboard_credentials(owner_details)
     update_filter = build_pending_property_filter(property_id)
     update_data = {"status": "active"}
-    db_update_one("farmhouses", update_filter, {"$set": update_data})
+    update_result = db_update_one("farmhouses", update_filter, {"$set": update_data})
     initialize_farmhouse_analysis(property_id)
     add_property_to_vector_store(property_id)
+    notify_catalogue_changed(property_id)
+    if update_result.modified_count:
+        record_property_status_change(property_data.get("type"), "pending_approval", "active")
     result = True
     return result
 
@@ -265,6 +272,7 @@ def add_credit_balance(property_id, credit_amount):
     
     update_data = {"credit_balance": new_balance}
     db_update_one("farmhouses", query_filter, {"$set": update_data})
+    record_credit_change(credit_amount)
     
     return True
 
@@ -283,6 +291,7 @@ def mark_property_as_favourite(property_id, favourite_status):
     
     update_data = {"favourite": favourite_status}
     db_update_one("farmhouses", query_filter, {"$set": update_data})
+    notify_catalogue_changed(property_id)
     return True
 
 
@@ -299,7 +308,9 @@ def toggle_property_status(property_id, new_status):
     if new_status == "inactive" and property_data.get("favourite"):
         update_data["favourite"] = False
     
-    db_update_one("farmhouses", query_filter, {"$set": update_data})
+    previous_data = db_find_one_and_update("farmhouses", query_filter, {"$set": update_data}, {"type": 1, "status": 1}, return_after=False)
+    notify_catalogue_changed(property_id)
+    record_property_status_change(previous_data.get("type"), previous_data.get("status"), new_status)
     return True
 
 
@@ -454,6 +465,7 @@ def accept_pending_review(review_id):
     
     new_average = calculate_review_average(farmhouse_id)
     update_farmhouse_analysis_review_average(farmhouse_id, new_average)
+    notify_catalogue_changed(farmhouse_id)
     
     query_filter = {"_id": ObjectId(review_id)}
     db_delete_one("pending_reviews", query_filter)
@@ -470,8 +482,22 @@ def reject_pending_review(review_id):
 
 
 @handle_exceptions
-def get_all_properties():
-    query_filter = {"status": {"$ne": "pending_approval"}} 
+def build_all_properties_filter(status_filter=None):
+    statuses = [status.strip() for status in (status_filter or "").split(",") if status.strip()]
+    if not statuses:
+        query_filter = {"status": {"$ne": "pending_approval"}}
+        return query_filter
+
+    unknown_statuses = [status for status in statuses if status not in ADMIN_LISTED_STATUSES]
+    if unknown_statuses:
+        raise AppException(f"Unknown property status: {', '.join(unknown_statuses)}", 400)
+    query_filter = {"status": {"$in": statuses}}
+    return query_filter
+
+
+@handle_exceptions
+def get_all_properties(page_size=None, page_token=None, status_filter=None):
+    query_filter = build_all_properties_filter(status_filter)
     projection = {
         "_id": 1,
         "name": 1,
@@ -482,10 +508,10 @@ def get_all_properties():
         "credit_balance": 1
     }
     
-    all_properties = db_find_many("farmhouses", query_filter, projection)
+    properties_page = db_find_page("farmhouses", query_filter, projection, page_size, page_token)
     
     processed_properties = []
-    for property_data in all_properties:
+    for property_data in properties_page["items"]:
         processed_property = {
             "id": str(property_data.get("_id")),
             "name": property_data.get("name", ""),
@@ -497,7 +523,11 @@ def get_all_properties():
         }
         processed_properties.append(processed_property)
     
-    return processed_properties
+    processed_page = {
+        "properties": processed_properties,
+        "next_page_token": properties_page["next_page_token"]
+    }
+    return processed_page
 
 
 @handle_exceptions
@@ -518,10 +548,12 @@ def validate_uploaded_image_file(file):
 @handle_exceptions
 def upload_admin_property_image(property_id, file):
     from src.logics.cloudfare_bucket import upload_admin_property_image_to_r2
+    from src.logics.image_variants import build_image_variant_entry
     from src.database.db_common_operations import add_admin_image_to_property
     
     image_url = upload_admin_property_image_to_r2(file, property_id)
-    add_admin_image_to_property(property_id, image_url)
+    add_admin_image_to_property(property_id, image_url, build_image_variant_entry(image_url))
+    notify_catalogue_changed(property_id)
     
     return True
 
@@ -530,8 +562,11 @@ def upload_admin_property_image(property_id, file):
 def delete_admin_property_image(property_id, image_url):
     from src.database.db_common_operations import remove_admin_image_from_property
     from src.logics.cloudfare_bucket import delete_file_from_r2
+    from src.logics.image_variants import delete_image_variants
     
     remove_admin_image_from_property(property_id, image_url)
     delete_file_from_r2(image_url)
+    delete_image_variants(image_url)
+    notify_catalogue_changed(property_id)
     
     return True
\ No newline at end of file
@@ -1,14 +1,30 @@
 import os
-import re
 import logging
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 import pytz
 import requests
 from bson import ObjectId
 from tempfile import NamedTemporaryFile
-from src.config import OPENAI_API_KEY, VECTOR_STORE_ID
+from src.config import OPENAI_API_KEY, VECTOR_STORE_ID, OPENAI_API_BASE_URL, AI_SEARCH_MODE
 from src.utils.exception_handler import handle_exceptions, AppException
 from src.database.db_common_operations import db_find_one, db_find_many, db_update_one
+from src.database.db_app_settings_operations import find_app_setting, insert_app_setting, swap_app_setting
+from src.logics.text_search_index import search_text_index, resolve_file_properties
+from src.logics.catalogue_events import notify_ai_files_changed
+from src.logics.ai_search_cache import AI_SEARCH_FILES_CACHE_NAME, AI_SEARCH_PROPERTY_CACHE_NAME, build_ai_search_cache_key, get_cache_generation, get_cached_file_matches, store_file_matches, record_remote_search, get_cached_property_docs, store_property_docs
+
+AI_SEARCH_VECTOR_TIMEOUT_SECONDS = 2.5
+AI_SEARCH_VECTOR_WORKERS = 4
+AI_SEARCH_CANDIDATES = 20
+AI_SEARCH_RESULT_LIMIT = 5
+AI_SEARCH_LEXICAL_WEIGHT = 0.35
+
+VECTOR_STORE_VALIDATION_TTL_SECONDS = 900
+VECTOR_STORE_RECHECK_SECONDS = 60
+
 
 @handle_exceptions
 def get_openai_headers(extra_headers=None):
@@ -26,9 +42,33 @@ def get_openai_headers(extra_headers=None):
 
 logger = logging.getLogger(__name__)
 
+vector_search_executor = ThreadPoolExecutor(max_workers=AI_SEARCH_VECTOR_WORKERS, thread_name_prefix="vector-search")
+vector_search_slots = threading.BoundedSemaphore(AI_SEARCH_VECTOR_WORKERS)
+ai_search_lock = threading.Lock()
+ai_search_stats = {
+    "searches": 0,
+    "hybrid": 0,
+    "lexical_only": 0,
+    "vector_failures": 0,
+    "vector_rejections": 0
+}
+
+VECTOR_STORE_SETTING_KEY = "vector_store"
+vector_store_lock = threading.Lock()
+vector_store_handle = {"vector_store_id": None, "checked_at": 0.0, "expires_at": 0.0}
+vector_store_stats = {
+    "cache_hits": 0,
+    "resolves": 0,
+    "validations": 0,
+    "validation_errors": 0,
+    "not_found": 0,
+    "created": 0,
+    "cas_conflicts": 0
+}
+
 @handle_exceptions
 def add_file_to_vector_store(vector_store_id, file_id):
-    url = "https://api.openai.com/v1/vector_stores/{}/files".format(vector_store_id)
+    url = f"{OPENAI_API_BASE_URL}/vector_stores/{vector_store_id}/files"
     headers = get_openai_headers({"Content-Type": "application/json"})
     payload = {
         "file_id": file_id,
@@ -41,6 +81,8 @@ def add_file_to_vector_store(vector_store_id, file_id):
         }
     }
     response = requests.post(url, headers=headers, json=payload, timeout=30)
+    if response.status_code == 404:
+        report_vector_store_not_found(vector_store_id)
     if response.status_code >= 400:
         logger.error("attach error %s: %s", response.status_code, response.text)
         raise AppException(f"attach error {response.status_code}: {response.text}")
@@ -49,9 +91,34 @@ def add_file_to_vector_store(vector_store_id, file_id):
     return attach_resp
 
 
+@handle_exceptions
+def attach_files_to_vector_store(vector_store_id, file_ids):
+    url = f"{OPENAI_API_BASE_URL}/vector_stores/{vector_store_id}/file_batches"
+    headers = get_openai_headers({"Content-Type": "application/json"})
+    payload = {
+        "file_ids": file_ids,
+        "chunking_strategy": {
+            "type": "static",
+            "static": {
+                "max_chunk_size_tokens": 4096,
+                "chunk_overlap_tokens": 0
+            }
+        }
+    }
+    response = requests.post(url, headers=headers, json=payload, timeout=60)
+    if response.status_code == 404:
+        report_vector_store_not_found(vector_store_id)
+    if response.status_code >= 400:
+        logger.error("file batch error %s: %s", response.status_code, response.text)
+        raise AppException(f"file batch error {response.status_code}: {response.text}")
+    batch_resp = response.json()
+    logger.info("Attached %s files to vector store in batch %s", len(file_ids), batch_resp.get("id"))
+    return batch_resp
+
+
 @handle_exceptions
 def remove_file_from_vector_store(vector_store_id, file_id):
-    url = f"https://api.openai.com/v1/vector_stores/{vector_store_id}/files/{file_id}"
+    url = f"{OPENAI_API_BASE_URL}/vector_stores/{vector_store_id}/files/{file_id}"
     headers = get_openai_headers()
     response = requests.delete(url, headers=headers, timeout=60)
     
@@ -69,51 +136,25 @@ def remove_file_from_vector_store(vector_store_id, file_id):
 
 
 @handle_exceptions
-def validate_vector_store(vector_store_id):
-    if not vector_store_id:
-        result = False
-        return result
-    
-    url = f"https://api.openai.com/v1/vector_stores/{vector_store_id}"
+def delete_openai_file(file_id):
+    url = f"{OPENAI_API_BASE_URL}/files/{file_id}"
     headers = get_openai_headers()
-    response = requests.get(url, headers=headers, timeout=30)
-    
-    if response.status_code == 200:
-        result = True
-        return result
-    
-    result = False
-    return result
+    response = requests.delete(url, headers=headers, timeout=30)
+    deleted = response.status_code in (200, 404)
+    if not deleted:
+        logger.warning(f"Failed to delete file {file_id}: {response.status_code} - {response.text}")
+    return deleted
 
 
 @handle_exceptions
-def update_env_variable(key, value):
-    env_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), '.env')
-    
-    if not os.path.exists(env_path):
-        with open(env_path, 'w') as f:
-            f.write(f"{key}={value}\n")
-        result = True
-        return result
-    
-    with open(env_path, 'r') as f:
-        lines = f.readlines()
-    
-    key_found = False
-    for i, line in enumerate(lines):
-        if line.strip().startswith(f"{key}="):
-            lines[i] = f"{key}={value}\n"
-            key_found = True
-            break
-    
-    if not key_found:
-        lines.append(f"{key}={value}\n")
-    
-    with open(env_path, 'w') as f:
-        f.writelines(lines)
-    
-    result = True
-    return result
+def fetch_vector_store_status(vector_store_id):
+    url = f"{OPENAI_API_BASE_URL}/vector_stores/{vector_store_id}"
+    headers = get_openai_headers()
+    response = requests.get(url, headers=headers, timeout=30)
+    if response.status_code not in (200, 404):
+        logger.warning(f"Vector store check for {vector_store_id} returned {response.status_code}: {response.text}")
+    status_code = response.status_code
+    return status_code
 
 
 @handle_exceptions
@@ -123,80 +164,137 @@ def create_property_content_for_ai(property_data):
 
 
 @handle_exceptions
-def ensure_valid_vector_store():
-    current_vector_store_id = VECTOR_STORE_ID
-    
-    if not current_vector_store_id:
-        logger.info("No vector store ID configured, creating new vector store")
-        new_vector_store_id = create_vector_store([])
-        update_env_variable("VECTOR_STORE_ID", new_vector_store_id)
-        result = new_vector_store_id
-        return result
-    
-    is_valid = validate_vector_store(current_vector_store_id)
-    if is_valid:
-        result = current_vector_store_id
-        return result
-    
+def delete_vector_store(vector_store_id):
+    url = f"{OPENAI_API_BASE_URL}/vector_stores/{vector_store_id}"
+    headers = get_openai_headers()
+    response = requests.delete(url, headers=headers, timeout=30)
+    deleted = response.status_code == 200
+    if not deleted:
+        logger.warning(f"Failed to delete vector store {vector_store_id}: {response.status_code} - {response.text}")
+    return deleted
+
+
+@handle_exceptions
+def record_vector_store_event(event_name):
+    with vector_store_lock:
+        vector_store_stats[event_name] += 1
+    return True
+
+
+@handle_exceptions
+def cache_vector_store_handle(vector_store_id, lifetime_seconds=VECTOR_STORE_VALIDATION_TTL_SECONDS):
+    with vector_store_lock:
+        vector_store_handle["vector_store_id"] = vector_store_id
+        vector_store_handle["checked_at"] = time.monotonic()
+        vector_store_handle["expires_at"] = vector_store_handle["checked_at"] + lifetime_seconds
+    return vector_store_id
+
+
+@handle_exceptions
+def find_vector_store_setting():
+    vector_store_setting = find_app_setting(VECTOR_STORE_SETTING_KEY)
+    if vector_store_setting or not VECTOR_STORE_ID:
+        return vector_store_setting
+
+    insert_app_setting(VECTOR_STORE_SETTING_KEY, {"vector_store_id": VECTOR_STORE_ID, "created_at": datetime.utcnow()})
+    vector_store_setting = find_app_setting(VECTOR_STORE_SETTING_KEY)
+    return vector_store_setting
+
+
+@handle_exceptions
+def create_shared_vector_store(stale_vector_store_id):
     new_vector_store_id = create_vector_store([])
-    update_env_variable("VECTOR_STORE_ID", new_vector_store_id)
-    
-    logger.info(f"Created new vector store: {new_vector_store_id}")
-    result = new_vector_store_id
-    return result
+    now = datetime.utcnow()
+    new_fields = {"vector_store_id": new_vector_store_id, "created_at": now, "validated_at": now}
+    if stale_vector_store_id:
+        swapped = swap_app_setting(VECTOR_STORE_SETTING_KEY, {"vector_store_id": stale_vector_store_id}, new_fields)
+    else:
+        swapped = insert_app_setting(VECTOR_STORE_SETTING_KEY, new_fields)
+
+    if swapped:
+        record_vector_store_event("created")
+        logger.info(f"Created new vector store: {new_vector_store_id}")
+        return new_vector_store_id
+
+    record_vector_store_event("cas_conflicts")
+    delete_vector_store(new_vector_store_id)
+    winning_vector_store_id = find_app_setting(VECTOR_STORE_SETTING_KEY)["vector_store_id"]
+    return winning_vector_store_id
 
 
 @handle_exceptions
-def update_property_in_vector_store(property_id):
-    property_data = db_find_one("farmhouses", {"_id": ObjectId(property_id)})
-    if not property_data:
-        result = False
-        return result
-    
-    ai_field = property_data.get("ai", {})
-    existing_file_id = ai_field.get("file_id")
-    
-    if not existing_file_id:
-        result = False
-        return result
-    
-    vector_store_id = get_vector_store_id()
-    if not vector_store_id:
-        result = False
-        return result
-    
-    try:
-        remove_file_from_vector_store(vector_store_id, existing_file_id)
-    except:
-        pass
-    
-    property_content = create_property_content_for_ai(property_data)
-    new_file_id = upload_text_to_openai(property_content)
-    add_file_to_vector_store(vector_store_id, new_file_id)
-    
-    ai_metadata = {
-        "file_id": new_file_id,
-        "vector_store_id": vector_store_id,
-        "last_updated": datetime.utcnow().isoformat()
-    }
-    
-    update_data = {"$set": {"ai": ai_metadata}}
-    query_filter = {"_id": ObjectId(property_id)}
-    db_update_one("farmhouses", query_filter, update_data)
-    
-    result = True
-    return result
+def revalidate_vector_store(vector_store_id):
+    record_vector_store_event("validations")
+    status_code = fetch_vector_store_status(vector_store_id)
+    if status_code == 200:
+        swap_app_setting(VECTOR_STORE_SETTING_KEY, {"vector_store_id": vector_store_id}, {"validated_at": datetime.utcnow()})
+        return cache_vector_store_handle(vector_store_id)
+
+    if status_code != 404:
+        record_vector_store_event("validation_errors")
+        return cache_vector_store_handle(vector_store_id, VECTOR_STORE_RECHECK_SECONDS)
+
+    replacement_vector_store_id = cache_vector_store_handle(create_shared_vector_store(vector_store_id))
+    return replacement_vector_store_id
+
+
+@handle_exceptions
+def resolve_vector_store_id():
+    record_vector_store_event("resolves")
+    vector_store_setting = find_vector_store_setting()
+    if not vector_store_setting:
+        return cache_vector_store_handle(create_shared_vector_store(None))
+
+    vector_store_id = vector_store_setting["vector_store_id"]
+    validated_at = vector_store_setting.get("validated_at")
+    if validated_at and datetime.utcnow() - validated_at < timedelta(seconds=VECTOR_STORE_VALIDATION_TTL_SECONDS):
+        return cache_vector_store_handle(vector_store_id)
+
+    resolved_vector_store_id = revalidate_vector_store(vector_store_id)
+    return resolved_vector_store_id
 
 
 @handle_exceptions
 def get_vector_store_id():
-    result = ensure_valid_vector_store()
-    return result
+    with vector_store_lock:
+        cached_vector_store_id = vector_store_handle["vector_store_id"]
+        is_fresh = bool(cached_vector_store_id) and time.monotonic() < vector_store_handle["expires_at"]
+        vector_store_stats["cache_hits"] += is_fresh
+    if is_fresh:
+        return cached_vector_store_id
+
+    vector_store_id = resolve_vector_store_id()
+    return vector_store_id
+
+
+@handle_exceptions
+def report_vector_store_not_found(vector_store_id):
+    record_vector_store_event("not_found")
+    with vector_store_lock:
+        if vector_store_handle["vector_store_id"] == vector_store_id:
+            vector_store_handle["expires_at"] = 0.0
+
+    vector_store_setting = find_app_setting(VECTOR_STORE_SETTING_KEY)
+    if not vector_store_setting or vector_store_setting["vector_store_id"] != vector_store_id:
+        return resolve_vector_store_id()
+
+    vector_store_id = revalidate_vector_store(vector_store_id)
+    return vector_store_id
+
+
+@handle_exceptions
+def get_vector_store_handle_stats():
+    with vector_store_lock:
+        stats = dict(vector_store_stats)
+        stats["vector_store_id"] = vector_store_handle["vector_store_id"]
+        stats["cache_age_seconds"] = round(time.monotonic() - vector_store_handle["checked_at"], 1) if vector_store_handle["vector_store_id"] else None
+    stats["validation_ttl_seconds"] = VECTOR_STORE_VALIDATION_TTL_SECONDS
+    return stats
 
 
 @handle_exceptions
 def create_vector_store(file_ids):
-    url = "https://api.openai.com/v1/vector_stores"
+    url = f"{OPENAI_API_BASE_URL}/vector_stores"
     headers = get_openai_headers({"Content-Type": "application/json"})
     payload = {}
     if file_ids:
@@ -210,7 +308,7 @@ def create_vector_store(file_ids):
 
 @handle_exceptions
 def upload_file_in_openai(file_path):
-    url = "https://api.openai.com/v1/files"
+    url = f"{OPENAI_API_BASE_URL}/files"
     headers = get_openai_headers()
     data = {"purpose": "assistants"}
     with open(file_path, "rb") as file_handle:
@@ -341,6 +439,7 @@ def save_ai_file_metadata(property_id, file_id, vector_store_id):
         {"_id": ObjectId(property_id)},
         {"$set": {"ai": update_payload}}
     )
+    notify_ai_files_changed(property_id)
     result = True
     return result
 
@@ -357,22 +456,24 @@ def add_property_to_vector_store(property_id):
 
 
 @handle_exceptions
-def search_vector_store_for_files(query_string, top_k=20, rewrite_query=True):
+def search_vector_store_for_files(query_string, top_k=20, rewrite_query=True, timeout_seconds=30):
     vector_store_id = get_vector_store_id()
     
-    url = "https://api.openai.com/v1/vector_stores/{}/search".format(vector_store_id)
+    url = f"{OPENAI_API_BASE_URL}/vector_stores/{vector_store_id}/search"
     headers = get_openai_headers({"Content-Type": "application/json"})
     payload = {
         "query": query_string,
         "max_num_results": top_k,
         "rewrite_query": rewrite_query
     }
-    response = requests.post(url, headers=headers, json=payload, timeout=30)
+    response = requests.post(url, headers=headers, json=payload, timeout=timeout_seconds)
     
     logger.info(f"Vector store search - URL: {url}")
     logger.info(f"Vector store search - Status: {response.status_code}")
     logger.info(f"Vector store search - Response: {response.text}")
     
+    if response.status_code == 404:
+        report_vector_store_not_found(vector_store_id)
     if response.status_code >= 400:
         raise AppException("Vector store search failed")
     search_data = response.json()
@@ -387,38 +488,6 @@ def search_vector_store_for_files(query_string, top_k=20, rewrite_query=True):
     return cleaned_matches
 
 
-@handle_exceptions
-def map_files_to_property_ids(file_ids):
-    if not file_ids:
-        ordered_property_ids = []
-        file_to_property = {}
-        return ordered_property_ids, file_to_property
-    records = db_find_many(
-        "farmhouses",
-        {"ai.file_id": {"$in": file_ids}},
-        {"ai.file_id": 1}
-    )
-    mapping = {}
-    for record in records:
-        ai_data = record.get("ai") or {}
-        file_id = ai_data.get("file_id")
-        property_ref = record.get("_id")
-        if file_id and property_ref:
-            mapping[file_id] = str(property_ref)
-    ordered_property_ids = []
-    file_to_property = {}
-    seen_properties = set()
-    for file_id in file_ids:
-        property_id = mapping.get(file_id)
-        if not property_id:
-            continue
-        file_to_property[file_id] = property_id
-        if property_id not in seen_properties:
-            ordered_property_ids.append(property_id)
-            seen_properties.add(property_id)
-    return ordered_property_ids, file_to_property
-
-
 @handle_exceptions
 def format_search_property(property_data):
     property_id = str(property_data.get("_id"))
@@ -497,90 +566,123 @@ def fetch_active_property_docs(property_ids):
     if not property_ids:
         result = []
         return result
-    query_filter = build_active_properties_filter(property_ids)
-    projection = build_active_properties_projection()
-    properties = db_find_many("farmhouses", query_filter, projection)
-    property_map = build_property_map(properties)
+    generation = get_cache_generation(AI_SEARCH_PROPERTY_CACHE_NAME)
+    property_map, missing_ids = get_cached_property_docs(property_ids)
+    if missing_ids:
+        properties = db_find_many("farmhouses", build_active_properties_filter(missing_ids), build_active_properties_projection())
+        fetched_map = build_property_map(properties)
+        store_property_docs(fetched_map, generation)
+        property_map.update(fetched_map)
     ordered_properties = order_properties_by_ids(property_map, property_ids)
     return ordered_properties
 
 @handle_exceptions
-def tokenize_query(query_string):
-    tokens = re.findall(r"\w+", query_string.lower())
-    meaningful_tokens = [token for token in tokens if len(token) > 2]
-    return meaningful_tokens
+def run_timed_vector_search(query_string):
+    started_at = time.perf_counter()
+    matches = search_vector_store_for_files(query_string, AI_SEARCH_CANDIDATES, timeout_seconds=AI_SEARCH_VECTOR_TIMEOUT_SECONDS)
+    record_remote_search((time.perf_counter() - started_at) * 1000)
+    return matches
 
 
 @handle_exceptions
-def extract_property_text(property_data):
-    parts = [
-        property_data.get("name", ""),
-        property_data.get("description", ""),
-        property_data.get("type", ""),
-        str(property_data.get("per_day_price", ""))
-    ]
-    location = property_data.get("location") or {}
-    location_parts = [
-        location.get("address", ""),
-        location.get("area", ""),
-        location.get("city", ""),
-        location.get("state", "")
-    ]
-    parts.extend(location_parts)
-    amenities = property_data.get("amenities") or {}
-    for category in amenities.values():
-        if isinstance(category, dict):
-            for amenity_name, enabled in category.items():
-                if enabled:
-                    parts.append(amenity_name)
-    tags = property_data.get("tags") or []
-    if isinstance(tags, list):
-        parts.extend(tags)
-    aggregated_text = " ".join(filter(None, parts)).lower()
-    return aggregated_text
+def submit_vector_search(query_string):
+    if not vector_search_slots.acquire(blocking=False):
+        with ai_search_lock:
+            ai_search_stats["vector_rejections"] += 1
+        return None
+
+    future = vector_search_executor.submit(run_timed_vector_search, query_string)
+    future.add_done_callback(lambda _: vector_search_slots.release())
+    return future
 
 
 @handle_exceptions
-def compute_property_score(property_id, vector_score_map):
-    score = vector_score_map.get(property_id)
-    if score is None:
-        return 0.0
-    return score
+def fetch_vector_matches(query_string, property_type=None):
+    cache_key = build_ai_search_cache_key(query_string, property_type)
+    cached_matches = get_cached_file_matches(cache_key)
+    if cached_matches is not None:
+        return cached_matches
+
+    generation = get_cache_generation(AI_SEARCH_FILES_CACHE_NAME)
+    future = submit_vector_search(query_string)
+    if future is None:
+        logger.warning("Vector search workers are saturated, using lexical ranking only")
+        return None
+
+    try:
+        matches = future.result(timeout=AI_SEARCH_VECTOR_TIMEOUT_SECONDS)
+    except Exception as error:
+        logger.warning(f"Vector store search unavailable, using lexical ranking only: {error!r}")
+        return None
+
+    store_file_matches(cache_key, matches, generation)
+    return matches
 
 
 @handle_exceptions
-def search_properties(query_string):
-    if not query_string:
-        raise AppException("Search query is required")
-    matches = search_vector_store_for_files(query_string)
-    file_ids = [match["file_id"] for match in matches]
-    property_ids, file_to_property = map_files_to_property_ids(file_ids)
-    if not property_ids:
-        return {"properties": []}
+def map_vector_scores(matches):
+    if matches is None:
+        return None
 
-    vector_rank_map = {property_id: index for index, property_id in enumerate(property_ids)}
-    vector_score_map = {}
+    file_properties = resolve_file_properties([match["file_id"] for match in matches])
+    vector_scores = {}
     for match in matches:
-        file_id = match.get("file_id")
-        score = match.get("score") or 0.0
-        property_id = file_to_property.get(file_id)
+        property_id = file_properties.get(match["file_id"])
         if property_id:
-            vector_score_map[property_id] = max(score, vector_score_map.get(property_id, 0.0))
+            vector_scores[property_id] = max(match["score"], vector_scores.get(property_id, 0.0))
+    return vector_scores
 
-    property_docs = fetch_active_property_docs(property_ids)
-    if not property_docs:
-        return {"properties": []}
 
-    scored_results = []
-    for property_data in property_docs:
-        property_id = str(property_data.get("_id"))
-        score = compute_property_score(property_id, vector_score_map)
-        formatted = format_search_property(property_data)
-        formatted["score"] = round(score, 4)
-        scored_results.append((score, formatted))
+@handle_exceptions
+def fetch_semantic_scores(query_string, property_type=None):
+    if AI_SEARCH_MODE == "local":
+        from src.logics.embedding_index import search_embedding_index
+        vector_scores = search_embedding_index(query_string, AI_SEARCH_CANDIDATES)
+        return vector_scores
+
+    vector_scores = map_vector_scores(fetch_vector_matches(query_string, property_type))
+    return vector_scores
+
+
+@handle_exceptions
+def blend_search_scores(lexical_scores, vector_scores):
+    top_lexical_score = max(lexical_scores.values(), default=0.0)
+    lexical_weight = AI_SEARCH_LEXICAL_WEIGHT if vector_scores is not None else 1.0
+    vector_scores = vector_scores or {}
+    blended_scores = {}
+    for property_id in set(lexical_scores) | set(vector_scores):
+        lexical_part = lexical_scores.get(property_id, 0.0) / top_lexical_score if top_lexical_score else 0.0
+        blended_scores[property_id] = lexical_weight * lexical_part + (1 - lexical_weight) * vector_scores.get(property_id, 0.0)
+    return blended_scores
+
+
+@handle_exceptions
+def record_ai_search(search_mode):
+    with ai_search_lock:
+        ai_search_stats["searches"] += 1
+        ai_search_stats[search_mode] += 1
+        if search_mode == "lexical_only":
+            ai_search_stats["vector_failures"] += 1
+    return True
 
-    scored_results.sort(key=lambda item: item[0], reverse=True)
-    top_properties = [item[1] for item in scored_results[:5]]
+
+@handle_exceptions
+def search_properties(query_string, property_type=None):
+    if not query_string:
+        raise AppException("Search query is required")
+    lexical_scores = search_text_index(query_string, AI_SEARCH_CANDIDATES)
+    vector_scores = fetch_semantic_scores(query_string, property_type)
+    record_ai_search("hybrid" if vector_scores is not None else "lexical_only")
+
+    blended_scores = blend_search_scores(lexical_scores, vector_scores)
+    ranked_ids = sorted(blended_scores, key=lambda property_id: blended_scores[property_id], reverse=True)[:AI_SEARCH_CANDIDATES]
+    property_docs = fetch_active_property_docs(ranked_ids)
+
+    top_properties = []
+    for property_data in property_docs[:AI_SEARCH_RESULT_LIMIT]:
+        formatted = format_search_property(property_data)
+        formatted["score"] = round(blended_scores[formatted["_id"]], 4)
+        top_properties.append(formatted)
 
     result = {
         "properties": top_properties
@@ -588,3 +690,10 @@ def search_properties(query_string):
     return result
 
 
+@handle_exceptions
+def get_ai_search_stats():
+    with ai_search_lock:
+        stats = dict(ai_search_stats)
+    stats["mode"] = AI_SEARCH_MODE
+    stats["vector_timeout_seconds"] = AI_SEARCH_VECTOR_TIMEOUT_SECONDS
+    return stats
@@ -0,0 +1,141 @@
+import re
+import threading
+from src.utils.cache_store import create_cache, cache_get, cache_set, cache_delete, cache_clear, cache_stats
+from src.utils.exception_handler import handle_exceptions
+
+AI_SEARCH_FILES_CACHE_MAX_ENTRIES = 1000
+AI_SEARCH_FILES_CACHE_TTL_SECONDS = 600
+AI_SEARCH_PROPERTY_CACHE_MAX_ENTRIES = 5000
+AI_SEARCH_PROPERTY_CACHE_TTL_SECONDS = 300
+
+AI_SEARCH_FILES_CACHE_NAME = "ai_search_files"
+AI_SEARCH_PROPERTY_CACHE_NAME = "ai_search_properties"
+
+create_cache(AI_SEARCH_FILES_CACHE_NAME, AI_SEARCH_FILES_CACHE_MAX_ENTRIES, AI_SEARCH_FILES_CACHE_TTL_SECONDS)
+create_cache(AI_SEARCH_PROPERTY_CACHE_NAME, AI_SEARCH_PROPERTY_CACHE_MAX_ENTRIES, AI_SEARCH_PROPERTY_CACHE_TTL_SECONDS)
+
+remote_search_lock = threading.Lock()
+remote_search_metrics = {
+    "remote_searches": 0,
+    "remote_search_ms": 0.0,
+    "latency_saved_ms": 0.0
+}
+cache_generations = {
+    AI_SEARCH_FILES_CACHE_NAME: 0,
+    AI_SEARCH_PROPERTY_CACHE_NAME: 0
+}
+
+
+@handle_exceptions
+def normalize_search_query(query_string):
+    normalized_query = " ".join(re.sub(r"[^\w\s]", " ", query_string.lower()).split())
+    return normalized_query
+
+
+@handle_exceptions
+def build_ai_search_cache_key(query_string, property_type=None):
+    cache_key = f"{property_type or 'both'}|{normalize_search_query(query_string)}"
+    return cache_key
+
+
+@handle_exceptions
+def get_cache_generation(cache_name):
+    with remote_search_lock:
+        generation = cache_generations[cache_name]
+    return generation
+
+
+@handle_exceptions
+def bump_cache_generation(cache_name):
+    with remote_search_lock:
+        cache_generations[cache_name] += 1
+    return True
+
+
+@handle_exceptions
+def average_remote_search_ms():
+    with remote_search_lock:
+        remote_searches = remote_search_metrics["remote_searches"]
+        average_ms = remote_search_metrics["remote_search_ms"] / remote_searches if remote_searches else 0.0
+    return average_ms
+
+
+@handle_exceptions
+def get_cached_file_matches(cache_key):
+    cached_matches = cache_get(AI_SEARCH_FILES_CACHE_NAME, cache_key)
+    if cached_matches is not None:
+        saved_ms = average_remote_search_ms()
+        with remote_search_lock:
+            remote_search_metrics["latency_saved_ms"] += saved_ms
+    return cached_matches
+
+
+@handle_exceptions
+def store_file_matches(cache_key, matches, generation):
+    if generation != get_cache_generation(AI_SEARCH_FILES_CACHE_NAME):
+        return False
+
+    cache_set(AI_SEARCH_FILES_CACHE_NAME, cache_key, matches)
+    return True
+
+
+@handle_exceptions
+def record_remote_search(elapsed_ms):
+    with remote_search_lock:
+        remote_search_metrics["remote_searches"] += 1
+        remote_search_metrics["remote_search_ms"] += elapsed_ms
+    return True
+
+
+@handle_exceptions
+def invalidate_ai_search_files():
+    bump_cache_generation(AI_SEARCH_FILES_CACHE_NAME)
+    cache_clear(AI_SEARCH_FILES_CACHE_NAME)
+    return True
+
+
+@handle_exceptions
+def get_cached_property_docs(property_ids):
+    cached_docs = {}
+    missing_ids = []
+    for property_id in property_ids:
+        property_doc = cache_get(AI_SEARCH_PROPERTY_CACHE_NAME, property_id)
+        if property_doc is None:
+            missing_ids.append(property_id)
+        else:
+            cached_docs[property_id] = property_doc
+    return cached_docs, missing_ids
+
+
+@handle_exceptions
+def store_property_docs(property_map, generation):
+    if generation != get_cache_generation(AI_SEARCH_PROPERTY_CACHE_NAME):
+        return False
+
+    for property_id, property_doc in property_map.items():
+        cache_set(AI_SEARCH_PROPERTY_CACHE_NAME, property_id, property_doc)
+    return True
+
+
+@handle_exceptions
+def invalidate_ai_search_property(property_id=None):
+    bump_cache_generation(AI_SEARCH_PROPERTY_CACHE_NAME)
+    if property_id:
+        cache_delete(AI_SEARCH_PROPERTY_CACHE_NAME, str(property_id))
+    else:
+        cache_clear(AI_SEARCH_PROPERTY_CACHE_NAME)
+    return True
+
+
+@handle_exceptions
+def get_ai_search_cache_stats():
+    with remote_search_lock:
+        remote_searches = remote_search_metrics["remote_searches"]
+        stats = {
+            "remote_searches": remote_searches,
+            "average_remote_search_ms": round(remote_search_metrics["remote_search_ms"] / remote_searches, 2) if remote_searches else 0.0,
+            "latency_saved_ms": round(remote_search_metrics["latency_saved_ms"], 2)
+        }
+    stats["file_matches"] = cache_stats(AI_SEARCH_FILES_CACHE_NAME)
+    stats["property_docs"] = cache_stats(AI_SEARCH_PROPERTY_CACHE_NAME)
+    return stats
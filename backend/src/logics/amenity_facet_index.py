@@ -0,0 +1,180 @@
+import threading
+import time
+from bson import ObjectId
+from src.database.db_common_operations import db_find_one
+from src.database.db_amenity_bits import find_active_property_amenity_bits
+from src.utils.amenity_bits import AMENITY_BITS_FIELD, AMENITY_BIT_ORDER, binary_to_mask, count_set_bits, list_set_positions
+from src.utils.exception_handler import handle_exceptions
+
+amenity_facet_state = {
+    "slots": {},
+    "free_slots": [],
+    "row_count": 0,
+    "live_rows": 0,
+    "columns": [0] * len(AMENITY_BIT_ORDER),
+    "type_rows": {},
+    "built": False,
+    "pending_refreshes": set(),
+    "builds": 0,
+    "refreshes": 0,
+    "facet_queries": 0,
+    "last_build_ms": 0.0
+}
+amenity_facet_lock = threading.RLock()
+amenity_facet_build_lock = threading.Lock()
+
+
+@handle_exceptions
+def slots_to_bitset(slots, row_count):
+    bitset_bytes = bytearray((row_count + 7) // 8)
+    for slot in slots:
+        bitset_bytes[slot >> 3] |= 1 << (slot & 7)
+    bitset = int.from_bytes(bitset_bytes, "little")
+    return bitset
+
+
+@handle_exceptions
+def collect_amenity_slots():
+    slots = {}
+    column_slots = [[] for _ in AMENITY_BIT_ORDER]
+    type_slots = {}
+    for property_doc in find_active_property_amenity_bits():
+        slot = len(slots)
+        slots[property_doc["_id"]] = slot
+        type_slots.setdefault(property_doc.get("type"), []).append(slot)
+        for position in list_set_positions(binary_to_mask(property_doc.get(AMENITY_BITS_FIELD))):
+            column_slots[position].append(slot)
+    return slots, column_slots, type_slots
+
+
+@handle_exceptions
+def build_amenity_index_data(slots, column_slots, type_slots):
+    row_count = len(slots)
+    index_data = {
+        "slots": slots,
+        "free_slots": [],
+        "row_count": row_count,
+        "live_rows": (1 << row_count) - 1,
+        "columns": [slots_to_bitset(amenity_slots, row_count) for amenity_slots in column_slots],
+        "type_rows": {property_type: slots_to_bitset(rows, row_count) for property_type, rows in type_slots.items()},
+        "built": True
+    }
+    return index_data
+
+
+@handle_exceptions
+def build_amenity_facet_index():
+    started_at = time.perf_counter()
+    index_data = build_amenity_index_data(*collect_amenity_slots())
+
+    with amenity_facet_lock:
+        amenity_facet_state.update(index_data)
+        amenity_facet_state["builds"] += 1
+        amenity_facet_state["last_build_ms"] = round((time.perf_counter() - started_at) * 1000, 2)
+        pending_refreshes = amenity_facet_state["pending_refreshes"]
+        amenity_facet_state["pending_refreshes"] = set()
+
+    for property_id in pending_refreshes:
+        refresh_amenity_facet_property(property_id)
+    return index_data["row_count"]
+
+
+@handle_exceptions
+def ensure_amenity_facet_index():
+    if amenity_facet_state["built"]:
+        return True
+
+    with amenity_facet_build_lock:
+        if not amenity_facet_state["built"]:
+            build_amenity_facet_index()
+    return True
+
+
+@handle_exceptions
+def remove_amenity_row(property_id):
+    slot = amenity_facet_state["slots"].pop(property_id, None)
+    if slot is None:
+        return False
+
+    keep_mask = ~(1 << slot)
+    amenity_facet_state["columns"] = [column & keep_mask for column in amenity_facet_state["columns"]]
+    amenity_facet_state["type_rows"] = {property_type: rows & keep_mask for property_type, rows in amenity_facet_state["type_rows"].items()}
+    amenity_facet_state["live_rows"] &= keep_mask
+    amenity_facet_state["free_slots"].append(slot)
+    return True
+
+
+@handle_exceptions
+def add_amenity_row(property_id, property_type, amenity_mask):
+    if amenity_facet_state["free_slots"]:
+        slot = amenity_facet_state["free_slots"].pop()
+    else:
+        slot = amenity_facet_state["row_count"]
+        amenity_facet_state["row_count"] += 1
+
+    slot_bit = 1 << slot
+    for position in list_set_positions(amenity_mask):
+        amenity_facet_state["columns"][position] |= slot_bit
+    amenity_facet_state["type_rows"][property_type] = amenity_facet_state["type_rows"].get(property_type, 0) | slot_bit
+    amenity_facet_state["live_rows"] |= slot_bit
+    amenity_facet_state["slots"][property_id] = slot
+    return slot
+
+
+@handle_exceptions
+def refresh_amenity_facet_property(property_id):
+    with amenity_facet_lock:
+        index_built = amenity_facet_state["built"]
+        if not index_built:
+            amenity_facet_state["pending_refreshes"].add(str(property_id))
+    if not index_built:
+        return False
+
+    property_object_id = ObjectId(property_id)
+    property_doc = db_find_one("farmhouses", {"_id": property_object_id}, {"status": 1, "type": 1, AMENITY_BITS_FIELD: 1})
+    is_active = bool(property_doc) and property_doc.get("status") == "active"
+
+    with amenity_facet_lock:
+        remove_amenity_row(property_object_id)
+        if is_active:
+            add_amenity_row(property_object_id, property_doc.get("type"), binary_to_mask(property_doc.get(AMENITY_BITS_FIELD)))
+        amenity_facet_state["refreshes"] += 1
+    return True
+
+
+@handle_exceptions
+def invalidate_amenity_facet_index():
+    with amenity_facet_lock:
+        amenity_facet_state["built"] = False
+    return True
+
+
+@handle_exceptions
+def count_amenity_facets(required_mask, property_type=None):
+    ensure_amenity_facet_index()
+    with amenity_facet_lock:
+        columns = amenity_facet_state["columns"]
+        matching_rows = amenity_facet_state["type_rows"].get(property_type, 0) if property_type else amenity_facet_state["live_rows"]
+        for position in list_set_positions(required_mask):
+            matching_rows &= columns[position]
+        facet_counts = {amenity_name: count_set_bits(column & matching_rows) for amenity_name, column in zip(AMENITY_BIT_ORDER, columns)}
+        amenity_facet_state["facet_queries"] += 1
+
+    amenity_facets = {"total": count_set_bits(matching_rows), "facets": facet_counts}
+    return amenity_facets
+
+
+@handle_exceptions
+def get_amenity_facet_stats():
+    with amenity_facet_lock:
+        stats = {
+            "built": amenity_facet_state["built"],
+            "properties": len(amenity_facet_state["slots"]),
+            "free_slots": len(amenity_facet_state["free_slots"]),
+            "amenities": len(AMENITY_BIT_ORDER),
+            "builds": amenity_facet_state["builds"],
+            "refreshes": amenity_facet_state["refreshes"],
+            "facet_queries": amenity_facet_state["facet_queries"],
+            "last_build_ms": amenity_facet_state["last_build_ms"]
+        }
+    return stats
@@ -0,0 +1,175 @@
+import atexit
+import threading
+import time
+from datetime import datetime
+from src.database.db_owner_analysis_operations import bulk_apply_analytics_increments
+from src.logics.admin_kpi_snapshot_logic import record_analytics_flush
+from src.utils.exception_handler import handle_exceptions
+from src.utils.logger import logger
+
+ANALYTICS_FLUSH_INTERVAL_MS = 2000
+ANALYTICS_FLUSH_MAX_EVENTS = 200
+
+buffer_lock = threading.Lock()
+flush_lock = threading.Lock()
+flush_requested = threading.Event()
+
+buffer_state = {
+    "pending": {},
+    "pending_totals": {},
+    "pending_events": 0,
+    "running": False,
+    "flush_thread": None
+}
+
+flush_metrics = {
+    "flush_count": 0,
+    "failed_flushes": 0,
+    "flushed_events": 0,
+    "last_flush_ms": 0.0,
+    "max_flush_ms": 0.0,
+    "total_flush_ms": 0.0
+}
+
+
+def record_analytics_event(farmhouse_id, counter_name):
+    date_string = datetime.utcnow().strftime("%Y-%m-%d")
+    buffer_key = (str(farmhouse_id), date_string)
+
+    with buffer_lock:
+        counters = buffer_state["pending"].setdefault(buffer_key, {"views": 0, "leads": 0})
+        counters[counter_name] += 1
+        buffer_state["pending_events"] += 1
+        pending_events = buffer_state["pending_events"]
+
+    if not buffer_state["running"]:
+        flush_analytics_buffer()
+    elif pending_events >= ANALYTICS_FLUSH_MAX_EVENTS:
+        flush_requested.set()
+    return True
+
+
+@handle_exceptions
+def record_visit(farmhouse_id):
+    record_analytics_event(farmhouse_id, "views")
+    return True
+
+
+@handle_exceptions
+def record_contact(farmhouse_id):
+    record_analytics_event(farmhouse_id, "leads")
+    return True
+
+
+def drain_pending_increments():
+    with buffer_lock:
+        pending_increments = buffer_state["pending"]
+        pending_totals = buffer_state["pending_totals"]
+        pending_events = buffer_state["pending_events"]
+        buffer_state["pending"] = {}
+        buffer_state["pending_totals"] = {}
+        buffer_state["pending_events"] = 0
+    return pending_increments, pending_totals, pending_events
+
+
+def merge_counters(target, source):
+    for buffer_key, counters in source.items():
+        existing_counters = target.setdefault(buffer_key, {"views": 0, "leads": 0})
+        existing_counters["views"] += counters["views"]
+        existing_counters["leads"] += counters["leads"]
+    return target
+
+
+def requeue_unapplied_work(unapplied_increments, unapplied_totals):
+    requeued_events = sum(counters["views"] + counters["leads"] for counters in unapplied_increments.values())
+    with buffer_lock:
+        merge_counters(buffer_state["pending"], unapplied_increments)
+        merge_counters(buffer_state["pending_totals"], unapplied_totals)
+        buffer_state["pending_events"] += requeued_events
+    return requeued_events
+
+
+def record_flush_metrics(flush_ms, flushed_events):
+    flush_metrics["flush_count"] += 1
+    flush_metrics["flushed_events"] += flushed_events
+    flush_metrics["last_flush_ms"] = flush_ms
+    flush_metrics["total_flush_ms"] += flush_ms
+    flush_metrics["max_flush_ms"] = max(flush_metrics["max_flush_ms"], flush_ms)
+    return True
+
+
+def flush_analytics_buffer():
+    with flush_lock:
+        pending_increments, pending_totals, pending_events = drain_pending_increments()
+        if not pending_increments and not pending_totals:
+            return 0
+
+        started_at = time.perf_counter()
+        try:
+            apply_result = bulk_apply_analytics_increments(pending_increments, pending_totals)
+        except Exception as e:
+            flush_metrics["failed_flushes"] += 1
+            requeue_unapplied_work(pending_increments, pending_totals)
+            logger.error(f"Analytics flush failed, {pending_events} events requeued: {str(e)}")
+            return 0
+
+        requeued_events = requeue_unapplied_work(apply_result["unapplied_increments"], apply_result["unapplied_totals"])
+        if apply_result["unapplied_increments"] or apply_result["unapplied_totals"]:
+            flush_metrics["failed_flushes"] += 1
+            logger.error(f"Analytics flush partly failed, {requeued_events} events and {len(apply_result['unapplied_totals'])} farmhouse totals requeued")
+
+        flush_ms = (time.perf_counter() - started_at) * 1000
+        record_flush_metrics(flush_ms, pending_events - requeued_events)
+        record_analytics_flush(apply_result["applied"])
+    return pending_events - requeued_events
+
+
+def run_flush_loop():
+    flush_interval_seconds = ANALYTICS_FLUSH_INTERVAL_MS / 1000
+    while buffer_state["running"]:
+        flush_requested.wait(flush_interval_seconds)
+        flush_requested.clear()
+        flush_analytics_buffer()
+    return True
+
+
+def start_analytics_buffer():
+    if buffer_state["running"]:
+        return True
+
+    buffer_state["running"] = True
+    flush_thread = threading.Thread(target=run_flush_loop, name="analytics-flush", daemon=True)
+    flush_thread.start()
+    buffer_state["flush_thread"] = flush_thread
+    atexit.register(stop_analytics_buffer)
+    return True
+
+
+def stop_analytics_buffer():
+    if not buffer_state["running"]:
+        return True
+
+    buffer_state["running"] = False
+    flush_requested.set()
+    buffer_state["flush_thread"].join()
+    flush_analytics_buffer()
+    return True
+
+
+def get_analytics_buffer_metrics():
+    with buffer_lock:
+        buffer_depth = len(buffer_state["pending"]) + len(buffer_state["pending_totals"])
+        pending_events = buffer_state["pending_events"]
+
+    flush_count = flush_metrics["flush_count"]
+    buffer_metrics = {
+        "buffer_depth": buffer_depth,
+        "pending_events": pending_events,
+        "flush_count": flush_count,
+        "failed_flushes": flush_metrics["failed_flushes"],
+        "flushed_events": flush_metrics["flushed_events"],
+        "last_flush_ms": round(flush_metrics["last_flush_ms"], 2),
+        "max_flush_ms": round(flush_metrics["max_flush_ms"], 2),
+        "avg_flush_ms": round(flush_metrics["total_flush_ms"] / flush_count, 2) if flush_count else 0.0
+    }
+    return buffer_metrics
@@ -0,0 +1,145 @@
+import threading
+from datetime import datetime, timedelta
+from src.database.db_indexes import CATALOGUE_CHANGE_RETENTION_SECONDS
+from src.database.db_catalogue_change_operations import insert_catalogue_change, find_catalogue_changes_since
+from src.logics.listing_cache_logic import invalidate_listing_cache
+from src.logics.geo_tile_index import refresh_geo_tile_property, invalidate_geo_tile_index
+from src.logics.amenity_facet_index import refresh_amenity_facet_property, invalidate_amenity_facet_index
+from src.logics.text_search_index import refresh_text_search_property, invalidate_text_search_index
+from src.logics.ai_search_cache import invalidate_ai_search_property, invalidate_ai_search_files
+from src.utils.exception_handler import handle_exceptions
+
+CATALOGUE_SYNC_INTERVAL_SECONDS = 5
+CATALOGUE_SYNC_MAX_CHANGES = 500
+CATALOGUE_CHANGE_LOOKBACK_SECONDS = 30
+
+catalogue_sync_state = {
+    "last_polled_at": datetime.utcnow(),
+    "seen_changes": {},
+    "polls": 0,
+    "applied": 0,
+    "full_resyncs": 0
+}
+catalogue_sync_lock = threading.Lock()
+
+
+@handle_exceptions
+def mark_change_seen(change_id, seen_at):
+    with catalogue_sync_lock:
+        catalogue_sync_state["seen_changes"][change_id] = seen_at
+    return True
+
+
+@handle_exceptions
+def publish_catalogue_change(change_kind, property_id=None):
+    change_id = insert_catalogue_change(change_kind, property_id)
+    mark_change_seen(change_id, datetime.utcnow())
+    return change_id
+
+
+@handle_exceptions
+def apply_catalogue_change(property_id=None):
+    invalidate_listing_cache()
+    invalidate_ai_search_property(property_id)
+    if property_id:
+        refresh_geo_tile_property(property_id)
+        refresh_amenity_facet_property(property_id)
+        refresh_text_search_property(property_id)
+    else:
+        invalidate_geo_tile_index()
+        invalidate_amenity_facet_index()
+        invalidate_text_search_index()
+    return True
+
+
+@handle_exceptions
+def notify_catalogue_changed(property_id=None):
+    apply_catalogue_change(property_id)
+    publish_catalogue_change("catalogue", property_id)
+    return True
+
+
+@handle_exceptions
+def apply_ai_files_change(property_id=None):
+    invalidate_ai_search_files()
+    if property_id:
+        refresh_text_search_property(property_id)
+    else:
+        invalidate_text_search_index()
+    return True
+
+
+@handle_exceptions
+def notify_ai_files_changed(property_id):
+    apply_ai_files_change(property_id)
+    publish_catalogue_change("ai_files", property_id)
+    return True
+
+
+REMOTE_CHANGE_HANDLERS = {"catalogue": apply_catalogue_change, "ai_files": apply_ai_files_change}
+
+
+@handle_exceptions
+def resync_catalogue_state():
+    for change_handler in REMOTE_CHANGE_HANDLERS.values():
+        change_handler(None)
+    with catalogue_sync_lock:
+        catalogue_sync_state["full_resyncs"] += 1
+    return True
+
+
+@handle_exceptions
+def apply_remote_changes(changes):
+    with catalogue_sync_lock:
+        new_changes = [change for change in changes if change["_id"] not in catalogue_sync_state["seen_changes"]]
+    needs_resync = len(changes) > CATALOGUE_SYNC_MAX_CHANGES
+    if needs_resync:
+        resync_catalogue_state()
+
+    for change in new_changes:
+        change_handler = REMOTE_CHANGE_HANDLERS.get(change["kind"])
+        if change_handler and not needs_resync:
+            change_handler(change["property_id"])
+        mark_change_seen(change["_id"], change["created_at"])
+    return len(new_changes)
+
+
+@handle_exceptions
+def prune_seen_changes(polled_at):
+    oldest_kept = polled_at - timedelta(seconds=CATALOGUE_CHANGE_LOOKBACK_SECONDS * 2)
+    with catalogue_sync_lock:
+        seen_changes = catalogue_sync_state["seen_changes"]
+        catalogue_sync_state["seen_changes"] = {change_id: seen_at for change_id, seen_at in seen_changes.items() if seen_at >= oldest_kept}
+    return True
+
+
+@handle_exceptions
+def sync_catalogue_changes():
+    polled_at = datetime.utcnow()
+    last_polled_at = catalogue_sync_state["last_polled_at"]
+    if polled_at - last_polled_at > timedelta(seconds=CATALOGUE_CHANGE_RETENTION_SECONDS - CATALOGUE_CHANGE_LOOKBACK_SECONDS):
+        resync_catalogue_state()
+        applied_count = 0
+    else:
+        changes = find_catalogue_changes_since(last_polled_at - timedelta(seconds=CATALOGUE_CHANGE_LOOKBACK_SECONDS), CATALOGUE_SYNC_MAX_CHANGES + 1)
+        applied_count = apply_remote_changes(changes)
+
+    prune_seen_changes(polled_at)
+    with catalogue_sync_lock:
+        catalogue_sync_state["last_polled_at"] = polled_at
+        catalogue_sync_state["polls"] += 1
+        catalogue_sync_state["applied"] += applied_count
+    return applied_count
+
+
+@handle_exceptions
+def get_catalogue_sync_stats():
+    with catalogue_sync_lock:
+        stats = {
+            "last_polled_at": catalogue_sync_state["last_polled_at"].isoformat(),
+            "polls": catalogue_sync_state["polls"],
+            "applied": catalogue_sync_state["applied"],
+            "full_resyncs": catalogue_sync_state["full_resyncs"],
+            "tracked_changes": len(catalogue_sync_state["seen_changes"])
+        }
+    return stats
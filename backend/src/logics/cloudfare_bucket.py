@@ -1,9 +1,22 @@
-import boto3
 from werkzeug.utils import secure_filename
-from src.config import R2_ENDPOINT_URL, R2_ACCESS_KEY_ID, R2_SECRET_ACCESS_KEY, R2_BUCKET_NAME, R2_PUBLIC_URL
+from src.config import R2_BUCKET_NAME, R2_PUBLIC_URL, R2_MAX_UPLOAD_BYTES
 from src.utils.exception_handler import handle_exceptions, AppException
+from src.utils.r2_client import get_r2_client, timed_r2_operation
+from src.logics.image_variants import load_source_image, upload_image_variants, delete_image_variants
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 import base64
-from io import BytesIO
+import re
+import threading
+import time
+
+R2_MULTIPART_PART_SIZE_BYTES = 8 * 1024 * 1024
+R2_UPLOAD_WORKERS = 8
+
+upload_executor_lock = threading.Lock()
+upload_executor_state = {"executor": None}
+BASE64_WHITESPACE_PATTERN = re.compile(r"\s")
+BASE64_CHUNK_PATTERN = re.compile(r"[A-Za-z0-9+/]*={0,2}")
 
 @handle_exceptions
 def get_file_extension(filename):
@@ -14,37 +27,146 @@ def get_file_extension(filename):
 
 @handle_exceptions
 def create_s3_client():
-    s3_client = boto3.client(
-        "s3",
-        endpoint_url=R2_ENDPOINT_URL,
-        aws_access_key_id=R2_ACCESS_KEY_ID,
-        aws_secret_access_key=R2_SECRET_ACCESS_KEY
-    )
+    s3_client = get_r2_client()
     return s3_client
 
 
 @handle_exceptions
-def upload_file_to_r2(file_storage, file_key):
+def iter_file_chunks(file_stream, chunk_size):
+    while True:
+        chunk = file_stream.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+@handle_exceptions
+def decode_base64_chunk(encoded_chunk):
+    if len(encoded_chunk) % 4 or not BASE64_CHUNK_PATTERN.fullmatch(encoded_chunk):
+        raise AppException("Invalid base64 file data", 400)
+    
+    decoded_chunk = base64.b64decode(encoded_chunk)
+    return decoded_chunk
+
+
+@handle_exceptions
+def iter_base64_chunks(base64_string, chunk_size):
+    data_start = base64_string.find(',') + 1
+    if BASE64_WHITESPACE_PATTERN.search(base64_string, data_start):
+        base64_string = "".join(base64_string[data_start:].split())
+        data_start = 0
+    chunk_chars = (chunk_size // 3) * 4
+    
+    for offset in range(data_start, len(base64_string), chunk_chars):
+        yield decode_base64_chunk(base64_string[offset:offset + chunk_chars])
+
+
+@handle_exceptions
+def iter_size_limited_chunks(chunks, max_bytes):
+    total_bytes = 0
+    for chunk in chunks:
+        total_bytes += len(chunk)
+        if total_bytes > max_bytes:
+            raise AppException(f"File exceeds the {max_bytes // (1024 * 1024)} MB upload limit", 413)
+        yield chunk
+
+
+@handle_exceptions
+def upload_multipart_parts(s3_client, file_key, upload_id, first_part, remaining_parts):
+    completed_parts = []
+    part_number = 1
+    part_body = first_part
+    while part_body is not None:
+        uploaded_part = s3_client.upload_part(
+            Bucket=R2_BUCKET_NAME,
+            Key=file_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=part_body
+        )
+        completed_parts.append({"PartNumber": part_number, "ETag": uploaded_part["ETag"]})
+        part_number += 1
+        part_body = next(remaining_parts, None)
+    return completed_parts
+
+
+@handle_exceptions
+def upload_parts_to_multipart(s3_client, file_key, first_part, remaining_parts, content_type):
+    multipart = s3_client.create_multipart_upload(Bucket=R2_BUCKET_NAME, Key=file_key, ContentType=content_type)
+    upload_id = multipart["UploadId"]
+    
+    try:
+        completed_parts = upload_multipart_parts(s3_client, file_key, upload_id, first_part, remaining_parts)
+        s3_client.complete_multipart_upload(
+            Bucket=R2_BUCKET_NAME,
+            Key=file_key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": completed_parts}
+        )
+    except Exception:
+        s3_client.abort_multipart_upload(Bucket=R2_BUCKET_NAME, Key=file_key, UploadId=upload_id)
+        raise
+    
+    part_count = len(completed_parts)
+    return part_count
+
+
+@handle_exceptions
+def stream_chunks_to_r2(chunks, file_key, content_type):
     s3_client = create_s3_client()
+    parts = iter_size_limited_chunks(chunks, R2_MAX_UPLOAD_BYTES)
+    
+    first_part = next(parts, b"")
+    second_part = next(parts, None)
     
-    s3_client.upload_fileobj(
-        file_storage,
-        R2_BUCKET_NAME,
-        file_key,
-        ExtraArgs={"ContentType": file_storage.mimetype}
-    )
+    if second_part is None:
+        with timed_r2_operation("put_object"):
+            s3_client.put_object(Bucket=R2_BUCKET_NAME, Key=file_key, Body=first_part, ContentType=content_type)
+        return True
+    
+    with timed_r2_operation("multipart_upload"):
+        upload_parts_to_multipart(s3_client, file_key, first_part, chain([second_part], parts), content_type)
+    return True
+
+
+@handle_exceptions
+def upload_file_to_r2(file_storage, file_key):
+    chunks = iter_file_chunks(file_storage, R2_MULTIPART_PART_SIZE_BYTES)
+    stream_chunks_to_r2(chunks, file_key, file_storage.mimetype)
     
     public_url = f"{R2_PUBLIC_URL}/{file_key}"
     return public_url
 
 
 @handle_exceptions
-def upload_farmhouse_image_to_r2(file_storage, farmhouse_id, image_index):
+def discard_uploaded_image(public_url):
+    delete_image_variants(public_url)
+    delete_file_from_r2(public_url)
+    return True
+
+
+@handle_exceptions
+def upload_variants_or_discard(source_image, file_key, public_url):
+    variants_uploaded = upload_image_variants(source_image, file_key)
+    if not variants_uploaded:
+        discard_uploaded_image(public_url)
+        raise AppException("Failed to process the uploaded image. Please try again.", 502)
+    return True
+
+
+@handle_exceptions
+def upload_farmhouse_image_to_r2(file_storage, farmhouse_id, image_index, with_variants=True):
     filename = secure_filename(file_storage.filename)
     file_extension = get_file_extension(filename)
     file_key = f"farmhouse/{farmhouse_id}/images/image_{image_index}.{file_extension}"
     
+    source_image = load_source_image(file_storage) if with_variants else None
+    file_storage.seek(0)
     public_url = upload_file_to_r2(file_storage, file_key)
+    
+    if with_variants:
+        upload_variants_or_discard(source_image, file_key, public_url)
+    
     return public_url
 
 
@@ -69,19 +191,8 @@ def extract_key_from_r2_url(url):
 @handle_exceptions
 def overwrite_image_in_r2(base64_string, existing_url):
     file_key = extract_key_from_r2_url(existing_url)
-    header_and_data = base64_string.split(',')
-    base64_data = header_and_data[1] if len(header_and_data) > 1 else header_and_data[0]
-    
-    image_bytes = base64.b64decode(base64_data)
-    image_file = BytesIO(image_bytes)
-    
-    s3_client = create_s3_client()
-    s3_client.upload_fileobj(
-        image_file,
-        R2_BUCKET_NAME,
-        file_key,
-        ExtraArgs={"ContentType": "image/jpeg"}
-    )
+    chunks = iter_base64_chunks(base64_string, R2_MULTIPART_PART_SIZE_BYTES)
+    stream_chunks_to_r2(chunks, file_key, "image/jpeg")
     
     return existing_url
 
@@ -89,19 +200,8 @@ def overwrite_image_in_r2(base64_string, existing_url):
 @handle_exceptions
 def overwrite_document_in_r2(base64_string, existing_url):
     file_key = extract_key_from_r2_url(existing_url)
-    header_and_data = base64_string.split(',')
-    base64_data = header_and_data[1] if len(header_and_data) > 1 else header_and_data[0]
-    
-    document_bytes = base64.b64decode(base64_data)
-    document_file = BytesIO(document_bytes)
-    
-    s3_client = create_s3_client()
-    s3_client.upload_fileobj(
-        document_file,
-        R2_BUCKET_NAME,
-        file_key,
-        ExtraArgs={"ContentType": "application/pdf"}
-    )
+    chunks = iter_base64_chunks(base64_string, R2_MULTIPART_PART_SIZE_BYTES)
+    stream_chunks_to_r2(chunks, file_key, "application/pdf")
     
     return existing_url
 
@@ -111,18 +211,20 @@ def delete_farmhouse_folder_from_r2(farmhouse_id):
     s3_client = create_s3_client()
     folder_prefix = f"farmhouse/{farmhouse_id}/"
     
-    objects_to_delete = s3_client.list_objects_v2(
-        Bucket=R2_BUCKET_NAME,
-        Prefix=folder_prefix
-    )
+    with timed_r2_operation("list_objects"):
+        objects_to_delete = s3_client.list_objects_v2(
+            Bucket=R2_BUCKET_NAME,
+            Prefix=folder_prefix
+        )
     
     if 'Contents' in objects_to_delete:
         delete_keys = [{'Key': obj['Key']} for obj in objects_to_delete['Contents']]
         
-        s3_client.delete_objects(
-            Bucket=R2_BUCKET_NAME,
-            Delete={'Objects': delete_keys}
-        )
+        with timed_r2_operation("delete_objects"):
+            s3_client.delete_objects(
+                Bucket=R2_BUCKET_NAME,
+                Delete={'Objects': delete_keys}
+            )
     
     return True
 
@@ -133,7 +235,10 @@ def upload_admin_property_image_to_r2(file_storage, property_id):
     file_extension = get_file_extension(filename)
     file_key = f"farmhouse/{property_id}/admin_images/{filename}"
     
+    source_image = load_source_image(file_storage)
+    file_storage.seek(0)
     public_url = upload_file_to_r2(file_storage, file_key)
+    upload_variants_or_discard(source_image, file_key, public_url)
     return public_url
 
 
@@ -145,9 +250,76 @@ def delete_file_from_r2(image_url):
     file_key = extract_key_from_r2_url(image_url)
     s3_client = create_s3_client()
     
-    s3_client.delete_object(
-        Bucket=R2_BUCKET_NAME,
-        Key=file_key
-    )
+    with timed_r2_operation("delete"):
+        s3_client.delete_object(
+            Bucket=R2_BUCKET_NAME,
+            Key=file_key
+        )
     
-    return True
\ No newline at end of file
+    return True
+
+
+@handle_exceptions
+def get_upload_executor():
+    with upload_executor_lock:
+        if not upload_executor_state["executor"]:
+            upload_executor_state["executor"] = ThreadPoolExecutor(max_workers=R2_UPLOAD_WORKERS, thread_name_prefix="r2-upload")
+    return upload_executor_state["executor"]
+
+
+@handle_exceptions
+def run_timed_upload(upload_function, args):
+    started_at = time.perf_counter()
+    public_url = upload_function(*args)
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+    return public_url, elapsed_ms
+
+
+@handle_exceptions
+def discard_partial_upload(job, uploaded_url):
+    if job["function"] is upload_farmhouse_image_to_r2:
+        delete_image_variants(uploaded_url)
+    delete_file_from_r2(uploaded_url)
+    return True
+
+
+@handle_exceptions
+def cleanup_partial_uploads(uploaded_jobs):
+    executor = get_upload_executor()
+    futures = [executor.submit(discard_partial_upload, job, uploaded_url) for job, uploaded_url in uploaded_jobs]
+    cleaned_up = all([future.exception() is None for future in futures])
+    return cleaned_up
+
+
+@handle_exceptions
+def collect_upload_results(upload_jobs, futures):
+    uploaded_jobs = []
+    file_timings = []
+    failed_labels = []
+    for job, future in zip(upload_jobs, futures):
+        if future.exception():
+            failed_labels.append(job["label"])
+            continue
+        public_url, elapsed_ms = future.result()
+        uploaded_jobs.append((job, public_url))
+        file_timings.append({"file": job["label"], "ms": round(elapsed_ms, 1)})
+    return uploaded_jobs, file_timings, failed_labels
+
+
+@handle_exceptions
+def upload_files_in_parallel(upload_jobs):
+    started_at = time.perf_counter()
+    executor = get_upload_executor()
+    futures = [executor.submit(run_timed_upload, job["function"], job["args"]) for job in upload_jobs]
+    uploaded_jobs, file_timings, failed_labels = collect_upload_results(upload_jobs, futures)
+
+    if failed_labels:
+        cleanup_partial_uploads(uploaded_jobs)
+        raise AppException(f"Failed to upload {', '.join(failed_labels)}. Please try again.", 502)
+
+    upload_timings = {
+        "total_ms": round((time.perf_counter() - started_at) * 1000, 1),
+        "files": file_timings
+    }
+    uploaded_urls = [uploaded_url for _, uploaded_url in uploaded_jobs]
+    return uploaded_urls, upload_timings
@@ -0,0 +1,290 @@
+import glob
+import hashlib
+import importlib
+import importlib.util
+import json
+import os
+import threading
+import time
+from src.config import AI_SEARCH_MODE, LOCAL_EMBEDDING_MODEL, LOCAL_EMBEDDING_DIR
+from src.database.db_listing_operations import find_active_property_vector_docs
+from src.utils.exception_handler import handle_exceptions, AppException
+from src.utils.logger import logger
+
+LOCAL_EMBEDDING_BATCH_SIZE = 64
+LOCAL_EMBEDDING_SCORE_CHUNK_ROWS = 65536
+LOCAL_EMBEDDING_SYNC_INTERVAL_SECONDS = 60
+EMBED_CHUNK_SIZE = LOCAL_EMBEDDING_BATCH_SIZE * 16
+
+embedding_runtime = {"numpy": None, "sentence_transformers": None, "model": None}
+embedding_state = {
+    "matrix": None,
+    "rows": [],
+    "slots": {},
+    "dimension": 0,
+    "generation": 0,
+    "meta_mtime_ns": None,
+    "reloads": 0,
+    "syncs": 0,
+    "skipped_syncs": 0,
+    "embedded": 0,
+    "removed": 0,
+    "searches": 0,
+    "last_build_ms": 0.0
+}
+embedding_lock = threading.RLock()
+
+
+@handle_exceptions
+def load_optional_module(module_name):
+    if embedding_runtime[module_name] is None:
+        if importlib.util.find_spec(module_name) is None:
+            raise AppException(f"AI_SEARCH_MODE=local needs the {module_name} package installed", 500)
+        embedding_runtime[module_name] = importlib.import_module(module_name)
+    return embedding_runtime[module_name]
+
+
+@handle_exceptions
+def load_embedding_model():
+    if embedding_runtime["model"] is None:
+        sentence_transformers = load_optional_module("sentence_transformers")
+        embedding_runtime["model"] = sentence_transformers.SentenceTransformer(LOCAL_EMBEDDING_MODEL, device="cpu")
+    return embedding_runtime["model"]
+
+
+@handle_exceptions
+def embed_texts(texts):
+    numpy = load_optional_module("numpy")
+    vectors = load_embedding_model().encode(texts, batch_size=LOCAL_EMBEDDING_BATCH_SIZE, normalize_embeddings=True, convert_to_numpy=True, show_progress_bar=False)
+    embedded_vectors = numpy.ascontiguousarray(vectors, dtype=numpy.float32)
+    return embedded_vectors
+
+
+@handle_exceptions
+def build_property_embedding_text(property_doc):
+    from src.logics.ai_logics import build_property_vector_text
+    embedding_text = build_property_vector_text(property_doc)
+    text_hash = hashlib.sha1(embedding_text.encode("utf-8")).hexdigest()
+    return embedding_text, text_hash
+
+
+@handle_exceptions
+def build_embedding_paths(generation=0):
+    paths = {
+        "meta": os.path.join(LOCAL_EMBEDDING_DIR, "meta.json"),
+        "lock": os.path.join(LOCAL_EMBEDDING_DIR, "writer.lock"),
+        "vectors": os.path.join(LOCAL_EMBEDDING_DIR, f"vectors.{generation}.f32")
+    }
+    return paths
+
+
+@handle_exceptions
+def open_vector_matrix(generation, row_count, dimension):
+    numpy = load_optional_module("numpy")
+    if not row_count:
+        return numpy.zeros((0, dimension), dtype=numpy.float32)
+
+    matrix = numpy.memmap(build_embedding_paths(generation)["vectors"], dtype=numpy.float32, mode="r", shape=(row_count, dimension))
+    return matrix
+
+
+@handle_exceptions
+def load_embedding_meta():
+    with open(build_embedding_paths()["meta"], "r", encoding="utf-8") as meta_file:
+        embedding_meta = json.load(meta_file)
+    if embedding_meta.get("model") != LOCAL_EMBEDDING_MODEL:
+        return None
+    return embedding_meta
+
+
+@handle_exceptions
+def reload_embedding_snapshot():
+    meta_path = build_embedding_paths()["meta"]
+    if not os.path.exists(meta_path):
+        return False
+
+    meta_mtime_ns = os.stat(meta_path).st_mtime_ns
+    if meta_mtime_ns == embedding_state["meta_mtime_ns"]:
+        return True
+
+    embedding_meta = load_embedding_meta()
+    if not embedding_meta:
+        return False
+
+    rows = embedding_meta["rows"]
+    matrix = open_vector_matrix(embedding_meta["generation"], len(rows), embedding_meta["dimension"])
+    with embedding_lock:
+        embedding_state.update({"matrix": matrix, "rows": rows, "dimension": embedding_meta["dimension"], "generation": embedding_meta["generation"], "meta_mtime_ns": meta_mtime_ns})
+        embedding_state["slots"] = {row[0]: row_index for row_index, row in enumerate(rows)}
+        embedding_state["reloads"] += 1
+    return True
+
+
+@handle_exceptions
+def acquire_writer_lock():
+    import fcntl
+    os.makedirs(LOCAL_EMBEDDING_DIR, exist_ok=True)
+    lock_file = open(build_embedding_paths()["lock"], "a")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+@handle_exceptions
+def collect_active_entries():
+    active_entries = {}
+    for property_doc in find_active_property_vector_docs():
+        active_entries[str(property_doc["_id"])] = build_property_embedding_text(property_doc)
+    return active_entries
+
+
+@handle_exceptions
+def plan_embedding_rows(active_entries):
+    with embedding_lock:
+        current_rows = {row[0]: (row_index, row[1]) for row_index, row in enumerate(embedding_state["rows"])}
+        has_snapshot = embedding_state["matrix"] is not None
+
+    rows = [[property_id, text_hash] for property_id, (_, text_hash) in active_entries.items()]
+    reused_rows = [(row_index, current_rows[row[0]][0]) for row_index, row in enumerate(rows) if current_rows.get(row[0], (None, None))[1] == row[1]]
+    stale_rows = [(row_index, active_entries[row[0]][0]) for row_index, row in enumerate(rows) if current_rows.get(row[0], (None, None))[1] != row[1]]
+    removed_count = len(set(current_rows) - set(active_entries))
+    is_unchanged = has_snapshot and not stale_rows and not removed_count
+    embedding_plan = {"rows": rows, "reused": reused_rows, "stale": stale_rows, "removed": removed_count, "unchanged": is_unchanged}
+    return embedding_plan
+
+
+@handle_exceptions
+def assemble_embedding_matrix(embedding_plan):
+    numpy = load_optional_module("numpy")
+    dimension = load_embedding_model().get_sentence_embedding_dimension()
+    matrix = numpy.zeros((len(embedding_plan["rows"]), dimension), dtype=numpy.float32)
+    if embedding_plan["reused"]:
+        new_rows, old_rows = zip(*embedding_plan["reused"])
+        with embedding_lock:
+            matrix[list(new_rows)] = embedding_state["matrix"][list(old_rows)]
+
+    stale_rows = embedding_plan["stale"]
+    for chunk_start in range(0, len(stale_rows), EMBED_CHUNK_SIZE):
+        chunk = stale_rows[chunk_start:chunk_start + EMBED_CHUNK_SIZE]
+        matrix[[row_index for row_index, _ in chunk]] = embed_texts([embedding_text for _, embedding_text in chunk])
+    return matrix
+
+
+@handle_exceptions
+def write_embedding_snapshot(rows, matrix):
+    generation = embedding_state["generation"] + 1
+    paths = build_embedding_paths(generation)
+    matrix.tofile(paths["vectors"] + ".tmp")
+    os.replace(paths["vectors"] + ".tmp", paths["vectors"])
+
+    embedding_meta = {"model": LOCAL_EMBEDDING_MODEL, "generation": generation, "dimension": int(matrix.shape[1]), "rows": rows}
+    with open(paths["meta"] + ".tmp", "w", encoding="utf-8") as meta_file:
+        json.dump(embedding_meta, meta_file)
+    os.replace(paths["meta"] + ".tmp", paths["meta"])
+
+    for vectors_path in glob.glob(os.path.join(LOCAL_EMBEDDING_DIR, "vectors.*.f32")):
+        if int(os.path.basename(vectors_path).split(".")[1]) < generation - 1:
+            os.remove(vectors_path)
+    return generation
+
+
+@handle_exceptions
+def rebuild_embedding_snapshot():
+    reload_embedding_snapshot()
+    embedding_plan = plan_embedding_rows(collect_active_entries())
+    if embedding_plan["unchanged"]:
+        return False
+
+    matrix = assemble_embedding_matrix(embedding_plan)
+    write_embedding_snapshot(embedding_plan["rows"], matrix)
+    reload_embedding_snapshot()
+    with embedding_lock:
+        embedding_state["embedded"] += len(embedding_plan["stale"])
+        embedding_state["removed"] += embedding_plan["removed"]
+    return True
+
+
+@handle_exceptions
+def sync_embedding_index():
+    lock_file = acquire_writer_lock()
+    if lock_file is None:
+        embedding_state["skipped_syncs"] += 1
+        return False
+
+    started_at = time.perf_counter()
+    with lock_file:
+        rebuilt = rebuild_embedding_snapshot()
+    with embedding_lock:
+        embedding_state["syncs"] += 1
+        embedding_state["last_build_ms"] = round((time.perf_counter() - started_at) * 1000, 2)
+    return rebuilt
+
+
+@handle_exceptions
+def score_embedding_rows(query_vectors):
+    numpy = load_optional_module("numpy")
+    row_count = len(embedding_state["rows"])
+    scores = numpy.empty((row_count, len(query_vectors)), dtype=numpy.float32)
+    for chunk_start in range(0, row_count, LOCAL_EMBEDDING_SCORE_CHUNK_ROWS):
+        chunk_stop = min(chunk_start + LOCAL_EMBEDDING_SCORE_CHUNK_ROWS, row_count)
+        scores[chunk_start:chunk_stop] = embedding_state["matrix"][chunk_start:chunk_stop] @ query_vectors.T
+    return scores
+
+
+@handle_exceptions
+def select_top_rows(query_scores, top_k):
+    numpy = load_optional_module("numpy")
+    top_rows = numpy.argpartition(-query_scores, top_k - 1)[:top_k]
+    ranked_rows = top_rows[numpy.argsort(-query_scores[top_rows])]
+    return ranked_rows
+
+
+@handle_exceptions
+def rank_embedding_rows(query_vectors, top_k):
+    with embedding_lock:
+        top_k = min(top_k, len(embedding_state["rows"]))
+        if not top_k:
+            return [{} for _ in query_vectors]
+
+        scores = score_embedding_rows(query_vectors)
+        ranked_results = []
+        for query_index in range(len(query_vectors)):
+            ranked_rows = select_top_rows(scores[:, query_index], top_k)
+            ranked_results.append({embedding_state["rows"][row_index][0]: float(scores[row_index, query_index]) for row_index in ranked_rows})
+        embedding_state["searches"] += len(query_vectors)
+    return ranked_results
+
+
+@handle_exceptions
+def search_embedding_index(query_string, top_k):
+    if not reload_embedding_snapshot():
+        logger.warning("Local embedding index has no snapshot yet, using lexical ranking only")
+        return None
+
+    query_vectors = embed_texts([query_string])
+    vector_scores = rank_embedding_rows(query_vectors, top_k)[0]
+    return vector_scores
+
+
+@handle_exceptions
+def get_embedding_index_stats():
+    with embedding_lock:
+        stats = {
+            "mode": AI_SEARCH_MODE,
+            "model": LOCAL_EMBEDDING_MODEL,
+            "built": embedding_state["matrix"] is not None,
+            "properties": len(embedding_state["rows"]),
+            "generation": embedding_state["generation"],
+            "dimension": embedding_state["dimension"],
+            "reloads": embedding_state["reloads"],
+            "syncs": embedding_state["syncs"],
+            "skipped_syncs": embedding_state["skipped_syncs"],
+            "embedded": embedding_state["embedded"],
+            "removed": embedding_state["removed"],
+            "searches": embedding_state["searches"],
+            "last_build_ms": embedding_state["last_build_ms"]
+        }
+    return stats
@@ -1,8 +1,13 @@
+import time
 from datetime import datetime, timedelta
-from bson import ObjectId
+from pymongo import UpdateOne, ReturnDocument
 from ..database import db
 from ..database.db_admin_kpi_operations import save_monthly_admin_analysis
+from .admin_kpi_snapshot_logic import reconcile_admin_kpi_snapshot
 from ..utils.exception_handler import handle_exceptions
+from ..utils.logger import logger
+
+ANALYTICS_ROLLUP_BATCH_SIZE = 500
 
 
 @handle_exceptions
@@ -15,22 +20,27 @@ def get_last_complete_month_string():
 
 
 @handle_exceptions
-def get_all_farmhouses():
-    farmhouses = list(db["farmhouse_analysis"].find({}))
-    return farmhouses
-
-
-@handle_exceptions
-def filter_monthly_data(daily_data, month):
-    month_data = [d for d in daily_data if d.get("date", "").startswith(month)]
-    return month_data
+def build_month_date_filter(month):
+    date_filter = {"date": {"$gte": f"{month}-01", "$lte": f"{month}-31"}}
+    return date_filter
 
 
 @handle_exceptions
-def calculate_monthly_totals(month_data):
-    total_leads = sum(d.get("leads", 0) for d in month_data)
-    total_views = sum(d.get("views", 0) for d in month_data)
-    return total_leads, total_views
+def stream_monthly_totals_by_farmhouse(month, after_farmhouse_id=None):
+    pipeline = [
+        {"$match": build_month_date_filter(month)},
+        {"$group": {
+            "_id": "$farmhouse_id",
+            "total_leads": {"$sum": "$leads"},
+            "total_views": {"$sum": "$views"}
+        }},
+        {"$sort": {"_id": 1}}
+    ]
+    if after_farmhouse_id:
+        pipeline.append({"$match": {"_id": {"$gt": after_farmhouse_id}}})
+
+    cursor = db["farmhouse_daily_analytics"].aggregate(pipeline, allowDiskUse=True, batchSize=ANALYTICS_ROLLUP_BATCH_SIZE)
+    return cursor
 
 
 @handle_exceptions
@@ -45,53 +55,107 @@ def create_last_month_summary(month, total_leads, total_views):
 
 
 @handle_exceptions
-def save_to_last_month_summary(farmhouse_id, summary):
-    result = db["farmhouse_analysis"].update_one(
-        {"_id": farmhouse_id},
+def build_summary_operation(monthly_total, month):
+    summary = create_last_month_summary(month, monthly_total["total_leads"], monthly_total["total_views"])
+    operation = UpdateOne(
+        {"farmhouse_id": monthly_total["_id"]},
         {"$set": {"last_month_summary": summary}}
     )
-    return result.modified_count > 0
+    return operation
 
 
 @handle_exceptions
-def delete_monthly_daily_data(farmhouse_id, month):
-    result = db["farmhouse_analysis"].update_one(
-        {"_id": farmhouse_id},
-        {"$pull": {"daily_analytics": {"date": {"$regex": f"^{month}"}}}}
+def delete_monthly_daily_data(month):
+    result = db["farmhouse_daily_analytics"].delete_many(build_month_date_filter(month))
+    return result.deleted_count
+
+
+@handle_exceptions
+def get_rollup_checkpoint(month):
+    checkpoint = db["analytics_rollup_checkpoints"].find_one_and_update(
+        {"_id": month},
+        {"$setOnInsert": {
+            "stage": "started",
+            "last_farmhouse_id": None,
+            "processed": 0,
+            "started_at": datetime.utcnow()
+        }},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
     )
-    return result.modified_count > 0
+    return checkpoint
+
+
+@handle_exceptions
+def save_rollup_checkpoint(month, fields):
+    fields["updated_at"] = datetime.utcnow()
+    db["analytics_rollup_checkpoints"].update_one({"_id": month}, {"$set": fields})
+    return True
 
 
 @handle_exceptions
-def process_farmhouse_aggregation(farmhouse_doc, month):
-    daily_data = farmhouse_doc.get("daily_analytics", [])
-    month_data = filter_monthly_data(daily_data, month)
-    
-    if not month_data:
-        return False
-    
-    total_leads, total_views = calculate_monthly_totals(month_data)
-    summary = create_last_month_summary(month, total_leads, total_views)
-    
-    farmhouse_id = farmhouse_doc["_id"]
-    save_to_last_month_summary(farmhouse_id, summary)
-    delete_monthly_daily_data(farmhouse_id, month)
-    
+def flush_summary_batch(month, operations, last_farmhouse_id, processed):
+    db["farmhouse_analysis"].bulk_write(operations, ordered=False)
+    save_rollup_checkpoint(month, {"last_farmhouse_id": last_farmhouse_id, "processed": processed})
     return True
 
 
+@handle_exceptions
+def log_rollup_progress(month, processed, started_at):
+    elapsed_seconds = time.perf_counter() - started_at
+    throughput = processed / elapsed_seconds if elapsed_seconds else 0
+    logger.info(f"Monthly rollup {month}: {processed} farmhouses summarised ({throughput:.0f}/s)")
+    return True
+
+
+@handle_exceptions
+def write_monthly_summaries(month, checkpoint):
+    processed = checkpoint.get("processed", 0)
+    last_farmhouse_id = checkpoint.get("last_farmhouse_id")
+    started_at = time.perf_counter()
+    resumed_from = processed
+
+    operations = []
+    for monthly_total in stream_monthly_totals_by_farmhouse(month, last_farmhouse_id):
+        operations.append(build_summary_operation(monthly_total, month))
+        last_farmhouse_id = monthly_total["_id"]
+
+        if len(operations) >= ANALYTICS_ROLLUP_BATCH_SIZE:
+            processed += len(operations)
+            flush_summary_batch(month, operations, last_farmhouse_id, processed)
+            log_rollup_progress(month, processed - resumed_from, started_at)
+            operations = []
+
+    if operations:
+        processed += len(operations)
+        flush_summary_batch(month, operations, last_farmhouse_id, processed)
+        log_rollup_progress(month, processed - resumed_from, started_at)
+
+    return processed
+
+
 @handle_exceptions
 def run_monthly_aggregation():
     month = get_last_complete_month_string()
-    
-    save_monthly_admin_analysis(month)
-    
-    farmhouses = get_all_farmhouses()
-    
-    success_count = 0
-    for farmhouse in farmhouses:
-        result = process_farmhouse_aggregation(farmhouse, month)
-        if result:
-            success_count += 1
-    
-    return success_count
+    checkpoint = get_rollup_checkpoint(month)
+
+    if checkpoint["stage"] == "done":
+        logger.info(f"Monthly rollup {month} already completed, skipping")
+        return checkpoint.get("processed", 0)
+
+    if checkpoint["stage"] == "started":
+        save_monthly_admin_analysis(month)
+        save_rollup_checkpoint(month, {"stage": "summaries"})
+        checkpoint["stage"] = "summaries"
+
+    if checkpoint["stage"] == "summaries":
+        if checkpoint.get("last_farmhouse_id"):
+            logger.info(f"Monthly rollup {month} resuming after {checkpoint['processed']} farmhouses")
+        processed = write_monthly_summaries(month, checkpoint)
+        save_rollup_checkpoint(month, {"stage": "cleanup", "processed": processed})
+        checkpoint["processed"] = processed
+
+    delete_monthly_daily_data(month)
+    save_rollup_checkpoint(month, {"stage": "done", "completed_at": datetime.utcnow()})
+    reconcile_admin_kpi_snapshot()
+    return checkpoint.get("processed", 0)
@@ -0,0 +1,227 @@
+import math
+import threading
+import time
+from bson import ObjectId
+from src.database.db_common_operations import db_find_one
+from src.database.db_listing_operations import find_active_property_points, find_candidate_listing_page, find_listing_page
+from src.utils.cache_store import create_cache, cache_get, cache_set, cache_clear, cache_stats
+from src.utils.exception_handler import handle_exceptions
+
+GEO_TILE_SIZE_DEGREES = 0.1
+GEO_CANDIDATE_CACHE_MAX_ENTRIES = 1000
+GEO_CANDIDATE_CACHE_TTL_SECONDS = 300
+
+GEO_CANDIDATE_CACHE_NAME = "geo_candidates"
+EARTH_RADIUS_METERS = 6378100.0
+MIN_LATITUDE_COSINE = 0.01
+
+create_cache(GEO_CANDIDATE_CACHE_NAME, GEO_CANDIDATE_CACHE_MAX_ENTRIES, GEO_CANDIDATE_CACHE_TTL_SECONDS)
+
+geo_tile_state = {
+    "tiles": {},
+    "entries": {},
+    "built": False,
+    "pending_refreshes": set(),
+    "builds": 0,
+    "refreshes": 0,
+    "geo_near_fallbacks": 0,
+    "last_build_ms": 0.0
+}
+geo_tile_lock = threading.RLock()
+geo_tile_build_lock = threading.Lock()
+
+
+@handle_exceptions
+def build_tile_key(latitude, longitude):
+    tile_key = (math.floor(latitude / GEO_TILE_SIZE_DEGREES), math.floor(longitude / GEO_TILE_SIZE_DEGREES))
+    return tile_key
+
+
+@handle_exceptions
+def haversine_meters(latitude_a, longitude_a, latitude_b, longitude_b):
+    latitude_delta = math.radians(latitude_b - latitude_a)
+    longitude_delta = math.radians(longitude_b - longitude_a)
+    arc = math.sin(latitude_delta / 2) ** 2 + math.cos(math.radians(latitude_a)) * math.cos(math.radians(latitude_b)) * math.sin(longitude_delta / 2) ** 2
+    distance_meters = 2 * EARTH_RADIUS_METERS * math.asin(math.sqrt(arc))
+    return distance_meters
+
+
+@handle_exceptions
+def build_tile_entry(property_doc):
+    geo_point = property_doc.get("location", {}).get("coordinates", {}).get("coordinates") or []
+    if len(geo_point) != 2:
+        return None
+
+    tile_entry = {
+        "latitude": float(geo_point[1]),
+        "longitude": float(geo_point[0]),
+        "type": property_doc.get("type"),
+        "tile": build_tile_key(float(geo_point[1]), float(geo_point[0]))
+    }
+    return tile_entry
+
+
+@handle_exceptions
+def add_tile_entry(tiles, entries, property_id, tile_entry):
+    entries[property_id] = tile_entry
+    tiles.setdefault(tile_entry["tile"], set()).add(property_id)
+    return True
+
+
+@handle_exceptions
+def remove_tile_entry(property_id):
+    tile_entry = geo_tile_state["entries"].pop(property_id, None)
+    if tile_entry:
+        tile_members = geo_tile_state["tiles"].get(tile_entry["tile"], set())
+        tile_members.discard(property_id)
+        if not tile_members:
+            geo_tile_state["tiles"].pop(tile_entry["tile"], None)
+    return True
+
+
+@handle_exceptions
+def build_geo_tile_index():
+    started_at = time.perf_counter()
+    tiles = {}
+    entries = {}
+    for property_doc in find_active_property_points():
+        tile_entry = build_tile_entry(property_doc)
+        if tile_entry:
+            add_tile_entry(tiles, entries, property_doc["_id"], tile_entry)
+
+    with geo_tile_lock:
+        geo_tile_state.update({"tiles": tiles, "entries": entries, "built": True})
+        geo_tile_state["builds"] += 1
+        geo_tile_state["last_build_ms"] = round((time.perf_counter() - started_at) * 1000, 2)
+        pending_refreshes = geo_tile_state["pending_refreshes"]
+        geo_tile_state["pending_refreshes"] = set()
+
+    for property_id in pending_refreshes:
+        refresh_geo_tile_property(property_id)
+    cache_clear(GEO_CANDIDATE_CACHE_NAME)
+    return len(entries)
+
+
+@handle_exceptions
+def ensure_geo_tile_index():
+    if geo_tile_state["built"]:
+        return True
+
+    with geo_tile_build_lock:
+        if not geo_tile_state["built"]:
+            build_geo_tile_index()
+    return True
+
+
+@handle_exceptions
+def refresh_geo_tile_property(property_id):
+    with geo_tile_lock:
+        index_built = geo_tile_state["built"]
+        if not index_built:
+            geo_tile_state["pending_refreshes"].add(str(property_id))
+    if not index_built:
+        return False
+
+    property_object_id = ObjectId(property_id)
+    property_doc = db_find_one("farmhouses", {"_id": property_object_id}, {"status": 1, "type": 1, "location.coordinates": 1})
+    tile_entry = build_tile_entry(property_doc) if property_doc and property_doc.get("status") == "active" else None
+
+    with geo_tile_lock:
+        remove_tile_entry(property_object_id)
+        if tile_entry:
+            add_tile_entry(geo_tile_state["tiles"], geo_tile_state["entries"], property_object_id, tile_entry)
+        geo_tile_state["refreshes"] += 1
+    cache_clear(GEO_CANDIDATE_CACHE_NAME)
+    return True
+
+
+@handle_exceptions
+def invalidate_geo_tile_index():
+    with geo_tile_lock:
+        geo_tile_state["built"] = False
+    cache_clear(GEO_CANDIDATE_CACHE_NAME)
+    return True
+
+
+@handle_exceptions
+def build_covering_tile_keys(search_tile, max_distance_meters):
+    latitude_reach = math.degrees(max_distance_meters / EARTH_RADIUS_METERS)
+    tile_edge_latitude = max(abs(search_tile[0]), abs(search_tile[0] + 1)) * GEO_TILE_SIZE_DEGREES
+    latitude_cosine = max(math.cos(math.radians(min(tile_edge_latitude + latitude_reach, 90))), MIN_LATITUDE_COSINE)
+    longitude_reach = latitude_reach / latitude_cosine
+
+    latitude_tiles = math.ceil(latitude_reach / GEO_TILE_SIZE_DEGREES)
+    longitude_tiles = math.ceil(longitude_reach / GEO_TILE_SIZE_DEGREES)
+    covering_tile_keys = [
+        (search_tile[0] + latitude_offset, search_tile[1] + longitude_offset)
+        for latitude_offset in range(-latitude_tiles, latitude_tiles + 1)
+        for longitude_offset in range(-longitude_tiles, longitude_tiles + 1)
+    ]
+    return covering_tile_keys
+
+
+@handle_exceptions
+def get_tile_candidates(search_tile, max_distance_meters):
+    cache_key = f"{search_tile[0]}:{search_tile[1]}:{max_distance_meters}"
+    candidate_ids = cache_get(GEO_CANDIDATE_CACHE_NAME, cache_key)
+    if candidate_ids is not None:
+        return candidate_ids
+
+    with geo_tile_lock:
+        candidate_ids = [
+            property_id
+            for tile_key in build_covering_tile_keys(search_tile, max_distance_meters)
+            for property_id in geo_tile_state["tiles"].get(tile_key, ())
+        ]
+    cache_set(GEO_CANDIDATE_CACHE_NAME, cache_key, candidate_ids)
+    return candidate_ids
+
+
+@handle_exceptions
+def rank_nearby_properties(search_latitude, search_longitude, max_distance_meters, property_type=None):
+    ensure_geo_tile_index()
+    candidate_ids = get_tile_candidates(build_tile_key(search_latitude, search_longitude), max_distance_meters)
+
+    ranked_properties = []
+    with geo_tile_lock:
+        for property_id in candidate_ids:
+            tile_entry = geo_tile_state["entries"].get(property_id)
+            if not tile_entry or (property_type and tile_entry["type"] != property_type):
+                continue
+            distance_meters = haversine_meters(search_latitude, search_longitude, tile_entry["latitude"], tile_entry["longitude"])
+            if distance_meters <= max_distance_meters:
+                ranked_properties.append((distance_meters, property_id))
+
+    ranked_properties.sort()
+    return ranked_properties
+
+
+@handle_exceptions
+def find_nearby_listing_page(query_filter, projection, search_latitude, search_longitude, max_distance_meters, page_size=None, page_token=None):
+    ranked_properties = rank_nearby_properties(search_latitude, search_longitude, max_distance_meters, query_filter.get("type"))
+    properties_page = find_candidate_listing_page(query_filter, projection, ranked_properties, page_size, page_token)
+    if properties_page is not None:
+        return properties_page
+
+    search_point = {"type": "Point", "coordinates": [search_longitude, search_latitude]}
+    properties_page = find_listing_page(query_filter, projection, search_point, max_distance_meters, page_size, page_token)
+    with geo_tile_lock:
+        geo_tile_state["geo_near_fallbacks"] += 1
+    return properties_page
+
+
+@handle_exceptions
+def get_geo_tile_stats():
+    with geo_tile_lock:
+        stats = {
+            "built": geo_tile_state["built"],
+            "properties": len(geo_tile_state["entries"]),
+            "tiles": len(geo_tile_state["tiles"]),
+            "builds": geo_tile_state["builds"],
+            "refreshes": geo_tile_state["refreshes"],
+            "geo_near_fallbacks": geo_tile_state["geo_near_fallbacks"],
+            "last_build_ms": geo_tile_state["last_build_ms"],
+            "tile_size_degrees": GEO_TILE_SIZE_DEGREES
+        }
+    stats["candidate_cache"] = cache_stats(GEO_CANDIDATE_CACHE_NAME)
+    return stats
@@ -0,0 +1,125 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from PIL import Image, ImageOps
+from src.config import R2_BUCKET_NAME, R2_PUBLIC_URL
+from src.utils.exception_handler import handle_exceptions, AppException
+from src.utils.r2_client import get_r2_client, timed_r2_operation
+
+IMAGE_VARIANT_WIDTHS = {"thumbnail": 320, "card": 640, "detail": 1280}
+IMAGE_VARIANT_QUALITY = {"jpeg": 80, "webp": 75}
+IMAGE_VARIANT_WORKERS = 4
+
+IMAGE_VARIANT_FORMATS = {
+    "jpeg": {"extension": "jpg", "content_type": "image/jpeg"},
+    "webp": {"extension": "webp", "content_type": "image/webp"}
+}
+
+variant_executor_lock = threading.Lock()
+variant_executor_state = {"executor": None}
+
+
+@handle_exceptions
+def get_variant_executor():
+    with variant_executor_lock:
+        if not variant_executor_state["executor"]:
+            variant_executor_state["executor"] = ThreadPoolExecutor(max_workers=IMAGE_VARIANT_WORKERS, thread_name_prefix="image-variants")
+    return variant_executor_state["executor"]
+
+
+@handle_exceptions
+def build_variant_key(file_key, variant_name, image_format):
+    folder, _, filename = file_key.rpartition("/")
+    stem = filename.rsplit(".", 1)[0]
+    extension = IMAGE_VARIANT_FORMATS[image_format]["extension"]
+    variant_key = f"{folder}/variants/{stem}_{variant_name}.{extension}"
+    return variant_key
+
+
+@handle_exceptions
+def build_image_variant_entry(original_url):
+    file_key = original_url.replace(R2_PUBLIC_URL + "/", "")
+    variants = {}
+    for variant_name, width in IMAGE_VARIANT_WIDTHS.items():
+        variants[variant_name] = {"width": width}
+        for image_format in IMAGE_VARIANT_FORMATS:
+            variants[variant_name][image_format] = f"{R2_PUBLIC_URL}/{build_variant_key(file_key, variant_name, image_format)}"
+
+    variant_entry = {"original": original_url, "variants": variants}
+    return variant_entry
+
+
+@handle_exceptions
+def build_image_srcset(variant_entry):
+    srcset = {}
+    for image_format in IMAGE_VARIANT_FORMATS:
+        candidates = [f"{variant[image_format]} {variant['width']}w" for variant in variant_entry["variants"].values()]
+        srcset[image_format] = ", ".join(candidates)
+    return srcset
+
+
+@handle_exceptions
+def load_source_image(image_source):
+    try:
+        source_image = Image.open(image_source)
+        source_image = ImageOps.exif_transpose(source_image)
+        source_image.load()
+    except Exception:
+        raise AppException("Uploaded file is not a readable image", 400)
+
+    if source_image.mode != "RGB":
+        source_image = source_image.convert("RGB")
+    return source_image
+
+
+@handle_exceptions
+def resize_to_width(source_image, width):
+    if source_image.width <= width:
+        return source_image
+    height = round(source_image.height * width / source_image.width)
+    resized_image = source_image.resize((width, height), Image.LANCZOS)
+    return resized_image
+
+
+@handle_exceptions
+def render_and_upload_variant(source_image, file_key, variant_name, width):
+    resized_image = resize_to_width(source_image, width)
+    s3_client = get_r2_client()
+
+    for image_format, format_info in IMAGE_VARIANT_FORMATS.items():
+        buffer = BytesIO()
+        resized_image.save(buffer, format=image_format.upper(), quality=IMAGE_VARIANT_QUALITY[image_format], optimize=True)
+        with timed_r2_operation("put_variant"):
+            s3_client.put_object(
+                Bucket=R2_BUCKET_NAME,
+                Key=build_variant_key(file_key, variant_name, image_format),
+                Body=buffer.getvalue(),
+                ContentType=format_info["content_type"]
+            )
+    return True
+
+
+@handle_exceptions
+def upload_image_variants(source_image, file_key):
+    executor = get_variant_executor()
+    futures = [
+        executor.submit(render_and_upload_variant, source_image, file_key, variant_name, width)
+        for variant_name, width in IMAGE_VARIANT_WIDTHS.items()
+    ]
+
+    variants_uploaded = all([future.exception() is None for future in futures])
+    return variants_uploaded
+
+
+@handle_exceptions
+def delete_image_variants(original_url):
+    file_key = original_url.replace(R2_PUBLIC_URL + "/", "")
+    delete_keys = [
+        {"Key": build_variant_key(file_key, variant_name, image_format)}
+        for variant_name in IMAGE_VARIANT_WIDTHS
+        for image_format in IMAGE_VARIANT_FORMATS
+    ]
+
+    with timed_r2_operation("delete_objects"):
+        get_r2_client().delete_objects(Bucket=R2_BUCKET_NAME, Delete={"Objects": delete_keys})
+    return True
@@ -0,0 +1,67 @@
+import json
+from src.utils.cache_store import create_cache, cache_get, cache_set, cache_clear, cache_stats
+from src.utils.exception_handler import handle_exceptions
+
+LISTING_CACHE_TTL_SECONDS = 60
+LISTING_CACHE_MAX_ENTRIES = 500
+LISTING_CACHE_COORDINATE_PRECISION = 3
+
+LISTING_CACHE_NAME = "listing"
+
+create_cache(LISTING_CACHE_NAME, LISTING_CACHE_MAX_ENTRIES, LISTING_CACHE_TTL_SECONDS)
+
+
+@handle_exceptions
+def normalize_guest_count(guest_count):
+    if not guest_count or isinstance(guest_count, str):
+        return None
+    return guest_count
+
+
+@handle_exceptions
+def snap_coordinate(coordinate):
+    if coordinate is None:
+        return None
+
+    snapped_coordinate = round(float(coordinate), LISTING_CACHE_COORDINATE_PRECISION)
+    return snapped_coordinate
+
+
+@handle_exceptions
+def build_listing_cache_key(query_filter, guest_counts, search_latitude, search_longitude, max_distance_km, check_in_date, check_out_date, view="full", page_key=None, amenity_mask=0):
+    key_data = {
+        "view": view,
+        "amenities": amenity_mask,
+        "page": page_key,
+        "filter": query_filter,
+        "guests": [normalize_guest_count(count) for count in guest_counts],
+        "point": [search_latitude, search_longitude],
+        "distance_km": max_distance_km,
+        "dates": [check_in_date, check_out_date] if check_in_date and check_out_date else None
+    }
+    cache_key = json.dumps(key_data, sort_keys=True, default=str)
+    return cache_key
+
+
+@handle_exceptions
+def get_cached_listing(cache_key):
+    cached_listing = cache_get(LISTING_CACHE_NAME, cache_key)
+    return cached_listing
+
+
+@handle_exceptions
+def store_listing(cache_key, listing):
+    cache_set(LISTING_CACHE_NAME, cache_key, listing)
+    return True
+
+
+@handle_exceptions
+def invalidate_listing_cache():
+    cache_clear(LISTING_CACHE_NAME)
+    return True
+
+
+@handle_exceptions
+def get_listing_cache_stats():
+    stats = cache_stats(LISTING_CACHE_NAME)
+    return stats
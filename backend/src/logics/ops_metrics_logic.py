@@ -0,0 +1,28 @@
+from src.logics.listing_cache_logic import get_listing_cache_stats
+from src.logics.analytics_event_buffer import get_analytics_buffer_metrics
+from src.logics.recharge_executor import get_recharge_metrics
+from src.logics.geo_tile_index import get_geo_tile_stats
+from src.logics.catalogue_events import get_catalogue_sync_stats
+from src.logics.amenity_facet_index import get_amenity_facet_stats
+from src.logics.text_search_index import get_text_search_stats
+from src.logics.ai_logics import get_ai_search_stats, get_vector_store_handle_stats
+from src.logics.ai_search_cache import get_ai_search_cache_stats
+from src.logics.embedding_index import get_embedding_index_stats
+from src.logics.vector_reindex_queue import get_vector_reindex_metrics
+from src.utils.exception_handler import handle_exceptions
+from src.utils.r2_client import get_r2_metrics
+
+
+@handle_exceptions
+def get_ops_metrics():
+    ops_metrics = {
+        "listing_cache": get_listing_cache_stats(),
+        "geo_tile_index": get_geo_tile_stats(),
+        "catalogue_sync": get_catalogue_sync_stats(),
+        "amenity_facet_index": get_amenity_facet_stats(),
+        "ai_search": {**get_ai_search_stats(), "text_index": get_text_search_stats(), "cache": get_ai_search_cache_stats(), "embedding_index": get_embedding_index_stats(), "reindex_queue": get_vector_reindex_metrics(), "vector_store": get_vector_store_handle_stats()},
+        "analytics_buffer": get_analytics_buffer_metrics(),
+        "recharge_executor": get_recharge_metrics(),
+        "r2": get_r2_metrics()
+    }
+    return ops_metrics
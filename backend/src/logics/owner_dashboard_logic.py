@@ -1,8 +1,9 @@
-from src.database.db_owner_analysis_operations import *
-from src.database.db_payment_operations import get_farmhouse_credit_balance
+from src.database.db_owner_analysis_operations import find_dashboard_analytics, check_summary_month
 from src.database.db_common_operations import db_aggregate, db_find_one, db_update_one
 from src.utils.exception_handler import handle_exceptions, AppException
-from src.config import JWT_SECRET_KEY
+from src.logics.catalogue_events import notify_catalogue_changed
+from src.utils.availability_calendar import BOOKED_DAYS_FIELD, build_month_masks, build_book_days_update, build_unbook_days_update, decode_booked_days
+from src.config import JWT_SECRET_KEY, LEAD_COST_RUPEES
 from bson import ObjectId
 from datetime import datetime, timedelta
 from functools import wraps
@@ -39,86 +40,114 @@ def get_total_cost_given(farmhouse_id):
 
 
 @handle_exceptions
-def get_total_spend_money(farmhouse_id):
-    total_leads = get_total_contacts(farmhouse_id)
-    total_spend_money = total_leads * 40
-    return total_spend_money
+def generate_custom_farmhouse_id(mongodb_id):
+    short_id = str(mongodb_id)[-6:].upper()
+    custom_id = f"FH-{short_id}"
+    return custom_id
 
 
 @handle_exceptions
-def get_this_month_money_spend(farmhouse_id):
-    this_month_leads = get_this_month_leads(farmhouse_id)
-    this_month_money_spend = this_month_leads * 40
-    return this_month_money_spend
+def get_dashboard_farmhouse(farmhouse_id):
+    projection = {"name": 1, "status": 1, "credit_balance": 1, "owner_details.owner_name": 1}
+    farmhouse_doc = db_find_one("farmhouses", {"_id": ObjectId(farmhouse_id)}, projection)
+
+    if not farmhouse_doc:
+        raise AppException("Farmhouse not found")
+
+    return farmhouse_doc
 
 
 @handle_exceptions
-def generate_custom_farmhouse_id(mongodb_id):
-    short_id = str(mongodb_id)[-6:].upper()
-    custom_id = f"FH-{short_id}"
-    return custom_id
+def get_dashboard_windows(today):
+    last_7_days = [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(6, -1, -1)]
+    this_month_start = today.replace(day=1)
+    last_month_start = (this_month_start - timedelta(days=1)).replace(day=1)
+
+    windows = {
+        "last_7_days": last_7_days,
+        "this_month": this_month_start.strftime("%Y-%m"),
+        "last_month": last_month_start.strftime("%Y-%m"),
+        "series_start": min(last_month_start.strftime("%Y-%m-%d"), last_7_days[0])
+    }
+    return windows
 
 
 @handle_exceptions
-def get_dashboard_kpis(farmhouse_id):
-    this_month_money_spend = get_this_month_money_spend(farmhouse_id)
-    this_month_leads = get_this_month_leads(farmhouse_id)
-    last_month_leads = get_last_month_leads(farmhouse_id)
-    this_month_views = get_this_month_views(farmhouse_id)
-    last_month_views = get_last_month_views(farmhouse_id)
-    leads_last_7_days = get_contacts_last_7_days(farmhouse_id)
-    
-    total_money_spent = get_total_spend_money(farmhouse_id)
-    total_leads = get_total_contacts(farmhouse_id)
-    total_views = get_total_visits(farmhouse_id)
-    total_rating = 0
-    
-    total_cost_given = get_total_cost_given(farmhouse_id)
-    total_cost_left = get_farmhouse_credit_balance(farmhouse_id)
-    
-    farmhouse_doc = db_find_one("farmhouses", {"_id": ObjectId(farmhouse_id)})
-    owner_name = farmhouse_doc.get("owner_details", {}).get("owner_name", "N/A") if farmhouse_doc else "N/A"
-    custom_farmhouse_id = generate_custom_farmhouse_id(farmhouse_id)
-    
+def reduce_daily_series(daily_analytics, windows):
+    last_7_days_index = {date_str: i for i, date_str in enumerate(windows["last_7_days"])}
+    reduced = {
+        "this_month_leads": 0,
+        "this_month_views": 0,
+        "last_month_leads": 0,
+        "last_month_views": 0,
+        "leads_last_7_days": 0,
+        "daily_leads": [0] * 7,
+        "daily_views": [0] * 7
+    }
+
+    for day in daily_analytics:
+        date_str = day.get("date", "")
+        leads = day.get("leads", 0)
+        views = day.get("views", 0)
+        month_str = date_str[:7]
+
+        if month_str == windows["this_month"]:
+            reduced["this_month_leads"] += leads
+            reduced["this_month_views"] += views
+        elif month_str == windows["last_month"]:
+            reduced["last_month_leads"] += leads
+            reduced["last_month_views"] += views
+
+        day_index = last_7_days_index.get(date_str)
+        if day_index is not None:
+            reduced["leads_last_7_days"] += leads
+            reduced["daily_leads"][day_index] += leads
+            reduced["daily_views"][day_index] += views
+
+    return reduced
+
+
+@handle_exceptions
+def apply_last_month_summary(reduced, last_month_summary, last_month):
+    month_data = check_summary_month(last_month_summary, last_month)
+    if month_data:
+        reduced["last_month_leads"] = month_data.get("total_leads", 0)
+        reduced["last_month_views"] = month_data.get("total_views", 0)
+    return reduced
+
+
+@handle_exceptions
+def build_dashboard_kpis(farmhouse_id, farmhouse_doc, analytics_doc, reduced, total_cost_given):
+    total_leads = analytics_doc.get("total_leads", 0)
+    total_views = analytics_doc.get("total_views", 0)
+    owner_name = farmhouse_doc.get("owner_details", {}).get("owner_name", "N/A")
+
     kpis_data = {
         "row1_kpis": {
-            "this_month_money_spend": this_month_money_spend,
-            "this_month_leads": this_month_leads,
-            "last_month_leads": last_month_leads,
-            "this_month_views": this_month_views,
-            "last_month_views": last_month_views,
-            "leads_last_7_days": leads_last_7_days
+            "this_month_money_spend": reduced["this_month_leads"] * LEAD_COST_RUPEES,
+            "this_month_leads": reduced["this_month_leads"],
+            "last_month_leads": reduced["last_month_leads"],
+            "this_month_views": reduced["this_month_views"],
+            "last_month_views": reduced["last_month_views"],
+            "leads_last_7_days": reduced["leads_last_7_days"]
         },
         "row2_kpis": {
-            "total_money_spent": total_money_spent,
+            "total_money_spent": total_leads * LEAD_COST_RUPEES,
             "total_leads": total_leads,
             "total_views": total_views,
-            "total_rating": total_rating
+            "total_rating": 0
         },
         "payment_kpis": {
             "total_cost_given": total_cost_given,
-            "total_cost_left": total_cost_left
+            "total_cost_left": farmhouse_doc.get("credit_balance", 0)
         },
         "owner_info": {
             "name": owner_name,
-            "farmhouse_id": custom_farmhouse_id
+            "farmhouse_id": generate_custom_farmhouse_id(farmhouse_id)
         }
     }
-    
-    return kpis_data
 
-
-@handle_exceptions
-def get_leads_vs_views_graph(farmhouse_id):
-    total_views = get_total_visits(farmhouse_id)
-    total_leads = get_total_contacts(farmhouse_id)
-    
-    graph_data = {
-        "total_views": total_views,
-        "total_leads": total_leads
-    }
-    
-    return graph_data
+    return kpis_data
 
 
 @handle_exceptions
@@ -137,24 +166,27 @@ def get_day_labels_last_7_days():
 
 @handle_exceptions
 def get_owner_dashboard_data(farmhouse_id):
-    kpis = get_dashboard_kpis(farmhouse_id)
-    graph = get_leads_vs_views_graph(farmhouse_id)
-    daily_leads = get_daily_leads_last_7_days(farmhouse_id)
-    daily_views = get_daily_views_last_7_days(farmhouse_id)
-    day_labels = get_day_labels_last_7_days()
-    
-    farmhouse_doc = db_find_one("farmhouses", {"_id": ObjectId(farmhouse_id)})
-    farmhouse_name = farmhouse_doc.get("name", "N/A") if farmhouse_doc else "N/A"
-    farmhouse_status = farmhouse_doc.get("status", "unknown") if farmhouse_doc else "unknown"
-    
+    windows = get_dashboard_windows(datetime.utcnow())
+
+    farmhouse_doc = get_dashboard_farmhouse(farmhouse_id)
+    analytics_doc = find_dashboard_analytics(farmhouse_id, windows["series_start"])
+    total_cost_given = get_total_cost_given(farmhouse_id)
+
+    reduced = reduce_daily_series(analytics_doc.get("daily_analytics", []), windows)
+    reduced = apply_last_month_summary(reduced, analytics_doc.get("last_month_summary"), windows["last_month"])
+    kpis = build_dashboard_kpis(farmhouse_id, farmhouse_doc, analytics_doc, reduced, total_cost_given)
+
     dashboard_data = {
         "kpis": kpis,
-        "leads_vs_views_graph": graph,
-        "daily_leads_last_7_days": daily_leads,
-        "daily_views_last_7_days": daily_views,
-        "day_labels": day_labels,
-        "farmhouse_name": farmhouse_name,
-        "farmhouse_status": farmhouse_status
+        "leads_vs_views_graph": {
+            "total_views": kpis["row2_kpis"]["total_views"],
+            "total_leads": kpis["row2_kpis"]["total_leads"]
+        },
+        "daily_leads_last_7_days": reduced["daily_leads"],
+        "daily_views_last_7_days": reduced["daily_views"],
+        "day_labels": get_day_labels_last_7_days(),
+        "farmhouse_name": farmhouse_doc.get("name", "N/A"),
+        "farmhouse_status": farmhouse_doc.get("status", "unknown")
     }
     
     return dashboard_data
@@ -162,12 +194,12 @@ def get_owner_dashboard_data(farmhouse_id):
 
 @handle_exceptions
 def get_booked_dates(farmhouse_id):
-    farmhouse = db_find_one("farmhouses", {"_id": ObjectId(farmhouse_id)})
+    farmhouse = db_find_one("farmhouses", {"_id": ObjectId(farmhouse_id)}, {BOOKED_DAYS_FIELD: 1})
     
     if not farmhouse:
         raise AppException("Farmhouse not found")
     
-    booked_dates = farmhouse.get("booked_dates", [])
+    booked_dates = decode_booked_days(farmhouse.get(BOOKED_DAYS_FIELD))
     
     return {
         "booked_dates": booked_dates
@@ -186,15 +218,15 @@ def add_booked_date(farmhouse_id, date_string):
         raise AppException("Cannot book past dates")
     
     query_filter = {"_id": ObjectId(farmhouse_id)}
-    update_data = {
-        "$addToSet": {"booked_dates": date_string}
-    }
+    update_data = build_book_days_update(build_month_masks(date_obj, date_obj))
     
     result = db_update_one("farmhouses", query_filter, update_data)
     
     if not result:
         raise AppException("Failed to add booked date")
     
+    notify_catalogue_changed(farmhouse_id)
+    
     return {
         "success": True,
         "message": "Date marked as booked",
@@ -205,20 +237,20 @@ def add_booked_date(farmhouse_id, date_string):
 @handle_exceptions
 def remove_booked_date(farmhouse_id, date_string):
     try:
-        datetime.strptime(date_string, "%Y-%m-%d")
+        date_obj = datetime.strptime(date_string, "%Y-%m-%d")
     except ValueError:
         raise AppException("Invalid date format. Use YYYY-MM-DD")
     
     query_filter = {"_id": ObjectId(farmhouse_id)}
-    update_data = {
-        "$pull": {"booked_dates": date_string}
-    }
+    update_data = build_unbook_days_update(build_month_masks(date_obj, date_obj))
     
     result = db_update_one("farmhouses", query_filter, update_data)
     
     if not result:
         raise AppException("Failed to remove booked date")
     
+    notify_catalogue_changed(farmhouse_id)
+    
     return {
         "success": True,
         "message": "Date unmarked",
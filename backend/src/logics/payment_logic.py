@@ -1,9 +1,17 @@
 import razorpay
 import hmac
 import hashlib
+import time
+import requests
 from src.config import RAZORPAY_KEY_ID, RAZORPAY_KEY_SECRET, AUTO_PAYMENT_THRESHOLD, AUTO_PAYMENT_AMOUNT
 from src.database.db_payment_operations import create_payment_record, update_payment_order_id, get_payment_by_order_id, update_payment_success, update_payment_failed, add_credits_to_farmhouse, get_farmhouse_credit_balance
+from src.logics.admin_kpi_snapshot_logic import record_successful_payment
+from src.logics.recharge_executor import record_recharge_retry
 from src.utils.exception_handler import handle_exceptions, AppException
+from src.utils.logger import logger
+
+RECHARGE_MAX_RETRIES = 3
+RECHARGE_RETRY_BACKOFF_SECONDS = 1
 
 
 @handle_exceptions
@@ -130,6 +138,7 @@ def process_payment_success(order_id, payment_id, signature):
     
     update_payment_success(order_id, payment_id, signature)
     add_credits_to_farmhouse(farmhouse_id, amount)
+    record_successful_payment(amount)
     
     extract_and_save_payment_method(farmhouse_id, payment_id)
     
@@ -153,104 +162,139 @@ def check_and_trigger_auto_payment(farmhouse_id):
     return None
 
 
+RETRYABLE_RAZORPAY_ERRORS = (razorpay.errors.GatewayError, razorpay.errors.ServerError, requests.exceptions.ConnectionError)
+ORDER_PAYMENT_STATUSES = ("created", "authorized", "captured")
+
+
 @handle_exceptions
-def process_auto_recharge_payment(farmhouse_id):
+def create_auto_recharge_order(razorpay_client, farmhouse_id, customer_id):
+    order_data = {
+        "amount": int(AUTO_PAYMENT_AMOUNT * 100),
+        "currency": "INR",
+        "receipt": f"auto_{farmhouse_id}_{int(time.time())}",
+        "customer_id": customer_id
+    }
+    razorpay_order = razorpay_client.order.create(data=order_data)
+    order_id = razorpay_order.get("id")
+    return order_id
+
+
+@handle_exceptions
+def find_order_payment(razorpay_client, order_id):
+    order_payments = razorpay_client.order.payments(order_id).get("items", [])
+    existing_payment = next((payment for payment in order_payments if payment.get("status") in ORDER_PAYMENT_STATUSES), None)
+    return existing_payment
+
+
+@handle_exceptions
+def create_recurring_payment_with_retry(razorpay_client, payment_data):
+    attempt = 0
+    while True:
+        existing_payment = find_order_payment(razorpay_client, payment_data["order_id"]) if attempt else None
+        if existing_payment:
+            return existing_payment
+        try:
+            payment_response = razorpay_client.payment.createRecurring(payment_data)
+            return payment_response
+        except RETRYABLE_RAZORPAY_ERRORS:
+            if attempt >= RECHARGE_MAX_RETRIES:
+                raise
+            record_recharge_retry()
+            time.sleep(RECHARGE_RETRY_BACKOFF_SECONDS * (2 ** attempt))
+            attempt += 1
+
+
+@handle_exceptions
+def get_auto_recharge_method(farmhouse_id):
     from bson import ObjectId
     from src.database import db
-    from datetime import datetime
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
-    farmhouse = db.farmhouses.find_one({"_id": ObjectId(farmhouse_id)})
     
+    farmhouse = db.farmhouses.find_one({"_id": ObjectId(farmhouse_id)}, {"payment_method": 1})
     if not farmhouse:
         logger.error(f"Farmhouse not found: {farmhouse_id}")
-        return False
+        return None
     
     payment_method = farmhouse.get('payment_method', {})
-    
     if not payment_method.get('auto_recharge_enabled'):
         logger.info(f"Auto-recharge disabled for: {farmhouse_id}")
-        return False
+        return None
     
-    razorpay_token = payment_method.get('razorpay_token')
-    if not razorpay_token:
+    if not payment_method.get('razorpay_token'):
         logger.warning(f"No payment token for: {farmhouse_id}")
-        return False
+        return None
+    return payment_method
+
+
+@handle_exceptions
+def charge_auto_recharge(farmhouse_id, payment_method):
+    razorpay_client = create_razorpay_client()
+    customer_id = payment_method.get('razorpay_customer_id')
+    order_id = create_auto_recharge_order(razorpay_client, farmhouse_id, customer_id)
     
-    try:
-        razorpay_client = create_razorpay_client()
-        
-        payment_response = razorpay_client.payment.createRecurring({
-            "amount": int(AUTO_PAYMENT_AMOUNT * 100),
-            "currency": "INR",
-            "token": razorpay_token
-        })
-        
-        payment_id = payment_response.get('id')
-        
-        db.payments.insert_one({
-            "farmhouse_id": ObjectId(farmhouse_id),
-            "payment_id": payment_id,
-            "order_id": None,
-            "signature": None,
-            "verified": True,
-            "status": "success",
-            "amount": AUTO_PAYMENT_AMOUNT,
-            "type": "auto_recharge",
-            "created_at": datetime.utcnow()
-        })
-        
-        db.farmhouses.update_one(
-            {"_id": ObjectId(farmhouse_id)},
-            {
-                "$inc": {
-                    "credit_balance": AUTO_PAYMENT_AMOUNT,
-                    "payment_method.total_auto_recharges": 1
-                },
-                "$set": {
-                    "payment_method.last_auto_recharge_date": datetime.utcnow()
-                }
-            }
-        )
-        
-        logger.info(f"Auto-recharge success: {farmhouse_id} ₹{AUTO_PAYMENT_AMOUNT}")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Auto-recharge failed: {farmhouse_id} - {str(e)}")
-        
-        db.payments.insert_one({
-            "farmhouse_id": ObjectId(farmhouse_id),
-            "payment_id": None,
-            "order_id": None,
-            "signature": None,
-            "verified": False,
-            "status": "failed",
-            "amount": AUTO_PAYMENT_AMOUNT,
-            "type": "auto_recharge",
-            "error": str(e),
-            "created_at": datetime.utcnow()
-        })
-        
-        return False
+    payment_response = create_recurring_payment_with_retry(razorpay_client, {
+        "amount": int(AUTO_PAYMENT_AMOUNT * 100),
+        "currency": "INR",
+        "order_id": order_id,
+        "customer_id": customer_id,
+        "token": payment_method.get('razorpay_token'),
+        "recurring": "1"
+    })
+    
+    payment_id = payment_response.get('razorpay_payment_id') or payment_response.get('id')
+    return payment_id, order_id
 
 
 @handle_exceptions
-def trigger_auto_recharge_in_background(farmhouse_id):
-    from apscheduler.schedulers.background import BackgroundScheduler
+def record_auto_recharge_payment(farmhouse_id, payment_fields):
+    from bson import ObjectId
+    from src.database import db
+    from datetime import datetime
     
-    scheduler = BackgroundScheduler()
-    scheduler.start()
+    payment_record = {
+        "farmhouse_id": ObjectId(farmhouse_id),
+        "signature": None,
+        "amount": AUTO_PAYMENT_AMOUNT,
+        "type": "auto_recharge",
+        "created_at": datetime.utcnow(),
+        **payment_fields
+    }
+    db.payments.insert_one(payment_record)
+    return True
+
+
+@handle_exceptions
+def credit_auto_recharge(farmhouse_id, payment_id, order_id):
+    from bson import ObjectId
+    from src.database import db
+    from datetime import datetime
     
-    scheduler.add_job(
-        process_auto_recharge_payment,
-        args=[farmhouse_id],
-        id=f'auto_recharge_{farmhouse_id}',
-        replace_existing=True
+    record_auto_recharge_payment(farmhouse_id, {"payment_id": payment_id, "order_id": order_id, "verified": True, "status": "success"})
+    db.farmhouses.update_one(
+        {"_id": ObjectId(farmhouse_id)},
+        {
+            "$inc": {"credit_balance": AUTO_PAYMENT_AMOUNT, "payment_method.total_auto_recharges": 1},
+            "$set": {"payment_method.last_auto_recharge_date": datetime.utcnow()}
+        }
     )
+    record_successful_payment(AUTO_PAYMENT_AMOUNT)
+    return True
+
+
+@handle_exceptions
+def process_auto_recharge_payment(farmhouse_id):
+    payment_method = get_auto_recharge_method(farmhouse_id)
+    if not payment_method:
+        return False
+    
+    try:
+        payment_id, order_id = charge_auto_recharge(farmhouse_id, payment_method)
+        credit_auto_recharge(farmhouse_id, payment_id, order_id)
+    except Exception as e:
+        logger.error(f"Auto-recharge failed: {farmhouse_id} - {str(e)}")
+        record_auto_recharge_payment(farmhouse_id, {"payment_id": None, "order_id": None, "verified": False, "status": "failed", "error": str(e)})
+        return False
     
+    logger.info(f"Auto-recharge success: {farmhouse_id} ₹{AUTO_PAYMENT_AMOUNT}")
     return True
 
 
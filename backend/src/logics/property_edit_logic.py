@@ -5,6 +5,8 @@ from src.database.db_common_operations import db_update_one, db_find_one
 from src.utils.exception_handler import handle_exceptions, AppException
 from src.logics.cloudfare_bucket import overwrite_image_in_r2, overwrite_document_in_r2
 from src.logics.website_logic import *
+from src.logics.catalogue_events import notify_catalogue_changed
+from src.logics.vector_reindex_queue import enqueue_vector_reindex
 
 logger = logging.getLogger(__name__)
 
@@ -229,12 +231,9 @@ def update_property_field(property_id, field_name, value):
     
     db_field_path = FIELD_MAPPING[field_name]
     update_property_field_in_db(property_id, db_field_path, validated_value)
+    notify_catalogue_changed(property_id)
     
     if field_name in ["property_name", "description"]:
-        from src.logics.ai_logics import update_property_in_vector_store
-        try:
-            update_property_in_vector_store(property_id)
-        except Exception as e:
-            logger.warning(f"Failed to update vector store for property {property_id}: {str(e)}")
+        enqueue_vector_reindex(property_id)
     
     return True
@@ -0,0 +1,105 @@
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.utils.exception_handler import handle_exceptions
+from src.utils.logger import logger
+
+RECHARGE_WORKERS = 2
+RECHARGE_MAX_PENDING = 100
+
+recharge_lock = threading.Lock()
+
+executor_state = {
+    "executor": None,
+    "queued": set(),
+    "in_flight": set()
+}
+
+recharge_metrics = {
+    "submitted": 0,
+    "deduplicated": 0,
+    "rejected": 0,
+    "succeeded": 0,
+    "failed": 0,
+    "retries": 0
+}
+
+
+def run_recharge_job(farmhouse_id):
+    from src.logics.payment_logic import process_auto_recharge_payment
+
+    with recharge_lock:
+        executor_state["queued"].discard(farmhouse_id)
+        executor_state["in_flight"].add(farmhouse_id)
+
+    try:
+        recharged = process_auto_recharge_payment(farmhouse_id)
+    except Exception as e:
+        logger.error(f"Auto-recharge job crashed for {farmhouse_id}: {str(e)}")
+        recharged = False
+    finally:
+        with recharge_lock:
+            executor_state["in_flight"].discard(farmhouse_id)
+
+    with recharge_lock:
+        recharge_metrics["succeeded" if recharged else "failed"] += 1
+    return recharged
+
+
+@handle_exceptions
+def submit_auto_recharge(farmhouse_id):
+    farmhouse_id = str(farmhouse_id)
+    executor = executor_state["executor"]
+
+    with recharge_lock:
+        if farmhouse_id in executor_state["queued"] or farmhouse_id in executor_state["in_flight"]:
+            recharge_metrics["deduplicated"] += 1
+            return False
+
+        if not executor or len(executor_state["queued"]) >= RECHARGE_MAX_PENDING:
+            recharge_metrics["rejected"] += 1
+            logger.warning(f"Auto-recharge {'queue full' if executor else 'executor not running'}, dropping recharge for {farmhouse_id}")
+            return False
+
+        executor_state["queued"].add(farmhouse_id)
+        recharge_metrics["submitted"] += 1
+
+    executor.submit(run_recharge_job, farmhouse_id)
+    return True
+
+
+def record_recharge_retry():
+    with recharge_lock:
+        recharge_metrics["retries"] += 1
+    return True
+
+
+def start_recharge_executor():
+    if executor_state["executor"]:
+        return True
+
+    executor_state["executor"] = ThreadPoolExecutor(max_workers=RECHARGE_WORKERS, thread_name_prefix="auto-recharge")
+    atexit.register(stop_recharge_executor)
+    return True
+
+
+def stop_recharge_executor():
+    executor = executor_state["executor"]
+    if not executor:
+        return True
+
+    executor_state["executor"] = None
+    executor.shutdown(wait=True)
+    return True
+
+
+def get_recharge_metrics():
+    with recharge_lock:
+        metrics = {
+            "queue_depth": len(executor_state["queued"]),
+            "in_flight": len(executor_state["in_flight"]),
+            "max_pending": RECHARGE_MAX_PENDING,
+            "workers": RECHARGE_WORKERS,
+            **recharge_metrics
+        }
+    return metrics
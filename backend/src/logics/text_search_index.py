@@ -0,0 +1,213 @@
+import math
+import re
+import threading
+import time
+from collections import Counter
+from bson import ObjectId
+from src.database.db_common_operations import db_find_one
+from src.database.db_listing_operations import find_active_property_texts, PROPERTY_TEXT_PROJECTION
+from src.utils.exception_handler import handle_exceptions
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+text_index_state = {
+    "postings": {},
+    "doc_terms": {},
+    "doc_lengths": {},
+    "doc_files": {},
+    "file_properties": {},
+    "total_length": 0,
+    "built": False,
+    "pending_refreshes": set(),
+    "builds": 0,
+    "refreshes": 0,
+    "searches": 0,
+    "last_build_ms": 0.0
+}
+text_index_lock = threading.RLock()
+text_index_build_lock = threading.Lock()
+
+
+@handle_exceptions
+def tokenize_query(query_string):
+    tokens = re.findall(r"\w+", query_string.lower())
+    meaningful_tokens = [token for token in tokens if len(token) > 2]
+    return meaningful_tokens
+
+
+@handle_exceptions
+def extract_property_text(property_data):
+    parts = [
+        property_data.get("name", ""),
+        property_data.get("description", ""),
+        property_data.get("type", ""),
+        str(property_data.get("per_day_price", ""))
+    ]
+    location = property_data.get("location") or {}
+    location_parts = [
+        location.get("address", ""),
+        location.get("area", ""),
+        location.get("city", ""),
+        location.get("state", "")
+    ]
+    parts.extend(location_parts)
+    amenities = property_data.get("amenities") or {}
+    for category in amenities.values():
+        if isinstance(category, dict):
+            for amenity_name, enabled in category.items():
+                if enabled:
+                    parts.append(amenity_name.replace("_", " "))
+    tags = property_data.get("tags") or []
+    if isinstance(tags, list):
+        parts.extend(tags)
+    aggregated_text = " ".join(filter(None, parts)).lower()
+    return aggregated_text
+
+
+@handle_exceptions
+def build_text_entry(property_doc):
+    text_entry = {
+        "terms": Counter(tokenize_query(extract_property_text(property_doc))),
+        "file_id": (property_doc.get("ai") or {}).get("file_id")
+    }
+    return text_entry
+
+
+@handle_exceptions
+def add_text_entry(index_data, property_id, text_entry):
+    for term, term_frequency in text_entry["terms"].items():
+        index_data["postings"].setdefault(term, {})[property_id] = term_frequency
+    index_data["doc_terms"][property_id] = text_entry["terms"]
+    index_data["doc_lengths"][property_id] = sum(text_entry["terms"].values())
+    index_data["total_length"] += index_data["doc_lengths"][property_id]
+    if text_entry["file_id"]:
+        index_data["doc_files"][property_id] = text_entry["file_id"]
+        index_data["file_properties"][text_entry["file_id"]] = property_id
+    return True
+
+
+@handle_exceptions
+def remove_text_entry(property_id):
+    doc_terms = text_index_state["doc_terms"].pop(property_id, None)
+    if doc_terms is None:
+        return False
+
+    for term in doc_terms:
+        term_postings = text_index_state["postings"].get(term, {})
+        term_postings.pop(property_id, None)
+        if not term_postings:
+            text_index_state["postings"].pop(term, None)
+    text_index_state["total_length"] -= text_index_state["doc_lengths"].pop(property_id, 0)
+    text_index_state["file_properties"].pop(text_index_state["doc_files"].pop(property_id, None), None)
+    return True
+
+
+@handle_exceptions
+def build_text_search_index():
+    started_at = time.perf_counter()
+    index_data = {"postings": {}, "doc_terms": {}, "doc_lengths": {}, "doc_files": {}, "file_properties": {}, "total_length": 0}
+    for property_doc in find_active_property_texts():
+        add_text_entry(index_data, str(property_doc["_id"]), build_text_entry(property_doc))
+
+    with text_index_lock:
+        text_index_state.update(index_data)
+        text_index_state["built"] = True
+        text_index_state["builds"] += 1
+        text_index_state["last_build_ms"] = round((time.perf_counter() - started_at) * 1000, 2)
+        pending_refreshes = text_index_state["pending_refreshes"]
+        text_index_state["pending_refreshes"] = set()
+
+    for property_id in pending_refreshes:
+        refresh_text_search_property(property_id)
+    return len(index_data["doc_terms"])
+
+
+@handle_exceptions
+def ensure_text_search_index():
+    if text_index_state["built"]:
+        return True
+
+    with text_index_build_lock:
+        if not text_index_state["built"]:
+            build_text_search_index()
+    return True
+
+
+@handle_exceptions
+def refresh_text_search_property(property_id):
+    property_id = str(property_id)
+    with text_index_lock:
+        index_built = text_index_state["built"]
+        if not index_built:
+            text_index_state["pending_refreshes"].add(property_id)
+    if not index_built:
+        return False
+
+    property_doc = db_find_one("farmhouses", {"_id": ObjectId(property_id)}, {"status": 1, **PROPERTY_TEXT_PROJECTION})
+    text_entry = build_text_entry(property_doc) if property_doc and property_doc.get("status") == "active" else None
+
+    with text_index_lock:
+        remove_text_entry(property_id)
+        if text_entry:
+            add_text_entry(text_index_state, property_id, text_entry)
+        text_index_state["refreshes"] += 1
+    return True
+
+
+@handle_exceptions
+def invalidate_text_search_index():
+    with text_index_lock:
+        text_index_state["built"] = False
+    return True
+
+
+@handle_exceptions
+def score_query_terms(query_terms):
+    document_count = len(text_index_state["doc_lengths"])
+    average_length = text_index_state["total_length"] / document_count if document_count else 0
+    scores = {}
+    for term in set(query_terms):
+        term_postings = text_index_state["postings"].get(term, {})
+        inverse_frequency = math.log(1 + (document_count - len(term_postings) + 0.5) / (len(term_postings) + 0.5))
+        for property_id, term_frequency in term_postings.items():
+            length_norm = 1 - BM25_B + BM25_B * text_index_state["doc_lengths"][property_id] / average_length
+            term_score = inverse_frequency * term_frequency * (BM25_K1 + 1) / (term_frequency + BM25_K1 * length_norm)
+            scores[property_id] = scores.get(property_id, 0.0) + term_score
+    return scores
+
+
+@handle_exceptions
+def search_text_index(query_string, limit):
+    ensure_text_search_index()
+    query_terms = tokenize_query(query_string)
+    with text_index_lock:
+        scores = score_query_terms(query_terms)
+        text_index_state["searches"] += 1
+
+    ranked_scores = dict(sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit])
+    return ranked_scores
+
+
+@handle_exceptions
+def resolve_file_properties(file_ids):
+    ensure_text_search_index()
+    with text_index_lock:
+        file_properties = {file_id: text_index_state["file_properties"][file_id] for file_id in file_ids if file_id in text_index_state["file_properties"]}
+    return file_properties
+
+
+@handle_exceptions
+def get_text_search_stats():
+    with text_index_lock:
+        stats = {
+            "built": text_index_state["built"],
+            "properties": len(text_index_state["doc_lengths"]),
+            "terms": len(text_index_state["postings"]),
+            "mapped_files": len(text_index_state["file_properties"]),
+            "builds": text_index_state["builds"],
+            "refreshes": text_index_state["refreshes"],
+            "searches": text_index_state["searches"],
+            "last_build_ms": text_index_state["last_build_ms"]
+        }
+    return stats
@@ -0,0 +1,163 @@
+import threading
+import time
+from datetime import datetime
+from src.database.db_common_operations import db_find_one
+from src.database.db_vector_reindex_operations import upsert_vector_reindex_job, claim_vector_reindex_job, complete_vector_reindex_job, reschedule_vector_reindex_job, get_vector_reindex_queue_summary
+from src.logics.ai_logics import build_property_vector_text, upload_text_to_openai, get_vector_store_id, attach_files_to_vector_store, remove_file_from_vector_store, delete_openai_file, save_ai_file_metadata
+from src.utils.exception_handler import handle_exceptions
+from src.utils.logger import logger
+
+VECTOR_REINDEX_DEBOUNCE_SECONDS = 30
+VECTOR_REINDEX_INTERVAL_SECONDS = 15
+VECTOR_REINDEX_BATCH_SIZE = 20
+VECTOR_REINDEX_MAX_ATTEMPTS = 6
+VECTOR_REINDEX_BACKOFF_SECONDS = 30
+VECTOR_REINDEX_BACKOFF_MAX_SECONDS = 3600
+VECTOR_REINDEX_LEASE_SECONDS = 600
+
+vector_reindex_lock = threading.Lock()
+
+vector_reindex_metrics = {
+    "enqueued": 0,
+    "coalesced": 0,
+    "batches": 0,
+    "reindexed": 0,
+    "skipped": 0,
+    "retries": 0,
+    "gave_up": 0,
+    "last_batch_size": 0,
+    "last_run_ms": 0.0
+}
+
+
+@handle_exceptions
+def enqueue_vector_reindex(property_id):
+    coalesced = upsert_vector_reindex_job(property_id, VECTOR_REINDEX_DEBOUNCE_SECONDS)
+    with vector_reindex_lock:
+        vector_reindex_metrics["coalesced" if coalesced else "enqueued"] += 1
+    return True
+
+
+@handle_exceptions
+def claim_vector_reindex_batch():
+    claimed_jobs = []
+    while len(claimed_jobs) < VECTOR_REINDEX_BATCH_SIZE:
+        claimed_job = claim_vector_reindex_job(VECTOR_REINDEX_LEASE_SECONDS)
+        if not claimed_job:
+            break
+        claimed_jobs.append(claimed_job)
+    return claimed_jobs
+
+
+@handle_exceptions
+def compute_retry_delay(attempts):
+    if attempts + 1 >= VECTOR_REINDEX_MAX_ATTEMPTS:
+        return None
+
+    retry_delay = min(VECTOR_REINDEX_BACKOFF_SECONDS * 2 ** attempts, VECTOR_REINDEX_BACKOFF_MAX_SECONDS)
+    return retry_delay
+
+
+@handle_exceptions
+def retry_vector_reindex_job(claimed_job, error):
+    retry_delay = compute_retry_delay(claimed_job.get("attempts", 0))
+    reschedule_vector_reindex_job(claimed_job, str(error), retry_delay)
+    with vector_reindex_lock:
+        vector_reindex_metrics["retries" if retry_delay is not None else "gave_up"] += 1
+    logger.warning(f"Vector re-index failed for property {claimed_job['_id']} (retry in {retry_delay}s): {str(error)}")
+    return retry_delay
+
+
+@handle_exceptions
+def upload_reindex_file(claimed_job):
+    property_data = db_find_one("farmhouses", {"_id": claimed_job["_id"]})
+    existing_file_id = ((property_data or {}).get("ai") or {}).get("file_id")
+    if not existing_file_id:
+        return None
+
+    new_file_id = upload_text_to_openai(build_property_vector_text(property_data))
+    reindex_upload = {"job": claimed_job, "property_id": str(claimed_job["_id"]), "old_file_id": existing_file_id, "new_file_id": new_file_id}
+    return reindex_upload
+
+
+@handle_exceptions
+def prepare_reindex_uploads(claimed_jobs):
+    reindex_uploads = []
+    for claimed_job in claimed_jobs:
+        try:
+            reindex_upload = upload_reindex_file(claimed_job)
+        except Exception as e:
+            retry_vector_reindex_job(claimed_job, e)
+            continue
+
+        if reindex_upload:
+            reindex_uploads.append(reindex_upload)
+        else:
+            complete_vector_reindex_job(claimed_job)
+            with vector_reindex_lock:
+                vector_reindex_metrics["skipped"] += 1
+    return reindex_uploads
+
+
+@handle_exceptions
+def finalize_reindex_upload(vector_store_id, reindex_upload):
+    save_ai_file_metadata(reindex_upload["property_id"], reindex_upload["new_file_id"], vector_store_id)
+    remove_file_from_vector_store(vector_store_id, reindex_upload["old_file_id"])
+    delete_openai_file(reindex_upload["old_file_id"])
+    completed = complete_vector_reindex_job(reindex_upload["job"])
+    return completed
+
+
+@handle_exceptions
+def attach_reindex_uploads(reindex_uploads):
+    try:
+        vector_store_id = get_vector_store_id()
+        attach_files_to_vector_store(vector_store_id, [reindex_upload["new_file_id"] for reindex_upload in reindex_uploads])
+    except Exception as e:
+        for reindex_upload in reindex_uploads:
+            retry_vector_reindex_job(reindex_upload["job"], e)
+            delete_openai_file(reindex_upload["new_file_id"])
+        return False
+
+    for reindex_upload in reindex_uploads:
+        finalize_reindex_upload(vector_store_id, reindex_upload)
+    return True
+
+
+@handle_exceptions
+def process_vector_reindex_queue():
+    started_at = time.perf_counter()
+    claimed_jobs = claim_vector_reindex_batch()
+    if not claimed_jobs:
+        return 0
+
+    reindex_uploads = prepare_reindex_uploads(claimed_jobs)
+    attached = bool(reindex_uploads) and attach_reindex_uploads(reindex_uploads)
+    reindexed_count = len(reindex_uploads) if attached else 0
+
+    with vector_reindex_lock:
+        vector_reindex_metrics["batches"] += 1
+        vector_reindex_metrics["reindexed"] += reindexed_count
+        vector_reindex_metrics["last_batch_size"] = len(claimed_jobs)
+        vector_reindex_metrics["last_run_ms"] = round((time.perf_counter() - started_at) * 1000, 2)
+    return reindexed_count
+
+
+@handle_exceptions
+def get_vector_reindex_metrics():
+    queue_summary = get_vector_reindex_queue_summary()
+    backlog_groups = [queue_summary[status] for status in ("pending", "processing") if status in queue_summary]
+    oldest_requested_at = min((group["oldest_requested_at"] for group in backlog_groups), default=None)
+    next_due_at = queue_summary.get("pending", {}).get("next_due_at")
+    now = datetime.utcnow()
+
+    with vector_reindex_lock:
+        reindex_metrics = dict(vector_reindex_metrics)
+    reindex_metrics.update({
+        "pending": queue_summary.get("pending", {}).get("count", 0),
+        "processing": queue_summary.get("processing", {}).get("count", 0),
+        "failed": queue_summary.get("failed", {}).get("count", 0),
+        "oldest_lag_seconds": round((now - oldest_requested_at).total_seconds(), 1) if oldest_requested_at else 0.0,
+        "next_due_in_seconds": round((next_due_at - now).total_seconds(), 1) if next_due_at else None
+    })
+    return reindex_metrics
@@ -1,17 +1,33 @@
-from src.database.db_common_operations import db_find_many, db_find_one, db_insert_one, db_update_one, db_append_to_array, db_remove_from_array, db_exists, db_update_by_id
-from src.database.db_owner_analysis_operations import record_visit, record_contact
+from src.database.db_common_operations import PAGE_SIZE_MAX, resolve_page_size, db_find_one, db_insert_one, db_update_one, db_append_to_array, db_remove_from_array, db_exists, db_update_by_id
+from src.logics.analytics_event_buffer import record_visit, record_contact
+from src.database.db_listing_operations import find_listing_properties, find_listing_page
+from src.logics.listing_cache_logic import build_listing_cache_key, get_cached_listing, store_listing, snap_coordinate
+from src.logics.catalogue_events import notify_catalogue_changed
+from src.logics.geo_tile_index import find_nearby_listing_page
+from src.logics.amenity_facet_index import count_amenity_facets
+from src.database.db_amenity_bits import sync_property_amenity_bits
+from src.database.db_payment_operations import charge_lead_credit, deactivate_farmhouse_below_balance
+from src.logics.admin_kpi_snapshot_logic import record_credit_change, record_new_property, record_property_status_change
 from src.utils.exception_handler import handle_exceptions, AppException
 from src.utils.logger import logger
-from src.logics.cloudfare_bucket import upload_farmhouse_image_to_r2, upload_farmhouse_document_to_r2
+from src.logics.cloudfare_bucket import upload_farmhouse_image_to_r2, upload_farmhouse_document_to_r2, upload_files_in_parallel
+from src.logics.image_variants import build_image_variant_entry, build_image_srcset
+from src.utils.availability_calendar import BOOKED_DAYS_FIELD, build_month_masks, build_available_range_filter, is_range_available
+from src.utils.amenity_bits import AMENITY_BITS_FIELD, encode_amenity_bits, find_unknown_amenities, build_required_mask, build_amenity_filter
 from src.config import LEAD_COST_RUPEES, MINIMUM_BALANCE_THRESHOLD, OTP_EXPIRY_MINUTES, TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, TWILIO_PHONE_NUMBER, AUTO_PAYMENT_THRESHOLD
 from bson import ObjectId
 from bson.errors import InvalidId
-from datetime import datetime, timedelta
+from datetime import datetime
 import pytz
 import re
 import random
 from twilio.rest import Client
-    
+
+LISTING_VIEWS = ("full", "card")
+LISTING_CARD_VERSION = 1
+LISTING_CARD_DESCRIPTION_WORDS = 20
+
+GEO_TILE_INDEX_ENABLED = True
 
 
 @handle_exceptions
@@ -128,6 +144,43 @@ def process_property_for_detail(property_data):
     return processed_data
 
 
+@handle_exceptions
+def build_listing_images(images, image_variants):
+    variants_by_original = {entry["original"]: entry for entry in image_variants}
+    card_images = []
+    image_srcsets = []
+    
+    for image_url in images:
+        variant_entry = variants_by_original.get(image_url)
+        if variant_entry:
+            card_images.append(variant_entry["variants"]["card"]["jpeg"])
+            image_srcsets.append(build_image_srcset(variant_entry))
+        else:
+            card_images.append(image_url)
+            image_srcsets.append(None)
+    
+    return card_images, image_srcsets
+
+
+@handle_exceptions
+def truncate_description(full_description, max_words=LISTING_CARD_DESCRIPTION_WORDS):
+    description_words = full_description.split()
+    
+    truncated_description = full_description
+    if len(description_words) > max_words:
+        truncated_description = " ".join(description_words[:max_words]) + "..."
+    return truncated_description
+
+
+@handle_exceptions
+def format_distance_km(distance_meters):
+    if distance_meters is None:
+        return None
+    
+    distance_km = round(distance_meters / 1000, 1)
+    return distance_km
+
+
 @handle_exceptions  
 def process_farmhouse_for_listing(farmhouse_data):
     farmhouse_id = str(farmhouse_data.get("_id"))
@@ -137,53 +190,126 @@ def process_farmhouse_for_listing(farmhouse_data):
     favourite = farmhouse_data.get("favourite", False)
     location = farmhouse_data.get("location", {})
     review_average = farmhouse_data.get("review_average", 0.0)
-    description_words = full_description.split()
-    
-    if len(description_words) > 20:
-        truncated_description = " ".join(description_words[:20]) + "..."
-    else:
-        truncated_description = full_description
+    card_images, image_srcsets = build_listing_images(images, farmhouse_data.get("image_variants", []))
+    truncated_description = truncate_description(full_description)
     
     processed_data = {
         "_id": farmhouse_id,
         "name": name,
         "description": truncated_description,
-        "images": images,
+        "images": card_images,
+        "image_srcsets": image_srcsets,
         "favourite": favourite,
         "location": location,
-        "review_average": review_average
+        "review_average": review_average,
+        "distance_km": format_distance_km(farmhouse_data.get("distance_meters"))
     }
     
     return processed_data
 
 
 @handle_exceptions
-def get_date_range(start_date, end_date):
-    date_range = []
-    current_date = start_date
-    while current_date <= end_date:
-        date_range.append(current_date.strftime('%Y-%m-%d'))
-        current_date += timedelta(days=1)
+def process_farmhouse_for_card(farmhouse_data):
+    location = farmhouse_data.get("location", {})
+    geo_point = location.get("coordinates", {}).get("coordinates", [])
+    card_images, image_srcsets = build_listing_images(farmhouse_data.get("images", []), farmhouse_data.get("image_variants", []))
+    
+    coordinates = None
+    if len(geo_point) == 2:
+        coordinates = {"latitude": geo_point[1], "longitude": geo_point[0]}
+    
+    card_data = {
+        "_id": str(farmhouse_data.get("_id")),
+        "name": farmhouse_data.get("name", ""),
+        "description": truncate_description(farmhouse_data.get("description", "")),
+        "image": card_images[0] if card_images else None,
+        "image_srcset": image_srcsets[0] if image_srcsets else None,
+        "review_average": farmhouse_data.get("review_average", 0.0),
+        "coordinates": coordinates,
+        "city": location.get("city"),
+        "distance_km": format_distance_km(farmhouse_data.get("distance_meters"))
+    }
     
-    return date_range
+    return card_data
 
 
 @handle_exceptions
-def get_approved_properties_by_type(query_filter, number_of_people=None, number_of_children=None, number_of_pets=None, search_latitude=None, search_longitude=None, max_distance_km=None, check_in_date=None, check_out_date=None):
-    from src.config import MAX_SEARCH_DISTANCE_KM
-    if max_distance_km is None:
-        max_distance_km = MAX_SEARCH_DISTANCE_KM
+def validate_listing_view(view):
+    if not view:
+        return "full"
+    
+    if view not in LISTING_VIEWS:
+        raise AppException(f"Unsupported listing view '{view}', expected one of: {', '.join(LISTING_VIEWS)}", 400)
+    return view
+
+
+@handle_exceptions
+def build_listing_projection(view):
+    if view == "card":
+        first_image = {"$arrayElemAt": ["$images", 0]}
+        projection = {
+            "_id": 1,
+            "name": 1,
+            "description": 1,
+            "images": {"$slice": [{"$ifNull": ["$images", []]}, 1]},
+            "image_variants": {"$filter": {
+                "input": {"$ifNull": ["$image_variants", []]},
+                "cond": {"$eq": ["$$this.original", first_image]}
+            }},
+            "location.city": 1,
+            "location.coordinates": 1
+        }
+        return projection
     
     projection = {
         "_id": 1,
         "name": 1,
         "description": 1,
         "images": 1,
+        "image_variants": 1,
         "amenities": 1,
         "type": 1,
         "location": 1
     }
+    return projection
+
+
+@handle_exceptions
+def build_listing_view_metadata(view):
+    view_metadata = {"view": "card", "card_version": LISTING_CARD_VERSION} if view == "card" else {}
+    return view_metadata
+
 
+@handle_exceptions
+def build_search_point(search_latitude, search_longitude):
+    if search_latitude is None or search_longitude is None:
+        return None
+
+    search_point = {
+        "type": "Point",
+        "coordinates": [float(search_longitude), float(search_latitude)]
+    }
+    return search_point
+
+
+@handle_exceptions
+def resolve_amenity_mask(amenities):
+    if not amenities:
+        return 0
+
+    if not isinstance(amenities, list):
+        raise AppException("Amenities must be a list of amenity names", 400)
+
+    unknown_amenities = find_unknown_amenities(amenities)
+    if unknown_amenities:
+        raise AppException(f"Unknown amenities: {', '.join(unknown_amenities)}", 400)
+
+    required_mask = build_required_mask(amenities)
+    return required_mask
+
+
+@handle_exceptions
+def apply_listing_filters(query_filter, number_of_people=None, number_of_children=None, number_of_pets=None, check_in_date=None, check_out_date=None, amenity_mask=0):
     if number_of_people and not isinstance(number_of_people, str):
         query_filter["max_people_allowed"] = {"$gte": number_of_people}
     
@@ -193,39 +319,56 @@ def get_approved_properties_by_type(query_filter, number_of_people=None, number_
     if number_of_pets and not isinstance(number_of_pets, str):
         query_filter["max_pets_allowed"] = {"$gte": number_of_pets}
     
-    # Add geospatial filter if search location is provided
-    if search_latitude is not None and search_longitude is not None:
-        query_filter["location.coordinates"] = {
-            "$near": {
-                "$geometry": {
-                    "type": "Point",
-                    "coordinates": [float(search_longitude), float(search_latitude)]  # [lng, lat] order
-                },
-                "$maxDistance": max_distance_km * 1000  # Convert km to meters
-            }
-        }
-    
     if check_in_date and check_out_date:
         check_in_date = datetime.strptime(check_in_date, '%Y-%m-%d')
         check_out_date = datetime.strptime(check_out_date, '%Y-%m-%d')
-        date_range = get_date_range(check_in_date, check_out_date)
-        query_filter["booked_dates"] = {"$nin": date_range}
-    
-    properties_list = db_find_many("farmhouses", query_filter, projection)
+        query_filter.update(build_available_range_filter(build_month_masks(check_in_date, check_out_date)))
     
+    query_filter.update(build_amenity_filter(amenity_mask))
+    return query_filter
+
+
+@handle_exceptions
+def process_listing_page(properties_page, view):
+    process_property = process_farmhouse_for_card if view == "card" else process_farmhouse_for_listing
     processed_properties = []
-    for property_data in properties_list:
-        farmhouse_id = property_data.get("_id")
-        analysis_data = db_find_one("farmhouse_analysis", {"farmhouse_id": farmhouse_id}, {"review_average": 1})
-        if analysis_data:
-            property_data["review_average"] = analysis_data.get("review_average", 0.0)
-        else:
-            property_data["review_average"] = 0.0
-        
-        processed_property = process_farmhouse_for_listing(property_data)
+    for property_data in properties_page["items"]:
+        processed_property = process_property(property_data)
         processed_properties.append(processed_property)
     
-    return processed_properties
+    processed_page = {"items": processed_properties, "next_page_token": properties_page["next_page_token"]}
+    return processed_page
+
+
+@handle_exceptions
+def get_approved_properties_by_type(query_filter, number_of_people=None, number_of_children=None, number_of_pets=None, search_latitude=None, search_longitude=None, max_distance_km=None, check_in_date=None, check_out_date=None, view=None, page_size=None, page_token=None, amenities=None):
+    from src.config import MAX_SEARCH_DISTANCE_KM
+    if max_distance_km is None:
+        max_distance_km = MAX_SEARCH_DISTANCE_KM
+    
+    search_latitude = snap_coordinate(search_latitude)
+    search_longitude = snap_coordinate(search_longitude)
+    guest_counts = [number_of_people, number_of_children, number_of_pets]
+    view = validate_listing_view(view)
+    page_key = [resolve_page_size(page_size), page_token]
+    amenity_mask = resolve_amenity_mask(amenities)
+    cache_key = build_listing_cache_key(query_filter, guest_counts, search_latitude, search_longitude, max_distance_km, check_in_date, check_out_date, view, page_key, amenity_mask)
+    cached_listing = get_cached_listing(cache_key)
+    if cached_listing is not None:
+        return cached_listing
+    
+    projection = build_listing_projection(view)
+    query_filter = apply_listing_filters(query_filter, number_of_people, number_of_children, number_of_pets, check_in_date, check_out_date, amenity_mask)
+    search_point = build_search_point(search_latitude, search_longitude)
+    max_distance_meters = max_distance_km * 1000
+    if search_point and GEO_TILE_INDEX_ENABLED:
+        properties_page = find_nearby_listing_page(query_filter, projection, search_latitude, search_longitude, max_distance_meters, page_size, page_token)
+    else:
+        properties_page = find_listing_page(query_filter, projection, search_point, max_distance_meters, page_size, page_token)
+    
+    processed_page = process_listing_page(properties_page, view)
+    store_listing(cache_key, processed_page)
+    return processed_page
 
 
 @handle_exceptions
@@ -236,14 +379,11 @@ def check_property_availability(property_data, check_in_date, check_out_date, nu
     if check_in_date and check_out_date:
         parsed_check_in = datetime.strptime(check_in_date, '%Y-%m-%d')
         parsed_check_out = datetime.strptime(check_out_date, '%Y-%m-%d')
-        requested_date_range = get_date_range(parsed_check_in, parsed_check_out)
+        requested_month_masks = build_month_masks(parsed_check_in, parsed_check_out)
         
-        booked_dates = property_data.get("booked_dates", [])
-        for requested_date in requested_date_range:
-            if requested_date in booked_dates:
-                availability = False
-                reason = "Property is not available for selected dates"
-                break
+        if not is_range_available(property_data.get(BOOKED_DAYS_FIELD), requested_month_masks):
+            availability = False
+            reason = "Property is not available for selected dates"
     
     if availability and number_of_people:
         max_people = property_data.get("max_people", 0)
@@ -269,7 +409,7 @@ def get_property_details(property_id, lead_email=None, check_in_date=None, check
         "opening_time": 1,
         "closing_time": 1,
         "per_day_price": 1,
-        "booked_dates": 1,
+        BOOKED_DAYS_FIELD: 1,
         "max_people": 1
     }
     
@@ -303,26 +443,37 @@ def get_property_details(property_id, lead_email=None, check_in_date=None, check
 
 
 @handle_exceptions
-def get_approved_farmhouses(number_of_people=None, number_of_children=None, number_of_pets=None, search_latitude=None, search_longitude=None, max_distance_km=None, check_in_date=None, check_out_date=None):
+def get_approved_farmhouses(number_of_people=None, number_of_children=None, number_of_pets=None, search_latitude=None, search_longitude=None, max_distance_km=None, check_in_date=None, check_out_date=None, view=None, page_size=None, page_token=None, amenities=None):
     query_filter = {"status": "active", "type": "farmhouse"}
-    farmhouses_list = get_approved_properties_by_type(query_filter, number_of_people, number_of_children, number_of_pets, search_latitude, search_longitude, max_distance_km, check_in_date, check_out_date)
+    farmhouses_list = get_approved_properties_by_type(query_filter, number_of_people, number_of_children, number_of_pets, search_latitude, search_longitude, max_distance_km, check_in_date, check_out_date, view, page_size, page_token, amenities)
     return farmhouses_list
 
 
 @handle_exceptions
-def get_approved_bnbs(number_of_people=None, number_of_children=None, number_of_pets=None, search_latitude=None, search_longitude=None, max_distance_km=None, check_in_date=None, check_out_date=None):
+def get_approved_bnbs(number_of_people=None, number_of_children=None, number_of_pets=None, search_latitude=None, search_longitude=None, max_distance_km=None, check_in_date=None, check_out_date=None, view=None, page_size=None, page_token=None, amenities=None):
     query_filter = {"status": "active", "type": "bnb"}
-    bnbs_list = get_approved_properties_by_type(query_filter, number_of_people, number_of_children, number_of_pets, search_latitude, search_longitude, max_distance_km, check_in_date, check_out_date)
+    bnbs_list = get_approved_properties_by_type(query_filter, number_of_people, number_of_children, number_of_pets, search_latitude, search_longitude, max_distance_km, check_in_date, check_out_date, view, page_size, page_token, amenities)
     return bnbs_list
 
 
 @handle_exceptions
-def get_all_approved_properties(number_of_people=None, number_of_children=None, number_of_pets=None, search_latitude=None, search_longitude=None, max_distance_km=None, check_in_date=None, check_out_date=None):
+def get_all_approved_properties(number_of_people=None, number_of_children=None, number_of_pets=None, search_latitude=None, search_longitude=None, max_distance_km=None, check_in_date=None, check_out_date=None, view=None, page_size=None, page_token=None, amenities=None):
     query_filter = {"status": "active"}
-    properties_list = get_approved_properties_by_type(query_filter, number_of_people, number_of_children, number_of_pets, search_latitude, search_longitude, max_distance_km, check_in_date, check_out_date)
+    properties_list = get_approved_properties_by_type(query_filter, number_of_people, number_of_children, number_of_pets, search_latitude, search_longitude, max_distance_km, check_in_date, check_out_date, view, page_size, page_token, amenities)
     return properties_list
 
 
+@handle_exceptions
+def get_amenity_facets(property_type=None, amenities=None):
+    if property_type and property_type not in ("farmhouse", "bnb"):
+        raise AppException(f"Invalid property type: {property_type}", 400)
+
+    required_mask = resolve_amenity_mask(amenities)
+    amenity_facets = count_amenity_facets(required_mask, property_type)
+    amenity_facets["selected"] = amenities or []
+    return amenity_facets
+
+
 @handle_exceptions
 def validate_farmhouse_data(farmhouse_data):
     required_fields = ["name", "description", "type", "location", "whatsapp_link", "amenities"]
@@ -342,42 +493,41 @@ def validate_farmhouse_data(farmhouse_data):
 
 
 @handle_exceptions
-def upload_farmhouse_images(image_files, farmhouse_id):
-    uploaded_images = []
+def build_upload_job(label, upload_function, *args):
+    upload_job = {"label": label, "function": upload_function, "args": args}
+    return upload_job
+
+
+@handle_exceptions
+def build_image_upload_jobs(image_files, farmhouse_id):
+    upload_jobs = []
     
     for index, image_file in enumerate(image_files):
         if image_file and image_file.filename:
-            image_url = upload_farmhouse_image_to_r2(image_file, farmhouse_id, index)
-            uploaded_images.append(image_url)
+            upload_jobs.append(build_upload_job(image_file.filename, upload_farmhouse_image_to_r2, image_file, farmhouse_id, index))
     
-    return uploaded_images
+    return upload_jobs
 
 
 @handle_exceptions
-def upload_farmhouse_documents(document_files, farmhouse_id):
-    uploaded_documents = []
+def build_document_upload_jobs(document_files, farmhouse_id):
+    upload_jobs = []
     
     for document_file in document_files:
         original_filename = document_file.filename
         doc_type = original_filename.rsplit('.', 1)[0]  
-        document_url = upload_farmhouse_document_to_r2(document_file, farmhouse_id, doc_type)
-        uploaded_documents.append(document_url)
+        upload_jobs.append(build_upload_job(original_filename, upload_farmhouse_document_to_r2, document_file, farmhouse_id, doc_type))
     
-    return uploaded_documents
+    return upload_jobs
 
 
 @handle_exceptions
-def upload_identity_documents(aadhaar_card, pan_card, farmhouse_id):
-    aadhaar_url = None
-    pan_url = None
-    
-    if aadhaar_card and aadhaar_card.filename:
-        aadhaar_url = upload_farmhouse_document_to_r2(aadhaar_card, farmhouse_id, "aadhaar")
+def build_identity_upload_job(identity_file, farmhouse_id, doc_type):
+    if not identity_file or not identity_file.filename:
+        return None
     
-    if pan_card and pan_card.filename:
-        pan_url = upload_farmhouse_document_to_r2(pan_card, farmhouse_id, "pan")
-    
-    return aadhaar_url, pan_url
+    upload_job = build_upload_job(identity_file.filename, upload_farmhouse_document_to_r2, identity_file, farmhouse_id, doc_type)
+    return upload_job
 
 
 @handle_exceptions
@@ -456,7 +606,10 @@ def save_targeted_amenities_update(property_id, update_data):
         
         if result.matched_count == 0:
             raise ValueError(f"Property with ID {property_id} not found")
-            
+        
+        if AMENITY_BITS_FIELD not in update_data and any(field.split(".")[0] == "amenities" for field in update_data):
+            sync_property_amenity_bits(property_id)
+        notify_catalogue_changed(property_id)
         return property_id
         
     except Exception as e:
@@ -502,6 +655,7 @@ def create_incomplete_property():
     }
     insert_result = db_insert_one("farmhouses", property_record)
     new_property_id = str(insert_result.inserted_id)
+    record_new_property(current_time)
     return new_property_id
 
 
@@ -707,7 +861,7 @@ def prepare_amenities_update(step_data, property_id):
     
     amenities = process_amenities_data(core_amenities, experience_amenities, additional_amenities)
     
-    update_data = {"amenities": amenities}
+    update_data = {"amenities": amenities, AMENITY_BITS_FIELD: encode_amenity_bits(amenities)}
     
     if "essential_amenities" in step_data:
         max_people = safe_int_conversion(step_data.get("essential_amenities", {}).get("max_people_allowed"), 0)
@@ -848,7 +1002,7 @@ def upload_partial_property_files(property_id, owner_photo=None):
     
     owner_photo_url = ""
     if owner_photo and owner_photo.filename:
-        owner_photo_url = upload_farmhouse_image_to_r2(owner_photo, property_id, "owner_photo")
+        owner_photo_url = upload_farmhouse_image_to_r2(owner_photo, property_id, "owner_photo", with_variants=False)
     
     if owner_photo_url:
         query_filter = {"_id": ObjectId(property_id)}
@@ -874,9 +1028,22 @@ def validate_incomplete_property(property_id):
 
 @handle_exceptions
 def upload_final_property_documents(property_id, property_images, property_documents, aadhaar_card, pan_card):
-    uploaded_images = upload_farmhouse_images(property_images, property_id)
-    aadhaar_url, pan_url = upload_identity_documents(aadhaar_card, pan_card, property_id)
-    uploaded_property_documents = upload_farmhouse_documents(property_documents, property_id)
+    image_jobs = build_image_upload_jobs(property_images, property_id)
+    document_jobs = build_document_upload_jobs(property_documents, property_id)
+    identity_jobs = [
+        build_identity_upload_job(aadhaar_card, property_id, "aadhaar"),
+        build_identity_upload_job(pan_card, property_id, "pan")
+    ]
+    
+    upload_jobs = image_jobs + document_jobs + [job for job in identity_jobs if job]
+    uploaded_urls, upload_timings = upload_files_in_parallel(upload_jobs)
+    logger.info(f"Property {property_id} uploaded {len(upload_jobs)} files in {upload_timings['total_ms']}ms: {upload_timings['files']}")
+    
+    uploaded_images = uploaded_urls[:len(image_jobs)]
+    uploaded_property_documents = uploaded_urls[len(image_jobs):len(image_jobs) + len(document_jobs)]
+    identity_urls = iter(uploaded_urls[len(image_jobs) + len(document_jobs):])
+    aadhaar_url = next(identity_urls) if identity_jobs[0] else None
+    pan_url = next(identity_urls) if identity_jobs[1] else None
     
     documents_data = {
         "property_docs": uploaded_property_documents,
@@ -897,6 +1064,7 @@ def complete_property_registration(property_id, property_images, property_docume
     
     update_data = {
         "images": uploaded_images,
+        "image_variants": [build_image_variant_entry(image_url) for image_url in uploaded_images],
         "documents": documents_data,
         "status": "pending_approval",
         "updated_at": current_time
@@ -973,53 +1141,37 @@ def generate_whatsapp_url(phone_number, message_data=None):
 
 
 @handle_exceptions
-def check_farmhouse_credit_balance(farmhouse_id, message_data=None):
-    query_filter = {"_id": ObjectId(farmhouse_id), "status": "active"}
-    projection = {"credit_balance": 1, "phone_number": 1}
-    farmhouse_data = db_find_one("farmhouses", query_filter, projection)
+def reject_uncharged_contact(farmhouse_id):
+    deactivated_farmhouse = deactivate_farmhouse_below_balance(farmhouse_id, MINIMUM_BALANCE_THRESHOLD)
     
-    if not farmhouse_data:
-        raise AppException("Farmhouse not found or not active")
-    
-    current_balance = farmhouse_data.get("credit_balance", 0)
-    phone_number = farmhouse_data.get("phone_number", "")
-    whatsapp_link = generate_whatsapp_url(phone_number, message_data)
+    if deactivated_farmhouse:
+        notify_catalogue_changed(farmhouse_id)
+        record_property_status_change(deactivated_farmhouse.get("type"), "active", "inactive")
+        raise AppException("Contact information is currently unavailable for this farmhouse")
     
-    return current_balance, whatsapp_link
+    raise AppException("Farmhouse not found or not active")
 
 
 @handle_exceptions
 def deduct_lead_cost_from_farmhouse(farmhouse_id, message_data=None):
-    from src.logics.payment_logic import trigger_auto_recharge_in_background
+    from src.logics.recharge_executor import submit_auto_recharge
     
-    current_balance, whatsapp_link = check_farmhouse_credit_balance(farmhouse_id, message_data)
+    farmhouse_data = charge_lead_credit(farmhouse_id, LEAD_COST_RUPEES, MINIMUM_BALANCE_THRESHOLD)
     
-    if current_balance < MINIMUM_BALANCE_THRESHOLD:
-        deactivate_data = {"$set": {"status": "inactive"}}
-        query_filter = {"_id": ObjectId(farmhouse_id)}
-        db_update_one("farmhouses", query_filter, deactivate_data)
-        raise AppException("Contact information is currently unavailable for this farmhouse")
+    if not farmhouse_data:
+        reject_uncharged_contact(farmhouse_id)
     
-    new_balance = current_balance - LEAD_COST_RUPEES
-
-    if new_balance <= MINIMUM_BALANCE_THRESHOLD:
-        update_data = {
-            "$set": {
-                "credit_balance": new_balance,
-                "status": "inactive"
-            }
-        }
-    else:
-        update_data = {
-            "$set": {"credit_balance": new_balance},
-        }
+    record_credit_change(-LEAD_COST_RUPEES)
+    new_balance = farmhouse_data.get("credit_balance", 0)
     
-    query_filter = {"_id": ObjectId(farmhouse_id)}
-    db_update_one("farmhouses", query_filter, update_data)
+    if farmhouse_data.get("status") == "inactive":
+        notify_catalogue_changed(farmhouse_id)
+        record_property_status_change(farmhouse_data.get("type"), "active", "inactive")
     
     if new_balance < AUTO_PAYMENT_THRESHOLD:
-        trigger_auto_recharge_in_background(farmhouse_id)
+        submit_auto_recharge(farmhouse_id)
     
+    whatsapp_link = generate_whatsapp_url(farmhouse_data.get("phone_number", ""), message_data)
     return new_balance, whatsapp_link
 
 
@@ -1040,15 +1192,15 @@ def process_whatsapp_contact(farmhouse_id, message_data=None):
 
 
 @handle_exceptions
-def get_fav_properties():
+def get_fav_properties(view=None):
     farmhouse_filter = {"status": "active", "type": "farmhouse", "favourite": True}
-    favourite_farmhouses = get_approved_properties_by_type(farmhouse_filter)
+    favourite_farmhouses = get_approved_properties_by_type(farmhouse_filter, view=view, page_size=PAGE_SIZE_MAX)
     bnb_filter = {"status": "active", "type": "bnb", "favourite": True}
-    bnb_farmhouses = get_approved_properties_by_type(bnb_filter)
+    bnb_farmhouses = get_approved_properties_by_type(bnb_filter, view=view, page_size=PAGE_SIZE_MAX)
 
     return {
-        'top_farmhouse': favourite_farmhouses,
-        'top_bnb': bnb_farmhouses
+        'top_farmhouse': favourite_farmhouses["items"],
+        'top_bnb': bnb_farmhouses["items"]
     }
 
 
@@ -1074,13 +1226,7 @@ def toggle_wishlist(email, farmhouse_id):
 
 @handle_exceptions
 def create_lead(email, name=None, mobile_number=None):
-    existing_lead = db_find_one("leads", {"email": email})
-    
-    if existing_lead:
-        return True
-    
     lead_data = {
-        "email": email,
         "wishlist": []
     }
     
@@ -1090,7 +1236,7 @@ def create_lead(email, name=None, mobile_number=None):
     if mobile_number:
         lead_data["mobile_number"] = mobile_number
     
-    db_insert_one("leads", lead_data)
+    db_update_one("leads", {"email": email}, {"$setOnInsert": lead_data}, upsert=True)
     return True
 
 
@@ -1112,16 +1258,14 @@ def get_user_wishlist(email):
         "name": 1,
         "description": 1,
         "images": 1,
+        "image_variants": 1,
         "location": 1
     }
     
-    properties_list = db_find_many("farmhouses", query_filter, projection)
+    properties_list = find_listing_properties(query_filter, projection)
     
     processed_properties = []
     for property_data in properties_list:
-        farmhouse_id = property_data.get("_id")
-        analysis_data = db_find_one("farmhouse_analysis", {"farmhouse_id": farmhouse_id}, {"review_average": 1})
-        property_data["review_average"] = analysis_data.get("review_average", 0.0)
         processed_property = process_farmhouse_for_listing(property_data)
         processed_properties.append(processed_property)
     
@@ -4,6 +4,7 @@ from src.logics.admin_auth import admin_required
 from src.logics.admin_kpi_logic import get_admin_dashboard_kpis
 from src.utils.exception_handler import handle_route_exceptions, AppException
 from src.logics.property_edit_logic import update_property_field
+from src.logics.ops_metrics_logic import get_ops_metrics
 
 
 admin_bp = Blueprint('admin', __name__)
@@ -76,13 +77,13 @@ def auto_login():
 @admin_required
 @handle_route_exceptions
 def get_pending_properties_route():
-    pending_properties = get_pending_properties()
+    page_size = request.args.get('pageSize')
+    page_token = request.args.get('pageToken')
+    pending_page = get_pending_properties(page_size, page_token)
     
     response_data = {
         "success": True,
-        "backend_data": {
-            "properties": pending_properties,
-        }
+        "backend_data": pending_page
     }
     
     return jsonify(response_data), 200
@@ -246,14 +247,14 @@ def reject_comment_route(review_id):
 @admin_required
 @handle_route_exceptions
 def get_all_properties_route():
-    all_properties = get_all_properties()
+    page_size = request.args.get('pageSize')
+    page_token = request.args.get('pageToken')
+    status_filter = request.args.get('status')
+    properties_page = get_all_properties(page_size, page_token, status_filter)
     
     response_data = {
         "success": True,
-        "backend_data": {
-            "properties": all_properties,
-            "total_count": len(all_properties)
-        }
+        "backend_data": properties_page
     }
 
     return jsonify(response_data), 200
@@ -273,6 +274,20 @@ def get_admin_kpis_route():
     return jsonify(response_data), 200
 
 
+@admin_bp.route('/ops_metrics', methods=['GET'])
+@admin_required
+@handle_route_exceptions
+def get_ops_metrics_route():
+    ops_metrics = get_ops_metrics()
+    
+    response_data = {
+        "success": True,
+        "backend_data": ops_metrics
+    }
+    
+    return jsonify(response_data), 200
+
+
 @admin_bp.route('/edit_property_field/<property_id>', methods=['PUT'])
 @admin_required
 @handle_route_exceptions
@@ -37,7 +37,7 @@ def ai_search():
     final_query = build_search_query(query_text, property_type)
     if not final_query:
         raise AppException('Search query is required')
-    search_result = search_properties(final_query)
+    search_result = search_properties(final_query, property_type)
 
     if (min_people > 0 or min_children > 0 or min_pets > 0) and 'properties' in search_result:
         for prop in search_result['properties']:
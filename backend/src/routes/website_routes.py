@@ -22,13 +22,19 @@ def list_farmhouses():
     
     search_latitude = data.get('searchLatitude')
     search_longitude = data.get('searchLongitude')
+    listing_view = data.get('view')
+    page_size = data.get('pageSize')
+    page_token = data.get('pageToken')
+    amenities = data.get('amenities')
     
     total_people = number_of_adults if number_of_adults is not None else number_of_people
-    farmhouses_data = get_approved_farmhouses(total_people, number_of_children, number_of_pets, search_latitude, search_longitude, MAX_SEARCH_DISTANCE_KM, check_in_date, check_out_date)
+    farmhouses_page = get_approved_farmhouses(total_people, number_of_children, number_of_pets, search_latitude, search_longitude, MAX_SEARCH_DISTANCE_KM, check_in_date, check_out_date, listing_view, page_size, page_token, amenities)
     
     response_data = {
         "success": True,
-        "backend_data": farmhouses_data,
+        "backend_data": farmhouses_page["items"],
+        "next_page_token": farmhouses_page["next_page_token"],
+        **build_listing_view_metadata(listing_view)
     }
     
     return jsonify(response_data)
@@ -48,13 +54,19 @@ def list_bnbs():
     
     search_latitude = data.get('searchLatitude')
     search_longitude = data.get('searchLongitude')
+    listing_view = data.get('view')
+    page_size = data.get('pageSize')
+    page_token = data.get('pageToken')
+    amenities = data.get('amenities')
     
     total_people = number_of_adults if number_of_adults is not None else number_of_people
-    bnbs_data = get_approved_bnbs(total_people, number_of_children, number_of_pets, search_latitude, search_longitude, MAX_SEARCH_DISTANCE_KM, check_in_date, check_out_date)
+    bnbs_page = get_approved_bnbs(total_people, number_of_children, number_of_pets, search_latitude, search_longitude, MAX_SEARCH_DISTANCE_KM, check_in_date, check_out_date, listing_view, page_size, page_token, amenities)
     
     response_data = {
         "success": True,
-        "backend_data": bnbs_data,
+        "backend_data": bnbs_page["items"],
+        "next_page_token": bnbs_page["next_page_token"],
+        **build_listing_view_metadata(listing_view)
     }
     
     return jsonify(response_data)
@@ -73,13 +85,36 @@ def list_properties():
     
     search_latitude = data.get('searchLatitude')
     search_longitude = data.get('searchLongitude')
+    listing_view = data.get('view')
+    page_size = data.get('pageSize')
+    page_token = data.get('pageToken')
+    amenities = data.get('amenities')
     
     total_people = number_of_adults if number_of_adults is not None else number_of_people
-    properties_data = get_all_approved_properties(total_people, number_of_children, number_of_pets, search_latitude, search_longitude, MAX_SEARCH_DISTANCE_KM, check_in_date, check_out_date)
+    properties_page = get_all_approved_properties(total_people, number_of_children, number_of_pets, search_latitude, search_longitude, MAX_SEARCH_DISTANCE_KM, check_in_date, check_out_date, listing_view, page_size, page_token, amenities)
     
     response_data = {
         "success": True,
-        "backend_data": properties_data,
+        "backend_data": properties_page["items"],
+        "next_page_token": properties_page["next_page_token"],
+        **build_listing_view_metadata(listing_view)
+    }
+    
+    return jsonify(response_data)
+
+
+@website_bp.route('/amenity-facets', methods=['POST'])
+@handle_route_exceptions
+def list_amenity_facets():
+    data = request.get_json() or {}
+    property_type = data.get('type')
+    amenities = data.get('amenities')
+    
+    amenity_facets = get_amenity_facets(property_type, amenities)
+    
+    response_data = {
+        "success": True,
+        "backend_data": amenity_facets
     }
     
     return jsonify(response_data)
@@ -431,11 +466,13 @@ def contact_via_whatsapp(farmhouse_id):
 @website_bp.route('/top-properties', methods=['GET'])
 @handle_route_exceptions
 def get_top_properties():
-    top_properties_data = get_fav_properties()
+    listing_view = request.args.get('view')
+    top_properties_data = get_fav_properties(listing_view)
     
     response_data = {
         "success": True,
-        "backend_data": top_properties_data
+        "backend_data": top_properties_data,
+        **build_listing_view_metadata(listing_view)
     }
     
     return jsonify(response_data), 200
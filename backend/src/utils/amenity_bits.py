@@ -0,0 +1,83 @@
+AMENITY_BITS_FIELD = "amenity_bits"
+
+AMENITY_BIT_ORDER = (
+    "air_conditioning", "wifi_internet", "power_backup", "parking",
+    "refrigerator", "microwave", "cooking_basics", "drinking_water",
+    "washing_machine", "iron", "geyser_hot_water", "television",
+    "smart_tv_ott", "wardrobe", "extra_mattress_bedding", "cleaning_supplies",
+    "bed_linens", "towels", "toiletries", "mirror", "hair_dryer", "attached_bathrooms", "bathtub",
+    "private_lawn_garden", "swimming_pool", "outdoor_seating_area",
+    "bonfire_setup", "barbecue_setup", "terrace_balcony",
+    "kitchen_access_self_cooking", "in_house_meals_available", "dining_table",
+    "indoor_games", "outdoor_games", "pool_table", "music_system",
+    "board_games", "bicycle_access", "movie_projector",
+    "jacuzzi", "private_bar_setup", "farm_view_nature_view",
+    "open_shower_outdoor_bath", "gazebo_cabana_seating", "hammock",
+    "high_tea_setup", "event_space_small_gatherings", "private_chef_on_request",
+    "pet_friendly", "child_friendly", "kids_play_area", "fenced_property",
+    "cctv_cameras", "first_aid_kit", "fire_extinguisher",
+    "security_guard", "private_gate_compound_wall",
+    "daily_cleaning_available", "long_stays_allowed",
+    "early_check_in_late_check_out", "staff_quarters_available", "caretaker_on_site"
+)
+AMENITY_BIT_POSITIONS = {amenity_name: position for position, amenity_name in enumerate(AMENITY_BIT_ORDER)}
+AMENITY_BITS_BYTES = (len(AMENITY_BIT_ORDER) + 7) // 8
+
+
+def encode_amenity_mask(amenities_data):
+    amenity_mask = 0
+    for category_data in (amenities_data or {}).values():
+        for amenity_name, amenity_value in (category_data or {}).items():
+            position = AMENITY_BIT_POSITIONS.get(amenity_name)
+            if position is not None and amenity_value is True:
+                amenity_mask |= 1 << position
+    return amenity_mask
+
+
+def mask_to_binary(amenity_mask):
+    amenity_binary = amenity_mask.to_bytes(AMENITY_BITS_BYTES, "little")
+    return amenity_binary
+
+
+def binary_to_mask(amenity_binary):
+    amenity_mask = int.from_bytes(bytes(amenity_binary or b""), "little")
+    return amenity_mask
+
+
+def encode_amenity_bits(amenities_data):
+    amenity_binary = mask_to_binary(encode_amenity_mask(amenities_data))
+    return amenity_binary
+
+
+def find_unknown_amenities(amenity_names):
+    unknown_amenities = [str(amenity_name) for amenity_name in amenity_names if not isinstance(amenity_name, str) or amenity_name not in AMENITY_BIT_POSITIONS]
+    return unknown_amenities
+
+
+def build_required_mask(amenity_names):
+    required_mask = 0
+    for amenity_name in amenity_names or []:
+        required_mask |= 1 << AMENITY_BIT_POSITIONS[amenity_name]
+    return required_mask
+
+
+def build_amenity_filter(required_mask):
+    if not required_mask:
+        return {}
+
+    amenity_filter = {AMENITY_BITS_FIELD: {"$bitsAllSet": mask_to_binary(required_mask)}}
+    return amenity_filter
+
+
+def count_set_bits(value):
+    set_bits = bin(value).count("1")
+    return set_bits
+
+
+def list_set_positions(value):
+    set_positions = []
+    while value:
+        lowest_bit = value & -value
+        set_positions.append(lowest_bit.bit_length() - 1)
+        value ^= lowest_bit
+    return set_positions
@@ -0,0 +1,75 @@
+import calendar
+from datetime import datetime, timedelta
+
+BOOKED_DAYS_FIELD = "booked_days"
+MONTH_KEY_FORMAT = "%Y-%m"
+ALL_DAYS_MASK = (1 << 31) - 1
+
+
+def build_day_range_mask(first_day, last_day):
+    day_range_mask = ((1 << last_day) - 1) ^ ((1 << (first_day - 1)) - 1)
+    return day_range_mask
+
+
+def build_month_masks(start_date, end_date):
+    month_masks = {}
+    current_date = start_date.date() if isinstance(start_date, datetime) else start_date
+    last_date = end_date.date() if isinstance(end_date, datetime) else end_date
+
+    while current_date <= last_date:
+        month_last_day = calendar.monthrange(current_date.year, current_date.month)[1]
+        segment_end = min(last_date, current_date.replace(day=month_last_day))
+        month_key = current_date.strftime(MONTH_KEY_FORMAT)
+        month_masks[month_key] = build_day_range_mask(current_date.day, segment_end.day)
+        current_date = segment_end + timedelta(days=1)
+
+    return month_masks
+
+
+def encode_booked_dates(date_strings):
+    month_masks = {}
+    for date_string in date_strings or []:
+        booked_date = datetime.strptime(date_string, "%Y-%m-%d")
+        month_key = booked_date.strftime(MONTH_KEY_FORMAT)
+        month_masks[month_key] = month_masks.get(month_key, 0) | (1 << (booked_date.day - 1))
+    return month_masks
+
+
+def decode_booked_days(booked_days):
+    booked_dates = []
+    for month_key in sorted(booked_days or {}):
+        month_bits = booked_days[month_key]
+        for day_index in range(31):
+            if month_bits & (1 << day_index):
+                booked_dates.append(f"{month_key}-{day_index + 1:02d}")
+    return booked_dates
+
+
+def is_range_available(booked_days, month_masks):
+    booked_days = booked_days or {}
+    range_available = all(not booked_days.get(month_key, 0) & mask for month_key, mask in month_masks.items())
+    return range_available
+
+
+def build_available_range_filter(month_masks):
+    range_filter = {
+        f"{BOOKED_DAYS_FIELD}.{month_key}": {"$not": {"$bitsAnySet": mask}}
+        for month_key, mask in month_masks.items()
+    }
+    return range_filter
+
+
+def build_book_days_update(month_masks):
+    booking_update = {"$bit": {
+        f"{BOOKED_DAYS_FIELD}.{month_key}": {"or": mask}
+        for month_key, mask in month_masks.items()
+    }}
+    return booking_update
+
+
+def build_unbook_days_update(month_masks):
+    unbooking_update = {"$bit": {
+        f"{BOOKED_DAYS_FIELD}.{month_key}": {"and": ALL_DAYS_MASK ^ mask}
+        for month_key, mask in month_masks.items()
+    }}
+    return unbooking_update
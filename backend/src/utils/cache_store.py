@@ -0,0 +1,81 @@
+import threading
+import time
+from collections import OrderedDict
+
+cache_registry = {}
+cache_registry_lock = threading.Lock()
+
+
+def create_cache(cache_name, max_entries, ttl_seconds):
+    with cache_registry_lock:
+        if cache_name not in cache_registry:
+            cache_registry[cache_name] = {
+                "entries": OrderedDict(),
+                "max_entries": max_entries,
+                "ttl_seconds": ttl_seconds,
+                "lock": threading.Lock(),
+                "hits": 0,
+                "misses": 0,
+                "evictions": 0,
+                "invalidations": 0
+            }
+    return True
+
+
+def cache_get(cache_name, cache_key):
+    cache = cache_registry[cache_name]
+    with cache["lock"]:
+        entry = cache["entries"].get(cache_key)
+        if entry is None or entry["expires_at"] <= time.monotonic():
+            cache["entries"].pop(cache_key, None)
+            cache["misses"] += 1
+            return None
+
+        cache["entries"].move_to_end(cache_key)
+        cache["hits"] += 1
+        cached_value = entry["value"]
+    return cached_value
+
+
+def cache_set(cache_name, cache_key, value):
+    cache = cache_registry[cache_name]
+    expires_at = time.monotonic() + cache["ttl_seconds"]
+    with cache["lock"]:
+        cache["entries"][cache_key] = {"value": value, "expires_at": expires_at}
+        cache["entries"].move_to_end(cache_key)
+        while len(cache["entries"]) > cache["max_entries"]:
+            cache["entries"].popitem(last=False)
+            cache["evictions"] += 1
+    return True
+
+
+def cache_delete(cache_name, cache_key):
+    cache = cache_registry[cache_name]
+    with cache["lock"]:
+        removed_entry = cache["entries"].pop(cache_key, None)
+    return removed_entry is not None
+
+
+def cache_clear(cache_name):
+    cache = cache_registry[cache_name]
+    with cache["lock"]:
+        cache["entries"].clear()
+        cache["invalidations"] += 1
+    return True
+
+
+def cache_stats(cache_name):
+    cache = cache_registry[cache_name]
+    with cache["lock"]:
+        lookups = cache["hits"] + cache["misses"]
+        stats = {
+            "entries": len(cache["entries"]),
+            "max_entries": cache["max_entries"],
+            "ttl_seconds": cache["ttl_seconds"],
+            "hits": cache["hits"],
+            "misses": cache["misses"],
+            "hit_ratio": round(cache["hits"] / lookups, 4) if lookups else 0.0,
+            "evictions": cache["evictions"],
+            "invalidations": cache["invalidations"]
+        }
+    return stats
@@ -0,0 +1,108 @@
+import threading
+import time
+from contextlib import contextmanager
+import boto3
+from botocore.config import Config
+from ..config import R2_ENDPOINT_URL, R2_ACCESS_KEY_ID, R2_SECRET_ACCESS_KEY
+
+R2_MAX_POOL_CONNECTIONS = 20
+R2_MAX_RETRIES = 3
+R2_CONNECT_TIMEOUT_SECONDS = 5
+R2_READ_TIMEOUT_SECONDS = 60
+
+client_lock = threading.Lock()
+metrics_lock = threading.Lock()
+
+client_state = {
+    "client": None,
+    "created_at": None
+}
+
+operation_metrics = {}
+
+
+def build_r2_client_config():
+    client_config = Config(
+        max_pool_connections=R2_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        connect_timeout=R2_CONNECT_TIMEOUT_SECONDS,
+        read_timeout=R2_READ_TIMEOUT_SECONDS,
+        retries={"max_attempts": R2_MAX_RETRIES, "mode": "standard"}
+    )
+    return client_config
+
+
+def get_r2_client():
+    r2_client = client_state["client"]
+    if r2_client:
+        return r2_client
+
+    with client_lock:
+        if not client_state["client"]:
+            session = boto3.session.Session()
+            client_state["client"] = session.client(
+                "s3",
+                endpoint_url=R2_ENDPOINT_URL,
+                aws_access_key_id=R2_ACCESS_KEY_ID,
+                aws_secret_access_key=R2_SECRET_ACCESS_KEY,
+                config=build_r2_client_config()
+            )
+            client_state["created_at"] = time.time()
+        r2_client = client_state["client"]
+    return r2_client
+
+
+def reset_r2_client():
+    with client_lock:
+        client_state["client"] = None
+        client_state["created_at"] = None
+    return True
+
+
+def record_operation(operation_name, elapsed_ms, failed):
+    with metrics_lock:
+        metrics = operation_metrics.setdefault(operation_name, {
+            "count": 0,
+            "errors": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0
+        })
+        metrics["count"] += 1
+        metrics["errors"] += 1 if failed else 0
+        metrics["total_ms"] += elapsed_ms
+        metrics["max_ms"] = max(metrics["max_ms"], elapsed_ms)
+    return True
+
+
+@contextmanager
+def timed_r2_operation(operation_name):
+    started_at = time.perf_counter()
+    failed = False
+    try:
+        yield
+    except Exception:
+        failed = True
+        raise
+    finally:
+        record_operation(operation_name, (time.perf_counter() - started_at) * 1000, failed)
+
+
+def get_r2_metrics():
+    with metrics_lock:
+        operations = {
+            operation_name: {
+                "count": metrics["count"],
+                "errors": metrics["errors"],
+                "avg_ms": round(metrics["total_ms"] / metrics["count"], 2) if metrics["count"] else 0.0,
+                "max_ms": round(metrics["max_ms"], 2)
+            }
+            for operation_name, metrics in operation_metrics.items()
+        }
+
+    r2_metrics = {
+        "client_initialised": client_state["client"] is not None,
+        "max_pool_connections": R2_MAX_POOL_CONNECTIONS,
+        "max_retries": R2_MAX_RETRIES,
+        "operations": operations
+    }
+    return r2_metrics
@@ -0,0 +1,30 @@
+import contextvars
+from pymongo import monitoring
+
+db_round_trips = contextvars.ContextVar("db_round_trips", default=0)
+
+
+class DbRoundTripListener(monitoring.CommandListener):
+    def started(self, event):
+        db_round_trips.set(db_round_trips.get() + 1)
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def reset_db_round_trips():
+    db_round_trips.set(0)
+    return None
+
+
+def get_db_round_trips():
+    round_trips = db_round_trips.get()
+    return round_trips
+
+
+def attach_db_round_trips_header(response):
+    response.headers["X-DB-Round-Trips"] = str(get_db_round_trips())
+    return response
@@ -1,7 +1,13 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
+from datetime import datetime
 from pytz import timezone
+from ..config import AI_SEARCH_MODE
 from ..logics.farmhouse_analysis_aggregation import run_monthly_aggregation
+from ..logics.admin_kpi_snapshot_logic import ADMIN_KPI_RECONCILE_INTERVAL_MINUTES, reconcile_admin_kpi_snapshot
+from ..logics.vector_reindex_queue import VECTOR_REINDEX_INTERVAL_SECONDS, process_vector_reindex_queue
+from ..logics.catalogue_events import CATALOGUE_SYNC_INTERVAL_SECONDS, sync_catalogue_changes
 
 
 def get_ist_timezone():
@@ -33,8 +39,72 @@ def add_monthly_job(scheduler):
     return True
 
 
+def add_kpi_reconcile_job(scheduler):
+    scheduler.add_job(
+        reconcile_admin_kpi_snapshot,
+        trigger=IntervalTrigger(minutes=ADMIN_KPI_RECONCILE_INTERVAL_MINUTES),
+        id='admin_kpi_reconcile',
+        next_run_time=datetime.now(),
+        name='Reconcile admin KPI snapshot',
+        replace_existing=True
+    )
+    
+    return True
+
+
+def add_vector_reindex_job(scheduler):
+    scheduler.add_job(
+        process_vector_reindex_queue,
+        trigger=IntervalTrigger(seconds=VECTOR_REINDEX_INTERVAL_SECONDS),
+        id='vector_reindex_queue',
+        name='Re-index edited properties in the vector store',
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
+    
+    return True
+
+
+def add_embedding_sync_job(scheduler):
+    if AI_SEARCH_MODE != "local":
+        return False
+    
+    from ..logics.embedding_index import LOCAL_EMBEDDING_SYNC_INTERVAL_SECONDS, sync_embedding_index
+    scheduler.add_job(
+        sync_embedding_index,
+        trigger=IntervalTrigger(seconds=LOCAL_EMBEDDING_SYNC_INTERVAL_SECONDS),
+        id='embedding_index_sync',
+        name='Sync the local embedding index with the catalogue',
+        next_run_time=datetime.now(),
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
+    
+    return True
+
+
+def add_catalogue_sync_job(scheduler):
+    scheduler.add_job(
+        sync_catalogue_changes,
+        trigger=IntervalTrigger(seconds=CATALOGUE_SYNC_INTERVAL_SECONDS),
+        id='catalogue_sync',
+        name='Apply catalogue changes made by other workers',
+        max_instances=1,
+        coalesce=True,
+        replace_existing=True
+    )
+    
+    return True
+
+
 def start_scheduler():
     scheduler = create_scheduler()
     add_monthly_job(scheduler)
+    add_kpi_reconcile_job(scheduler)
+    add_vector_reindex_job(scheduler)
+    add_embedding_sync_job(scheduler)
+    add_catalogue_sync_job(scheduler)
     scheduler.start()
     return True
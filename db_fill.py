@@ -294,18 +294,19 @@ def generate_operating_hours():
     return opening_time, closing_time
 
 
-def generate_random_booked_dates():
-    """Generate some random booked dates for testing"""
-    booked_dates = []
+def generate_random_booked_days():
+    """Generate some random booked days for testing, as YYYY-MM day bitmaps"""
+    booked_days = {}
     
     if random.random() < 0.7:
         num_bookings = random.randint(2, 5)
         for _ in range(num_bookings):
             days_ahead = random.randint(1, 60)
             booked_date = datetime.now() + timedelta(days=days_ahead)
-            booked_dates.append(booked_date.strftime('%Y-%m-%d'))
+            month_key = booked_date.strftime('%Y-%m')
+            booked_days[month_key] = booked_days.get(month_key, 0) | (1 << (booked_date.day - 1))
     
-    return booked_dates
+    return booked_days
 
 
 def generate_farmhouse_data():
@@ -321,7 +322,7 @@ def generate_farmhouse_data():
     owner_details = generate_owner_details()
     opening_time, closing_time = generate_operating_hours()
     credit_balance = random.randint(500, 5000)
-    booked_dates = generate_random_booked_dates()
+    booked_days = generate_random_booked_days()
     current_time = datetime.now()
     
     farmhouse_data = {
@@ -332,7 +333,7 @@ def generate_farmhouse_data():
         "phone_number": phone_number,
         "location": location,
         "documents": documents,
-        "booked_dates": booked_dates,
+        "booked_days": booked_days,
         "images": images,
         "amenities": amenities,
         "reviews": reviews,
@@ -362,9 +363,12 @@ def generate_farmhouse_analytics(farmhouse_id):
         views = random.randint(1, 20)
         leads = random.randint(0, 5)
         daily_analytics.append({
+            "farmhouse_id": farmhouse_id,
             "date": date,
             "views": views,
-            "leads": leads
+            "leads": leads,
+            "created_at": current_time,
+            "updated_at": current_time
         })
     
     last_month = (current_time - timedelta(days=30)).strftime('%Y-%m')
@@ -381,14 +385,13 @@ def generate_farmhouse_analytics(farmhouse_id):
         "farmhouse_id": farmhouse_id,
         "total_views": total_views,
         "total_leads": total_leads,
-        "daily_analytics": daily_analytics,
         "last_month_summary": last_month_summary,
         "review_average": review_average,
         "created_at": current_time,
         "updated_at": current_time
     }
     
-    return analytics_data
+    return analytics_data, daily_analytics
 
 
 def populate_farmhouses_collection():
@@ -399,6 +402,7 @@ def populate_farmhouses_collection():
     
     farmhouses_data = []
     analytics_data = []
+    daily_analytics_data = []
     
     for i in range(20):
         farmhouse_data = generate_farmhouse_data()
@@ -409,11 +413,13 @@ def populate_farmhouses_collection():
     inserted_farmhouses = len(farmhouse_result.inserted_ids)
     
     for farmhouse_data in farmhouses_data:
-        analytics = generate_farmhouse_analytics(farmhouse_data["_id"])
+        analytics, daily_analytics = generate_farmhouse_analytics(farmhouse_data["_id"])
         analytics_data.append(analytics)
+        daily_analytics_data.extend(daily_analytics)
     
     analytics_result = farmhouse_analysis_collection.insert_many(analytics_data)
     inserted_analytics = len(analytics_result.inserted_ids)
+    db.farmhouse_daily_analytics.insert_many(daily_analytics_data)
     
     print(f"\nSuccessfully inserted {inserted_farmhouses} farmhouses into the database!")
     print(f"Successfully inserted {inserted_analytics} farmhouse analytics into the database!")
@@ -3,6 +3,12 @@ import { useNavigate } from 'react-router-dom'
 import { toast } from 'sonner'
 import { adminLogin, fetchPendingReviews, acceptReview, rejectReview, fetchPendingProperties, approveProperty, rejectProperty, fetchAdminPropertyDetails, fetchAllProperties, markPropertyAsFavourite, togglePropertyStatus, adminLogout, updatePropertyField } from '../services/adminApi'
 
+const fetchPropertyPage = async (fetchPage, pageToken = null) => {
+  const result = await fetchPage(pageToken)
+  const pageData = result.success ? result.backend_data : null
+  return {properties: pageData?.properties || [], nextPageToken: pageData?.next_page_token || null}
+}
+
 export const useAdminAuth = () => {
   const [isLoading, setIsLoading] = useState(false)
   const navigate = useNavigate()
@@ -117,17 +123,16 @@ export const usePendingProperties = () => {
   const [isLoading, setIsLoading] = useState(false)
   const [error, setError] = useState(null)
   const [actionLoading, setActionLoading] = useState(null)
+  const [nextPageToken, setNextPageToken] = useState(null)
+  const [isLoadingMore, setIsLoadingMore] = useState(false)
 
   const fetchProperties = async () => {
     setIsLoading(true)
     setError(null)
     try {
-      const result = await fetchPendingProperties()
-      if (result.success && result.backend_data?.properties) {
-        setPendingProperties(result.backend_data.properties)
-      } else {
-        setPendingProperties([])
-      }
+      const page = await fetchPropertyPage(fetchPendingProperties)
+      setPendingProperties(page.properties)
+      setNextPageToken(page.nextPageToken)
     } catch (error) {
       setError(error.message || 'Failed to fetch pending properties')
       toast.error(error.message || 'Failed to fetch pending properties')
@@ -136,6 +141,21 @@ export const usePendingProperties = () => {
     }
   }
 
+  const loadMoreProperties = async () => {
+    if (!nextPageToken) return
+
+    setIsLoadingMore(true)
+    try {
+      const page = await fetchPropertyPage(fetchPendingProperties, nextPageToken)
+      setPendingProperties(prevProperties => [...prevProperties, ...page.properties])
+      setNextPageToken(page.nextPageToken)
+    } catch (error) {
+      toast.error(error.message || 'Failed to load more properties')
+    } finally {
+      setIsLoadingMore(false)
+    }
+  }
+
   const handleApproveProperty = async (propertyId) => {
     setActionLoading(propertyId)
     try {
@@ -174,7 +194,7 @@ export const usePendingProperties = () => {
     fetchProperties()
   }, [])
 
-  return {pendingProperties, isLoading, error, actionLoading, refetch: fetchProperties, handleApproveProperty, handleRejectProperty}
+  return {pendingProperties, isLoading, error, actionLoading, refetch: fetchProperties, hasMore: Boolean(nextPageToken), isLoadingMore, loadMore: loadMoreProperties, handleApproveProperty, handleRejectProperty}
 }
 
 export const useAdminPropertyDetails = (propertyId) => {
@@ -225,22 +245,23 @@ export const useAdminPropertyDetails = (propertyId) => {
   return {propertyDetails, isLoading, error, refetch: fetchPropertyDetails, updateField}
 }
 
-export const useAllProperties = () => {
+export const useAllProperties = (status = null) => {
   const [allProperties, setAllProperties] = useState([])
   const [isLoading, setIsLoading] = useState(false)
   const [error, setError] = useState(null)
   const [actionLoading, setActionLoading] = useState(null)
+  const [nextPageToken, setNextPageToken] = useState(null)
+  const [isLoadingMore, setIsLoadingMore] = useState(false)
+
+  const fetchStatusPage = (pageToken) => fetchAllProperties(pageToken, status)
 
   const fetchProperties = async () => {
     setIsLoading(true)
     setError(null)
     try {
-      const result = await fetchAllProperties()
-      if (result.success && result.backend_data?.properties) {
-        setAllProperties(result.backend_data.properties)
-      } else {
-        setAllProperties([])
-      }
+      const page = await fetchPropertyPage(fetchStatusPage)
+      setAllProperties(page.properties)
+      setNextPageToken(page.nextPageToken)
     } catch (error) {
       setError(error.message || 'Failed to fetch all properties')
       toast.error(error.message || 'Failed to fetch all properties')
@@ -249,6 +270,21 @@ export const useAllProperties = () => {
     }
   }
 
+  const loadMoreProperties = async () => {
+    if (!nextPageToken) return
+
+    setIsLoadingMore(true)
+    try {
+      const page = await fetchPropertyPage(fetchStatusPage, nextPageToken)
+      setAllProperties(prevProperties => [...prevProperties, ...page.properties])
+      setNextPageToken(page.nextPageToken)
+    } catch (error) {
+      toast.error(error.message || 'Failed to load more properties')
+    } finally {
+      setIsLoadingMore(false)
+    }
+  }
+
   const handleToggleFavourite = async (propertyId, currentFavouriteStatus) => {
     setActionLoading(propertyId)
     try {
@@ -297,5 +333,5 @@ export const useAllProperties = () => {
     fetchProperties()
   }, [])
 
-  return {allProperties, isLoading, error, actionLoading, refetch: fetchProperties, handleToggleFavourite, handleToggleStatus}
+  return {allProperties, isLoading, error, actionLoading, refetch: fetchProperties, hasMore: Boolean(nextPageToken), isLoadingMore, loadMore: loadMoreProperties, handleToggleFavourite, handleToggleStatus}
 }
\ No newline at end of file
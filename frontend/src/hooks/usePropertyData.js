@@ -5,6 +5,8 @@ export const useFarmhouseList = (shouldFetch = false) => {
   const [farmhouses, setFarmhouses] = useState([])
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState(null)
+  const [nextPageToken, setNextPageToken] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
 
   const getSearchCriteria = () => {
     try {
@@ -23,10 +25,12 @@ export const useFarmhouseList = (shouldFetch = false) => {
       const response = await fetchFarmhouseList(searchCriteria)
       const farmhouseData = response.backend_data || []
       setFarmhouses(farmhouseData)
+      setNextPageToken(response.next_page_token || null)
     } catch (err) {
       const errorMessage = err.message || 'Failed to fetch farmhouses'
       setError(errorMessage)
       setFarmhouses([])
+      setNextPageToken(null)
     } finally {
       setLoading(false)
     }
@@ -38,13 +42,31 @@ export const useFarmhouseList = (shouldFetch = false) => {
     }
   }, [shouldFetch])
 
-  return { farmhouses, loading, error, refetch: loadFarmhouses }
+  const loadMoreFarmhouses = async () => {
+    if (!nextPageToken || loadingMore) {
+      return
+    }
+    try {
+      setLoadingMore(true)
+      const response = await fetchFarmhouseList(getSearchCriteria(), nextPageToken)
+      setFarmhouses(previous => [...previous, ...(response.backend_data || [])])
+      setNextPageToken(response.next_page_token || null)
+    } catch (err) {
+      setError(err.message || 'Failed to fetch farmhouses')
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
+  return { farmhouses, loading, error, refetch: loadFarmhouses, hasMore: Boolean(nextPageToken), loadingMore, loadMore: loadMoreFarmhouses }
 }
 
 export const useBnbList = (shouldFetch = false) => {
   const [bnbs, setBnbs] = useState([])
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState(null)
+  const [nextPageToken, setNextPageToken] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
 
   const getSearchCriteria = () => {
     try {
@@ -63,10 +85,12 @@ export const useBnbList = (shouldFetch = false) => {
       const response = await fetchBnbList(searchCriteria)
       const bnbData = response.backend_data || []
       setBnbs(bnbData)
+      setNextPageToken(response.next_page_token || null)
     } catch (err) {
       const errorMessage = err.message || 'Failed to fetch BnBs'
       setError(errorMessage)
       setBnbs([])
+      setNextPageToken(null)
     } finally {
       setLoading(false)
     }
@@ -78,13 +102,31 @@ export const useBnbList = (shouldFetch = false) => {
     }
   }, [shouldFetch])
 
-  return { bnbs, loading, error, refetch: loadBnbs }
+  const loadMoreBnbs = async () => {
+    if (!nextPageToken || loadingMore) {
+      return
+    }
+    try {
+      setLoadingMore(true)
+      const response = await fetchBnbList(getSearchCriteria(), nextPageToken)
+      setBnbs(previous => [...previous, ...(response.backend_data || [])])
+      setNextPageToken(response.next_page_token || null)
+    } catch (err) {
+      setError(err.message || 'Failed to fetch BnBs')
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
+  return { bnbs, loading, error, refetch: loadBnbs, hasMore: Boolean(nextPageToken), loadingMore, loadMore: loadMoreBnbs }
 }
 
 export const usePropertyList = (shouldFetch = false) => {
   const [properties, setProperties] = useState([])
   const [loading, setLoading] = useState(false)
   const [error, setError] = useState(null)
+  const [nextPageToken, setNextPageToken] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
 
   const getSearchCriteria = () => {
     try {
@@ -103,10 +145,12 @@ export const usePropertyList = (shouldFetch = false) => {
       const response = await fetchPropertyList(searchCriteria)
       const propertyData = response.backend_data || []
       setProperties(propertyData)
+      setNextPageToken(response.next_page_token || null)
     } catch (err) {
       const errorMessage = err.message || 'Failed to fetch properties'
       setError(errorMessage)
       setProperties([])
+      setNextPageToken(null)
     } finally {
       setLoading(false)
     }
@@ -118,7 +162,23 @@ export const usePropertyList = (shouldFetch = false) => {
     }
   }, [shouldFetch])
 
-  return { properties, loading, error, refetch: loadProperties }
+  const loadMoreProperties = async () => {
+    if (!nextPageToken || loadingMore) {
+      return
+    }
+    try {
+      setLoadingMore(true)
+      const response = await fetchPropertyList(getSearchCriteria(), nextPageToken)
+      setProperties(previous => [...previous, ...(response.backend_data || [])])
+      setNextPageToken(response.next_page_token || null)
+    } catch (err) {
+      setError(err.message || 'Failed to fetch properties')
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
+  return { properties, loading, error, refetch: loadProperties, hasMore: Boolean(nextPageToken), loadingMore, loadMore: loadMoreProperties }
 }
 
 export const useTopProperties = () => {
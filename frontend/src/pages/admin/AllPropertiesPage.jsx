@@ -1,7 +1,7 @@
 import { useAllProperties } from '../../hooks/useAdmin'
 
 function AllPropertiesPage({ onViewDetails }) {
-  const { allProperties, isLoading, error, actionLoading, refetch, handleToggleFavourite, handleToggleStatus } = useAllProperties()
+  const { allProperties, isLoading, error, actionLoading, refetch, hasMore, isLoadingMore, loadMore, handleToggleFavourite, handleToggleStatus } = useAllProperties('active,inactive')
 
   const renderLoadingState = () => (
     <div className="flex items-center justify-center min-h-[50vh] px-4">
@@ -132,17 +132,22 @@ function AllPropertiesPage({ onViewDetails }) {
     </div>
   )
 
-  const activeAndInactiveProperties = allProperties.filter(
-    property => property.status === 'active' || property.status === 'inactive'
+  const renderLoadMoreButton = () => (
+    <div className="flex justify-center pt-2">
+      <button onClick={loadMore} disabled={isLoadingMore} className="bg-blue-600 text-white px-4 py-2 rounded-md hover:bg-blue-700 transition-colors text-sm sm:text-base disabled:opacity-50">
+        {isLoadingMore ? 'Loading...' : 'Load more'}
+      </button>
+    </div>
   )
 
   if (isLoading) return renderLoadingState()
   if (error) return renderErrorState()
-  if (activeAndInactiveProperties.length === 0) return renderEmptyState()
+  if (allProperties.length === 0 && !hasMore) return renderEmptyState()
 
   return (
     <div className="grid gap-4">
-      {activeAndInactiveProperties.map(renderPropertyRow)}
+      {allProperties.map(renderPropertyRow)}
+      {hasMore && renderLoadMoreButton()}
     </div>
   )
 }
@@ -1,11 +1,7 @@
 import { useAllProperties } from '../../hooks/useAdmin'
 
 const IncompletePropertiesPage = ({ onViewDetails }) => {
-  const { allProperties, isLoading, error } = useAllProperties()
-
-  const incompleteProperties = allProperties.filter(
-    property => property.status === 'incomplete'
-  )
+  const { allProperties: incompleteProperties, isLoading, error, hasMore, isLoadingMore, loadMore } = useAllProperties('incomplete')
 
   const getStatusBadge = (status) => {
     const statusStyles = {
@@ -102,13 +98,22 @@ const IncompletePropertiesPage = ({ onViewDetails }) => {
     )
   }
 
+  const renderLoadMoreButton = () => (
+    <div className="flex justify-center pt-2">
+      <button onClick={loadMore} disabled={isLoadingMore} className="bg-green-600 text-white px-4 py-2 rounded-md hover:bg-green-700 transition-colors text-sm sm:text-base disabled:opacity-50">
+        {isLoadingMore ? 'Loading...' : 'Load more'}
+      </button>
+    </div>
+  )
+
   if (isLoading) return renderLoadingState()
   if (error) return renderErrorState()
-  if (incompleteProperties.length === 0) return renderEmptyState()
+  if (incompleteProperties.length === 0 && !hasMore) return renderEmptyState()
 
   return (
     <div className="grid gap-4">
       {incompleteProperties.map(renderPropertyRow)}
+      {hasMore && renderLoadMoreButton()}
     </div>
   )
 }
@@ -1,7 +1,7 @@
 import { usePendingProperties } from '../../hooks/useAdmin'
 
 function PendingPropertiesPage({ onViewDetails }) {
-  const { pendingProperties, isLoading, error, actionLoading, refetch, handleApproveProperty, handleRejectProperty } = usePendingProperties()
+  const { pendingProperties, isLoading, error, actionLoading, refetch, hasMore, isLoadingMore, loadMore, handleApproveProperty, handleRejectProperty } = usePendingProperties()
 
   const renderLoadingState = () => (
     <div className="flex items-center justify-center min-h-[50vh] px-4">
@@ -112,13 +112,22 @@ function PendingPropertiesPage({ onViewDetails }) {
     </div>
   )
 
+  const renderLoadMoreButton = () => (
+    <div className="flex justify-center pt-2">
+      <button onClick={loadMore} disabled={isLoadingMore} className="bg-blue-600 text-white px-4 py-2 rounded-md hover:bg-blue-700 transition-colors text-sm sm:text-base disabled:opacity-50">
+        {isLoadingMore ? 'Loading...' : 'Load more'}
+      </button>
+    </div>
+  )
+
   if (isLoading) return renderLoadingState()
   if (error) return renderErrorState()
-  if (pendingProperties.length === 0) return renderEmptyState()
+  if (pendingProperties.length === 0 && !hasMore) return renderEmptyState()
 
   return (
     <div className="grid gap-4">
       {pendingProperties.map(renderPropertyRow)}
+      {hasMore && renderLoadMoreButton()}
     </div>
   )
 }
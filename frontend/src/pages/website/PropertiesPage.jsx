@@ -114,14 +114,21 @@ function PropertiesPage({ propertyType = 'both' } = {}) {
   const navigate = useNavigate()
   const { handleLeadInfo, getLeadInfo } = useLeadRegistration()
   const [showVisitorPopup, setShowVisitorPopup] = useState(false)
-  const { farmhouses, loading: farmhouseLoading, error: farmhouseError } = useFarmhouseList(propertyType === 'farmhouse')
-  const { bnbs, loading: bnbLoading, error: bnbError } = useBnbList(propertyType === 'bnb')
-  const { properties: bothProperties, loading: bothLoading, error: bothError } = usePropertyList(propertyType === 'both')
+  const farmhouseList = useFarmhouseList(propertyType === 'farmhouse')
+  const bnbList = useBnbList(propertyType === 'bnb')
+  const bothList = usePropertyList(propertyType === 'both')
+  const { farmhouses, loading: farmhouseLoading, error: farmhouseError } = farmhouseList
+  const { bnbs, loading: bnbLoading, error: bnbError } = bnbList
+  const { properties: bothProperties, loading: bothLoading, error: bothError } = bothList
 
   const properties = propertyType === 'farmhouse' ? farmhouses 
                    : propertyType === 'bnb' ? bnbs 
                    : bothProperties
 
+  const activeList = propertyType === 'farmhouse' ? farmhouseList
+                   : propertyType === 'bnb' ? bnbList
+                   : bothList
+
   const loading = propertyType === 'farmhouse' ? farmhouseLoading
                 : propertyType === 'bnb' ? bnbLoading
                 : bothLoading
@@ -230,15 +237,28 @@ function PropertiesPage({ propertyType = 'both' } = {}) {
   )
 
   const renderPropertiesGrid = () => (
-    <div className="flex gap-6 justify-center flex-wrap">
-      {properties.map(property => (
-        <FarmhouseCard 
-          key={property._id} 
-          property={property} 
-          onClick={(propertyId) => navigate(`/property/${propertyId}`)}
-        />
-      ))}
-    </div>
+    <>
+      <div className="flex gap-6 justify-center flex-wrap">
+        {properties.map(property => (
+          <FarmhouseCard 
+            key={property._id} 
+            property={property} 
+            onClick={(propertyId) => navigate(`/property/${propertyId}`)}
+          />
+        ))}
+      </div>
+      {activeList.hasMore && (
+        <div className="flex justify-center mt-8">
+          <button 
+            onClick={activeList.loadMore}
+            disabled={activeList.loadingMore}
+            className="bg-gray-900 hover:bg-gray-800 disabled:opacity-60 text-white px-6 py-3 rounded-lg font-medium transition-colors"
+          >
+            {activeList.loadingMore ? 'Loading...' : 'Load more'}
+          </button>
+        </div>
+      )}
+    </>
   )
 
   const renderPropertiesContent = () => {
@@ -39,9 +39,10 @@ export const updatePropertyField = async (propertyId, fieldData) => {
   }
 }
 
-export const fetchPendingProperties = async () => {
+export const fetchPendingProperties = async (pageToken = null) => {
   try {
-    const response = await adminApiClient.get('/pending_properties')
+    const params = pageToken ? { pageToken } : {}
+    const response = await adminApiClient.get('/pending_properties', { params })
     const result = response.data
     return result
   } catch (error) {
@@ -53,9 +54,10 @@ export const fetchPendingProperties = async () => {
   }
 }
 
-export const fetchAllProperties = async () => {
+export const fetchAllProperties = async (pageToken = null, status = null) => {
   try {
-    const response = await adminApiClient.get('/admin_all_properties')
+    const params = { ...(pageToken && { pageToken }), ...(status && { status }) }
+    const response = await adminApiClient.get('/admin_all_properties', { params })
     const result = response.data
     return result
   } catch (error) {
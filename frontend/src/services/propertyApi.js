@@ -10,10 +10,14 @@ const apiClient = axios.create({
   },
 })
 
-export const fetchFarmhouseList = async (searchCriteria = null) => {
+export const fetchFarmhouseList = async (searchCriteria = null, pageToken = null) => {
   try {
     const requestData = {}
     
+    if (pageToken) {
+      requestData.pageToken = pageToken
+    }
+    
     if (searchCriteria) {
       requestData.checkInDate = searchCriteria.checkInDate
       requestData.checkOutDate = searchCriteria.checkOutDate
@@ -38,10 +42,14 @@ export const fetchFarmhouseList = async (searchCriteria = null) => {
   }
 }
 
-export const fetchBnbList = async (searchCriteria = null) => {
+export const fetchBnbList = async (searchCriteria = null, pageToken = null) => {
   try {
     const requestData = {}
     
+    if (pageToken) {
+      requestData.pageToken = pageToken
+    }
+    
     if (searchCriteria) {
       requestData.checkInDate = searchCriteria.checkInDate
       requestData.checkOutDate = searchCriteria.checkOutDate
@@ -66,10 +74,14 @@ export const fetchBnbList = async (searchCriteria = null) => {
   }
 }
 
-export const fetchPropertyList = async (searchCriteria = null) => {
+export const fetchPropertyList = async (searchCriteria = null, pageToken = null) => {
   try {
     const requestData = {}
     
+    if (pageToken) {
+      requestData.pageToken = pageToken
+    }
+    
     if (searchCriteria) {
       requestData.checkInDate = searchCriteria.checkInDate
       requestData.checkOutDate = searchCriteria.checkOutDate